@@ -1,69 +1,136 @@
 import numpy as np
+import pandas as pd
 from config import G0
 from util import ambient_pressure
 
 # universal gas constant
 R_univ = 8.31446261815324  # J/(mol·K)
 
-def compute_system(df):
+# System assumptions
+VEHICLE_MASS    = 1000.0    # vehicle mass [kg]
+PROPELLANT_MASS = 100.0     # propellant mass [kg]
+INITIAL_MASS    = 200.0     # initial mass for Δv calc [kg]
+ALT_MAX         = 10000.0   # top of the altitude sweep [m]
+N_ALTS          = 20        # points of the altitude sweep
+
+def _column(df, key, default):
+    """Return df[key] as a float array, default where the column is absent or NaN."""
+    if key not in df:
+        return np.full(len(df), default)
+    vals = df[key].to_numpy(dtype=float)
+    return np.where(np.isnan(vals), default, vals)
+
+def exit_area_ratio(df):
     """
-    Compute nozzle/system parameters from the DataFrame.
-    Returns a dict with keys:
-      'best', 'At', 'Ae', 'alts', 'Fs', 'mdot', 'dv', 'tb'
+    Exit A_e/A* of every row of df: the exit-station AeAt_exit of the
+    full-property parse, else the 'Expansion Ratio' column (CEA's throat
+    value, 1.0 on real output, or a value entered by the user).
     """
-    # 1) Best‐Isp row
-    best = df.loc[df["Isp (s)"].idxmax()]
-
-    # 2) Extract core parameters
-    Isp_s = best["Isp (s)"]               # Isp in seconds
-    Pc    = best["Pc (bar)"] * 1e5        # chamber pressure in Pa
-    Tch   = best["T_chamber (K)"]         # chamber temperature in K
-    ar    = best["Expansion Ratio"]       # A_e/A*
-    if ar is None:
-        raise ValueError("Expansion Ratio is missing")
+    fallback = (df["Expansion Ratio"].to_numpy(dtype=float) if "Expansion Ratio" in df
+                else np.full(len(df), np.nan))
+    return _column(df, "AeAt_exit", fallback)
 
-    # 3) System assumptions
-    mveh    = 1000.0    # vehicle mass [kg]
-    mprop   = 100.0     # propellant mass [kg]
-    m0      = 200.0     # initial mass for Δv calc [kg]
-    gamma   = 1.2       # specific heat ratio
-    MW      = 0.022     # molecular weight [kg/mol]
-    R       = R_univ / MW  # specific gas constant [J/(kg·K)]
+def compute_system_batch(df, alts=None):
+    """
+    Size the system for every row of df in one set of array operations.
+    alts defaults to N_ALTS points from 0 to ALT_MAX metres.
+    Returns a dict with keys:
+      'mdot', 'At', 'Ae', 'tb', 'dv' : float arrays (N,)
+      'area_ratio'                   : float array (N,), exit A_e/A* used
+      'alts'                         : float array (M,)
+      'Fs', 'Isps'                   : float arrays (N, M), thrust [N] and
+                                       delivered Isp [s] at each altitude
+    """
+    # 1) Core parameters, one entry per case
+    Isp_s = df["Isp (s)"].to_numpy(dtype=float)              # Isp in seconds
+    Pc    = df["Pc (bar)"].to_numpy(dtype=float) * 1e5       # chamber pressure in Pa
+    Tch   = df["T_chamber (K)"].to_numpy(dtype=float)        # chamber temperature in K
+    ar    = exit_area_ratio(df)                              # exit A_e/A*
+    # Throat gas properties when the full-property parse is available
+    gamma = _column(df, "Gamma_throat", 1.2)                 # specific heat ratio
+    MW    = _column(df, "MW_throat (g/mol)", 22.0) / 1e3     # molecular weight [kg/mol]
+    R     = R_univ / MW  # specific gas constant [J/(kg·K)]
 
-    # 4) Thrust & mass flow
-    F     = mveh * G0            # assume hover thrust [N]
+    # 2) Thrust & mass flow
+    F     = VEHICLE_MASS * G0    # assume hover thrust [N]
     mdot  = F / (Isp_s * G0)     # mass flow [kg/s]
 
-    # 5) Choked‐flow throat area A* from mdot equation:
+    # 3) Choked‐flow throat area A* from mdot equation:
     #    mdot = A* · Pc/√Tch · √(γ/R) · (2/(γ+1))^((γ+1)/(2(γ−1)))
     choke = (2.0/(gamma+1.0))**((gamma+1.0)/(2.0*(gamma-1.0)))
     At    = mdot * np.sqrt(Tch) / (Pc * np.sqrt(gamma/R) * choke)
 
-    # 6) Exit area
+    # 4) Exit area
     Ae = At * ar
 
-    # 7) Altitude sweep
-    alt_max = 10000.0  # meters
-    alts    = np.linspace(0, alt_max, 20)
-    Fs, Is  = [], []
-    for a in alts:
-        pa = ambient_pressure(a)
-        # nozzle thrust: mdot·Isp·g0 + pressure thrust
-        Fe = mdot * Isp_s * G0 + (Pc - pa) * Ae
-        Fs.append(Fe)
-        Is.append(Fe / (mdot * G0))
+    # 5) Altitude sweep broadcast as (cases, altitudes):
+    #    nozzle thrust = mdot·Isp·g0 + pressure thrust
+    if alts is None:
+        alts = np.linspace(0, ALT_MAX, N_ALTS)
+    alts = np.asarray(alts, dtype=float)
+    pa   = ambient_pressure(alts)
+    Fs   = (mdot * Isp_s * G0)[:, None] + (Pc[:, None] - pa[None, :]) * Ae[:, None]
+    Isps = Fs / (mdot * G0)[:, None]
 
-    # 8) Burn time and delta‐V
-    tb = mprop / mdot
-    dv = Isp_s * G0 * np.log(m0 / (m0 - mprop))
+    # 6) Burn time and delta‐V
+    tb = PROPELLANT_MASS / mdot
+    dv = Isp_s * G0 * np.log(INITIAL_MASS / (INITIAL_MASS - PROPELLANT_MASS))
 
     return {
-        "best": best,
         "At": At,
         "Ae": Ae,
+        "area_ratio": ar,
         "alts": alts,
         "Fs": Fs,
+        "Isps": Isps,
         "mdot": mdot,
         "dv": dv,
         "tb": tb
     }
+
+def compute_system(df):
+    """
+    Compute nozzle/system parameters from the DataFrame.
+    Returns a dict with keys:
+      'best', 'At', 'Ae', 'area_ratio', 'alts', 'Fs', 'mdot', 'dv', 'tb'
+    """
+    # Best‐Isp row, sized through the batch path
+    best = df.loc[df["Isp (s)"].idxmax()]
+    res = compute_system_batch(best.to_frame().T)
+    if np.isnan(res["area_ratio"][0]):
+        raise ValueError("Expansion Ratio is missing")
+
+    return {
+        "best": best,
+        "At": res["At"][0],
+        "Ae": res["Ae"][0],
+        "area_ratio": res["area_ratio"][0],
+        "alts": res["alts"],
+        "Fs": res["Fs"][0],
+        "mdot": res["mdot"][0],
+        "dv": res["dv"][0],
+        "tb": res["tb"][0]
+    }
+
+def system_table(df, res=None):
+    """
+    One row of system sizing per case of df: the case inputs, mass flow,
+    areas, burn time, Δv and thrust at both ends of the altitude sweep.
+    res is a precomputed `compute_system_batch(df)`.
+    """
+    if res is None:
+        res = compute_system_batch(df)
+    alts = res["alts"]
+    return pd.DataFrame({
+        "O/F":                        df["O/F"].to_numpy(),
+        "Pc (bar)":                   df["Pc (bar)"].to_numpy(),
+        "Isp (s)":                    df["Isp (s)"].to_numpy(),
+        "Expansion Ratio":            res["area_ratio"],
+        "mdot (kg/s)":                res["mdot"],
+        "At (m²)":                    res["At"],
+        "Ae (m²)":                    res["Ae"],
+        "Burn time (s)":              res["tb"],
+        "Δv (m/s)":                   res["dv"],
+        f"F @ {alts[0]:.0f} m (N)":   res["Fs"][:, 0],
+        f"F @ {alts[-1]:.0f} m (N)":  res["Fs"][:, -1],
+    })
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark the vectorised isentropic inversions against the scalar fsolve loop.
+
+With --check-gammas, instead build an `IsentropicTable` for every gamma of
+a dense grid and check its inversions against the exact solvers.
+
+Usage:
+    python benchmarks/bench_isentropic.py [--n 1000000] [--gamma 1.2]
+    python benchmarks/bench_isentropic.py --check-gammas [--gamma-step 1e-4]
+"""
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+from scipy.optimize import fsolve
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from isentropic import (area_ratio, prandtl_meyer, pressure_ratio,  # noqa: E402
+                        mach_from_area_ratio, inverse_prandtl_meyer,
+                        mach_from_pressure_ratio, IsentropicTable)
+
+
+def _scalar_mach_from_area_ratio(AR, gamma):
+    """The former per-element fsolve solve, kept as the reference."""
+    M, = fsolve(lambda M: area_ratio(M, gamma) - AR, 2.0)
+    return M
+
+
+def check_gammas(step, tol=1e-6):
+    """Build a table for every gamma in [1.05, 1.67] and check its inversions."""
+    gammas = np.arange(1.05, 1.67 + step / 2, step)
+    M_sub, M_sup = np.linspace(0.05, 0.999, 200), np.linspace(1.001, 8.0, 200)
+    failed = []
+    for g in gammas:
+        try:
+            table = IsentropicTable(g)
+            err = max(np.max(np.abs(table.mach_from_area_ratio(area_ratio(M_sup, g)) - M_sup)),
+                      np.max(np.abs(table.mach_from_area_ratio(area_ratio(M_sub, g),
+                                                               supersonic=False) - M_sub)),
+                      np.max(np.abs(table.inverse_prandtl_meyer(prandtl_meyer(M_sup, g)) - M_sup)))
+        except ValueError as e:
+            failed.append((g, str(e)))
+            continue
+        if not err < tol:
+            failed.append((g, f"max |dM| = {err:.1e}"))
+    print(f"{len(gammas)} tables, gamma 1.05-1.67 step {step}: {len(failed)} failed")
+    for g, why in failed[:10]:
+        print(f"  gamma = {g:.4f}: {why}")
+    return not failed
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--n", type=int, default=1000000)
+    ap.add_argument("--gamma", type=float, default=1.2)
+    ap.add_argument("--check-gammas", action="store_true")
+    ap.add_argument("--gamma-step", type=float, default=1e-4)
+    args = ap.parse_args()
+    if args.check_gammas:
+        sys.exit(0 if check_gammas(args.gamma_step) else 1)
+    g = args.gamma
+    rng = np.random.default_rng(0)
+    M = rng.uniform(1.01, 6.0, args.n)
+
+    cases = (
+        ("M from A/A* (supersonic)", lambda: mach_from_area_ratio(area_ratio(M, g), g), M),
+        ("M from A/A* (subsonic)",
+         lambda: mach_from_area_ratio(area_ratio(1 / M, g), g, supersonic=False), 1 / M),
+        ("M from p/p0", lambda: mach_from_pressure_ratio(pressure_ratio(M, g), g), M),
+        ("inverse Prandtl-Meyer", lambda: inverse_prandtl_meyer(prandtl_meyer(M, g), g), M),
+    )
+    print(f"{args.n} inversions, gamma = {g}")
+    print(f"{'function':<26} {'time (s)':>10} {'max |dM|':>10}")
+    for name, fn, expected in cases:
+        t0 = time.perf_counter()
+        got = fn()
+        dt = time.perf_counter() - t0
+        print(f"{name:<26} {dt:>10.3f} {np.max(np.abs(got - expected)):>10.1e}")
+
+    # Scalar reference on a subsample, extrapolated to n
+    k = min(args.n, 2000)
+    ar = area_ratio(M[:k], g)
+    warnings.simplefilter("ignore", RuntimeWarning)  # fsolve non-convergence
+    t0 = time.perf_counter()
+    for a in ar:
+        _scalar_mach_from_area_ratio(a, g)
+    dt = (time.perf_counter() - t0) * args.n / k
+    print(f"{'scalar fsolve (A/A*)':<26} {dt:>10.3f} {'(extrap.)':>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark nozzle contour generation against the number of contour points.
+
+Each nozzle type is generated, given an inlet section and passed through
+calculate_performance for every N, from GUI-sized contours up to CFD-mesh
+sized ones.
+
+Usage:
+    python benchmarks/bench_nozzle.py [--sizes 100,1000,10000,100000,1000000]
+                                      [--area-ratio 8] [--gamma 1.2]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from nozzle import NOZZLE_TYPES, add_inlet_section, calculate_performance  # noqa: E402
+
+
+def _best_of(fn, repeat):
+    """Shortest wall time of repeat calls, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--sizes", default="100,1000,10000,100000,1000000")
+    ap.add_argument("--area-ratio", type=float, default=8.0)
+    ap.add_argument("--gamma", type=float, default=1.2)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+    sizes = [int(n) for n in args.sizes.split(",")]
+    cea = {"gamma": args.gamma, "Ae/At": args.area_ratio}
+    R_throat = 0.05
+
+    print(f"A/A* = {args.area_ratio}, gamma = {args.gamma}; "
+          f"contour + inlet + performance, best of {args.repeat} (ms)")
+    print(f"{'nozzle type':<34}" + "".join(f"{n:>11}" for n in sizes))
+    for name, (generator, shape) in NOZZLE_TYPES.items():
+        row = []
+        for n in sizes:
+            def run():
+                x, r = generator(cea, R_throat=R_throat, N=n, **shape)
+                add_inlet_section(x, r, R_throat)
+                calculate_performance(cea, (x, r))
+            row.append(_best_of(run, args.repeat) * 1e3)
+        print(f"{name:<34}" + "".join(f"{t:>11.2f}" for t in row))
+
+
+if __name__ == "__main__":
+    main()
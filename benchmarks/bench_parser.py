@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark the CEA parser engines on test.out replicated to a large sweep.
+
+Usage:
+    python benchmarks/bench_parser.py [--cases 100000] [--engines regex stream mmap]
+
+Each engine runs in its own process so the reported peak RSS is not polluted
+by the other engines.
+"""
+import argparse
+import multiprocessing as mp
+import os
+import resource
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def build_sweep(src, dst, n_cases):
+    """Write dst as the header of src followed by its CASE blocks repeated to n_cases."""
+    from parser import case_offsets
+    data = open(src, 'rb').read()
+    offsets = case_offsets(data)
+    header, body = data[:offsets[0]], data[offsets[0]:]
+    per_body = len(offsets)
+    with open(dst, 'wb') as f:
+        f.write(header)
+        for _ in range(n_cases // per_body):
+            f.write(body)
+        # Top up with the leading cases of one more copy
+        rest = n_cases % per_body
+        if rest:
+            f.write(data[offsets[0]:offsets[rest]])
+
+
+def _run(engine, path, queue):
+    from parser import parse_cea_output
+    t0 = time.perf_counter()
+    df = parse_cea_output(path, engine=engine)
+    dt = time.perf_counter() - t0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # MiB on Linux
+    queue.put((len(df), dt, peak))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    ap.add_argument("--cases", type=int, default=100000)
+    ap.add_argument("--engines", nargs="+", default=["regex", "stream", "mmap"])
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sweep.out")
+        build_sweep(os.path.join(ROOT, "test.out"), path, args.cases)
+        size_mb = os.path.getsize(path) / 2**20
+        print(f"{args.cases} cases, {size_mb:.1f} MiB")
+        print(f"{'engine':<8} {'rows':>8} {'time (s)':>10} {'cases/s':>10} {'peak RSS (MiB)':>15}")
+
+        ctx = mp.get_context("spawn")
+        for engine in args.engines:
+            q = ctx.Queue()
+            p = ctx.Process(target=_run, args=(engine, path, q))
+            p.start()
+            rows, dt, peak = q.get()
+            p.join()
+            print(f"{engine:<8} {rows:>8} {dt:>10.2f} {rows/dt:>10.0f} {peak:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
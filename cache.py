@@ -0,0 +1,76 @@
+import hashlib
+import logging
+import os
+import pandas as pd
+from config import CONFIG, CONFIG_PATH
+
+# Parsed DataFrames are stored as Parquet files next to the config file
+CACHE_DIR = os.path.join(os.path.dirname(CONFIG_PATH), ".cea_analyzer_cache")
+CACHE_VERSION = 1          # bump when the parser output schema changes
+SAMPLE_BYTES = 1 << 20     # bytes hashed at the head, middle and tail of a file
+
+
+def cache_key(path, **options):
+    """
+    Key for a parsed file: absolute path, size, mtime, parser options and a
+    content hash. The hash covers the head, middle and tail of the file, so a
+    multi-hundred-MB output is keyed without reading it in full.
+    """
+    st = os.stat(path)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{CACHE_VERSION}|{os.path.abspath(path)}|{st.st_size}|"
+             f"{st.st_mtime_ns}|{sorted(options.items())}".encode())
+    with open(path, 'rb') as f:
+        for off in sorted({0, max(0, st.st_size // 2 - SAMPLE_BYTES // 2),
+                           max(0, st.st_size - SAMPLE_BYTES)}):
+            f.seek(off)
+            h.update(f.read(SAMPLE_BYTES))
+    return h.hexdigest()
+
+
+def _entry(key):
+    return os.path.join(CACHE_DIR, key + ".parquet")
+
+
+def load_cached(path, **options):
+    """Return the cached DataFrame for path, or None on a miss."""
+    try:
+        entry = _entry(cache_key(path, **options))
+        if not os.path.exists(entry):
+            return None
+        df = pd.read_parquet(entry)
+        os.utime(entry)  # mark as recently used for LRU eviction
+        return df
+    except Exception:
+        logging.exception("Error reading parse cache")
+        return None
+
+
+def store_cached(path, df, **options):
+    """Store the parsed DataFrame for path and evict old entries if needed."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        entry = _entry(cache_key(path, **options))
+        tmp = entry + ".tmp"
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, entry)
+        evict(CONFIG.get("cache_max_mb", 512) * 2**20)
+    except Exception:
+        logging.exception("Error writing parse cache")
+
+
+def evict(max_bytes):
+    """Delete least recently used entries until the cache fits in max_bytes."""
+    if not os.path.isdir(CACHE_DIR):
+        return
+    entries = []
+    for name in os.listdir(CACHE_DIR):
+        if name.endswith(".parquet"):
+            st = os.stat(os.path.join(CACHE_DIR, name))
+            entries.append((st.st_mtime, st.st_size, name))
+    total = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total <= max_bytes:
+            break
+        os.remove(os.path.join(CACHE_DIR, name))
+        total -= size
@@ -5,7 +5,8 @@ G0 = 9.80665  # m/s²
 
 CONFIG_PATH = os.path.expanduser("~/.cea_analyzer_config.json")
 DEFAULT_CONFIG = {
-    "pdf_report_title": "CEA Analysis Report"
+    "pdf_report_title": "CEA Analysis Report",
+    "cache_max_mb": 512
 }
 
 def load_config():
@@ -0,0 +1,81 @@
+"""
+Indexed range filtering of parsed cases.
+
+Each filtered column is argsorted once per dataset, so a min/max filter is
+two searchsorted calls into its sorted values. The row mask of every
+filtered column is kept between calls; when a bound moves, only the rows
+between its old and new position in the sort order are flipped.
+"""
+import numpy as np
+
+class FilterIndex:
+    """Sorted per-column indexes of df for min/max range filters."""
+
+    def __init__(self, df, columns=()):
+        self._df = df
+        self._n = len(df)
+        self._index = {}   # column -> (argsort order, sorted values, non-NaN count)
+        self._spans = {}   # column -> (start, stop, mask) of its current filter
+        for col in columns:
+            self._column(col)
+
+    def __len__(self):
+        return self._n
+
+    def _column(self, col):
+        """Sort order of col, built on first use."""
+        idx = self._index.get(col)
+        if idx is None:
+            vals = self._df[col].to_numpy(dtype=float)
+            order = np.argsort(vals)
+            svals = vals[order]
+            # NaN sorts last and never passes a bound
+            idx = self._index[col] = (order, svals, int(np.searchsorted(svals, np.nan)))
+        return idx
+
+    def _mask(self, col, lo, hi):
+        """Mask of lo <= col <= hi, updated from the previous one where there is one."""
+        order, svals, valid = self._column(col)
+        start = 0 if lo is None else int(np.searchsorted(svals, lo, "left"))
+        stop = valid if hi is None else int(np.searchsorted(svals, hi, "right"))
+        stop = max(min(stop, valid), start)
+
+        span = self._spans.get(col)
+        if span is None:
+            mask = np.zeros(self._n, dtype=bool)
+            mask[order[start:stop]] = True
+        else:
+            old_start, old_stop, mask = span
+            if (old_start, old_stop) == (start, stop):
+                return mask
+            # Rows entering and leaving the span sit between the old and new ends
+            mask[order[start:min(stop, old_start)]] = True
+            mask[order[max(start, old_stop):stop]] = True
+            mask[order[old_start:min(old_stop, start)]] = False
+            mask[order[max(old_start, stop):old_stop]] = False
+        self._spans[col] = (start, stop, mask)
+        return mask
+
+    def mask(self, bounds):
+        """
+        Boolean row mask for bounds {column: (lo, hi)}, either bound None for
+        open; None when no column is bounded. Rows with NaN in a bounded
+        column are excluded.
+        """
+        active = {col: b for col, b in bounds.items() if b != (None, None)}
+        for col in list(self._spans):
+            if col not in active:
+                del self._spans[col]
+        combined = None
+        for col, (lo, hi) in active.items():
+            mask = self._mask(col, lo, hi)
+            if combined is None:
+                combined = mask.copy()
+            else:
+                combined &= mask
+        return combined
+
+    def rows(self, bounds):
+        """Positions of the rows passing bounds, or None when nothing is filtered."""
+        mask = self.mask(bounds)
+        return None if mask is None else np.flatnonzero(mask)
@@ -0,0 +1,100 @@
+"""
+Quasi-one-dimensional isentropic flow along a nozzle contour.
+
+The local area ratio A/A* = (r/r_throat)² at every contour point is
+inverted on the subsonic branch upstream of the throat and the supersonic
+branch downstream of it, in one vectorised solve per branch, giving Mach
+number, pressure, temperature, density and velocity along the axis.
+"""
+import numpy as np
+
+from analysis import R_univ
+from isentropic import mach_from_area_ratio, isentropic_table
+from nozzle import design_inputs
+
+def mach_along_contours(r, offsets, gamma, use_table=False):
+    """
+    Mach number at every point of a batch of contours laid out as in
+    `nozzle.calculate_performance_batch`: r holds the concatenated radii,
+    contour i spanning [offsets[i], offsets[i+1]). gamma is a scalar or one
+    value per contour. Each contour is subsonic before its first
+    minimum-radius point, sonic there and supersonic after it; both
+    branches are solved in a single inversion each.
+    """
+    r = np.asarray(r, dtype=float)
+    offsets = np.asarray(offsets, dtype=np.intp)
+    n = np.diff(offsets)
+    K = len(n)
+    seg = np.repeat(np.arange(K), n)
+    at_min = np.flatnonzero(r == np.minimum.reduceat(r, offsets[:-1])[seg])
+    throat = at_min[np.searchsorted(seg[at_min], np.arange(K))]
+    area_ratio = (r / r[throat][seg])**2
+    gamma = np.broadcast_to(np.asarray(gamma, dtype=float), (K,))[seg]
+    pos = np.arange(len(r)) - throat[seg]
+
+    M = np.ones_like(area_ratio)
+    for branch, supersonic in ((pos < 0, False), (pos > 0, True)):
+        if not branch.any():
+            continue
+        if use_table:
+            for g in np.unique(gamma[branch]):
+                sel = branch & (gamma == g)
+                M[sel] = isentropic_table(float(g)).mach_from_area_ratio(
+                    area_ratio[sel], supersonic=supersonic)
+        else:
+            M[branch] = mach_from_area_ratio(area_ratio[branch], gamma[branch], supersonic)
+    return M, area_ratio
+
+def isentropic_profile(x, r, gamma, p_c, T_c, MW=22.0, use_table=False):
+    """
+    Quasi-1D isentropic flow through the contour (x, r).
+
+    p_c [Pa], T_c [K] and MW [g/mol] are chamber stagnation conditions.
+    Points before the minimum-radius point are subsonic, points after it
+    supersonic and the throat itself sonic. use_table inverts through the
+    cached per-gamma `isentropic_table`.
+
+    Returns a dict of arrays along the contour:
+      'x', 'r'       : the contour
+      'area_ratio'   : A/A*
+      'M'            : Mach number
+      'p', 'T', 'rho': static pressure [Pa], temperature [K], density [kg/m³]
+      'V'            : velocity [m/s]
+    """
+    x = np.asarray(x, dtype=float)
+    r = np.asarray(r, dtype=float)
+    M, area_ratio = mach_along_contours(r, [0, len(r)], gamma, use_table)
+
+    # Stagnation-to-static relations
+    t_ratio = 1.0 / (1.0 + 0.5 * (gamma - 1.0) * M**2)
+    R = R_univ / (MW / 1e3)                 # specific gas constant [J/(kg·K)]
+    T = T_c * t_ratio
+    p = p_c * t_ratio**(gamma / (gamma - 1.0))
+    rho = p / (R * T)
+    V = M * np.sqrt(gamma * R * T)
+    return {
+        "x": x,
+        "r": r,
+        "area_ratio": area_ratio,
+        "M": M,
+        "p": p,
+        "T": T,
+        "rho": rho,
+        "V": V
+    }
+
+def contour_flow(cea_data, x, r, use_table=False):
+    """
+    `isentropic_profile` of the contour (x, r) with the gamma, chamber
+    pressure, chamber temperature and molecular weight of a parsed case
+    (throat values when the full-property parse is available).
+    """
+    if hasattr(cea_data, 'to_dict'):  # If it's a pandas Series
+        cea_data = cea_data.to_dict()
+    gamma, _ = design_inputs(cea_data)
+    p_c = cea_data.get('Pc (bar)', 50) * 1e5
+    T_c = cea_data.get('T_chamber (K)', 3500)
+    MW = cea_data.get('MW_throat (g/mol)', np.nan)
+    if np.isnan(MW):
+        MW = 22.0
+    return isentropic_profile(x, r, float(gamma), p_c, T_c, MW, use_table)
@@ -6,19 +6,29 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from PyQt5.QtWidgets import QApplication, QMainWindow, QTableView, QTabWidget, QWidget, \
     QVBoxLayout, QTextEdit, QDockWidget, QFormLayout, QLineEdit, QPushButton, \
     QStatusBar, QProgressBar, QFileDialog, QSizePolicy, QComboBox, QAction, \
-    QHBoxLayout, QLabel, QGroupBox, QRadioButton, QButtonGroup, QCheckBox, QGridLayout
+    QHBoxLayout, QLabel, QGroupBox, QRadioButton, QButtonGroup, QCheckBox, QGridLayout, \
+    QSplitter, QInputDialog
 from PyQt5.QtCore import Qt, QThread, pyqtSignal
 from PyQt5.QtGui import QFont
 
-from parser import parse_cea_output
+from parser import parse_cea_output, species_frame, is_compressed
 from models import PandasModel
-from threads import ParserThread
-from plots import create_graphs
-from analysis import compute_system
+from threads import ParserThread, MultiParserThread, WatchThread, SweepThread, TaskPipeline
+from cache import load_cached
+from plots import create_graphs, append_to_graphs
+from analysis import compute_system, system_table, exit_area_ratio
+from filters import FilterIndex
 from exporter import export_csv, export_excel, export_pdf
 from config import CONFIG, CONFIG_PATH
 import nozzle
-from moc import generate_moc_contour
+from flowfield import contour_flow
+from heattransfer import heat_transfer
+from moc import solve_moc_mesh
+
+def _sortable(view):
+    """Let view sort by a clicked header, starting in the model's own row order."""
+    view.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+    view.setSortingEnabled(True)
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -33,11 +43,27 @@ class MainWindow(QMainWindow):
         act_open.triggered.connect(lambda checked=False: self.open_file())
         act_open.triggered.connect(self.open_file)
         men.addAction(act_open)
+        act_open_many = QAction("Open Multiple...", self)
+        act_open_many.triggered.connect(lambda checked=False: self.open_files())
+        men.addAction(act_open_many)
+        self.act_species = QAction("Parse Species Mass Fractions", self, checkable=True)
+        men.addAction(self.act_species)
+        self.act_watch = QAction("Watch File for New Cases", self, checkable=True)
+        self.act_watch.toggled.connect(self.toggle_watch)
+        men.addAction(self.act_watch)
 
         # Tabs
         self.tabs = QTabWidget(); self.setCentralWidget(self.tabs)
-        # Data table
-        self.tbl = QTableView(); self.tabs.addTab(self.tbl, "Data")
+        # Data table, with the details of the clicked case parsed on demand
+        self.tbl = QTableView()
+        self.tbl.clicked.connect(self.show_case_details)
+        _sortable(self.tbl)
+        self.case_text = QTextEdit(); self.case_text.setReadOnly(True)
+        data_split = QSplitter(Qt.Vertical)
+        data_split.addWidget(self.tbl); data_split.addWidget(self.case_text)
+        data_split.setStretchFactor(0, 3)
+        self.data_tab = data_split
+        self.tabs.addTab(data_split, "Data")
         # Graphs
         # Graphs (start with empty canvases; real plots come after loading data)
         self.graphTabs = QTabWidget(); self.figures, self.canvases = {}, {}
@@ -60,6 +86,8 @@ class MainWindow(QMainWindow):
         self.sys_text = QTextEdit(); self.sys_text.setReadOnly(True)
         wsys=QWidget(); lsys=QVBoxLayout(wsys); lsys.addWidget(self.sys_canvas); lsys.addWidget(self.sys_text)
         self.tabs.addTab(wsys, "Nozzle/System")
+        self.sizing_tbl = QTableView(); _sortable(self.sizing_tbl)
+        self.tabs.addTab(self.sizing_tbl, "System Sizing")
         self.reco = QTextEdit(); self.reco.setReadOnly(True); self.tabs.addTab(self.reco, "Recommendations")
         
         # ─── Nozzle Design Tab ───
@@ -92,6 +120,12 @@ class MainWindow(QMainWindow):
         self.include_inlet_checkbox.stateChanged.connect(self.update_nozzle_design)
         control_layout.addWidget(self.include_inlet_checkbox, 2, 0, 1, 2)
         
+        # Quasi-1D flow overlay checkbox
+        self.show_flow_checkbox = QCheckBox("Show Flow Properties")
+        self.show_flow_checkbox.setChecked(True)
+        self.show_flow_checkbox.stateChanged.connect(self.update_nozzle_design)
+        control_layout.addWidget(self.show_flow_checkbox, 4, 0, 1, 2)
+        
         # Export nozzle coordinates button
         self.export_nozzle_button = QPushButton("Export Nozzle Coordinates")
         self.export_nozzle_button.clicked.connect(self.export_nozzle_coordinates)
@@ -114,6 +148,48 @@ class MainWindow(QMainWindow):
         
         self.tabs.addTab(self.nozzle_widget, "Nozzle Design")
 
+        # ─── Design Sweep Tab ───
+        sweep_widget = QWidget()
+        sweep_layout = QVBoxLayout(sweep_widget)
+        sweep_panel = QGroupBox("Sweep Controls")
+        sweep_grid = QGridLayout()
+        self.sweep_ar_edits = (QLineEdit("4"), QLineEdit("100"), QLineEdit("20"))
+        sweep_grid.addWidget(QLabel("Area ratio min / max / steps:"), 0, 0)
+        for i, edit in enumerate(self.sweep_ar_edits):
+            sweep_grid.addWidget(edit, 0, i + 1)
+        sweep_grid.addWidget(QLabel("Contour points N (comma separated):"), 1, 0)
+        self.sweep_n_edit = QLineEdit("100")
+        sweep_grid.addWidget(self.sweep_n_edit, 1, 1, 1, 3)
+        self.sweep_run_button = QPushButton("Run Sweep")
+        self.sweep_run_button.clicked.connect(self.run_sweep)
+        self.sweep_cancel_button = QPushButton("Cancel")
+        self.sweep_cancel_button.clicked.connect(self.cancel_sweep)
+        self.sweep_cancel_button.setEnabled(False)
+        sweep_grid.addWidget(self.sweep_run_button, 2, 0, 1, 2)
+        sweep_grid.addWidget(self.sweep_cancel_button, 2, 2, 1, 2)
+        sweep_panel.setLayout(sweep_grid)
+        sweep_layout.addWidget(sweep_panel)
+        # Filters on the ranked results
+        sweep_filter = QHBoxLayout()
+        sweep_filter.addWidget(QLabel("Type:"))
+        self.sweep_type_combo = QComboBox()
+        self.sweep_type_combo.addItems(["All"] + list(nozzle.NOZZLE_TYPES))
+        self.sweep_type_combo.currentIndexChanged.connect(self.update_sweep_table)
+        sweep_filter.addWidget(self.sweep_type_combo)
+        self.sweep_filters = {}
+        for col, label in (("Cf", "Min Cf:"), ("Length (m)", "Max length (m):"),
+                           ("Surface area (m²)", "Max surface area (m²):")):
+            edit = QLineEdit()
+            edit.editingFinished.connect(self.update_sweep_table)
+            sweep_filter.addWidget(QLabel(label)); sweep_filter.addWidget(edit)
+            self.sweep_filters[col] = edit
+        sweep_layout.addLayout(sweep_filter)
+        self.sweep_tbl = QTableView(); _sortable(self.sweep_tbl)
+        sweep_layout.addWidget(self.sweep_tbl)
+        self.sweep_status = QLabel()
+        sweep_layout.addWidget(self.sweep_status)
+        self.tabs.addTab(sweep_widget, "Design Sweep")
+
         # ─── MOC (Method of Characteristics) ───
 
         self.moc_canvas = FigureCanvas(Figure(tight_layout=True))
@@ -141,14 +217,35 @@ class MainWindow(QMainWindow):
         moc_widget.setLayout(moc_layout)
         self.tabs.addTab(moc_widget, "MOC")
 
+        # ─── Species mass fractions ───
+        species_widget = QWidget()
+        species_layout = QVBoxLayout(species_widget)
+        species_bar = QHBoxLayout()
+        species_bar.addWidget(QLabel("Station:"))
+        self.species_station_combo = QComboBox()
+        self.species_station_combo.addItems(["chamber", "throat", "exit"])
+        self.species_station_combo.setCurrentText("exit")
+        self.species_station_combo.currentIndexChanged.connect(self.update_species)
+        species_bar.addWidget(self.species_station_combo)
+        species_bar.addStretch(1)
+        species_layout.addLayout(species_bar)
+        self.species_tbl = QTableView(); _sortable(self.species_tbl)
+        species_layout.addWidget(self.species_tbl)
+        self.tabs.addTab(species_widget, "Species")
+
         # Filters dock
         dock = QDockWidget("Filters", self)
         fw = QWidget(); fl = QFormLayout(fw)
+        self.filter_form = fl
         self.filters = {}
         for col in ["O/F","Pc (bar)","Isp (s)"]:
             mn, mx = QLineEdit(), QLineEdit()
             fl.addRow(f"{col} min:", mn); fl.addRow(f"{col} max:", mx)
             self.filters[col] = (mn, mx)
+        # Any other parsed column can be given a filter too
+        self.filter_column_combo = QComboBox()
+        btnAdd = QPushButton("Add Filter"); btnAdd.clicked.connect(self.add_filter)
+        fl.addRow(self.filter_column_combo, btnAdd)
         btnA = QPushButton("Apply"); btnR = QPushButton("Reset")
         btnA.clicked.connect(self.apply_filters); btnR.clicked.connect(self.reset_filters)
         fl.addRow(btnA, btnR)
@@ -157,6 +254,10 @@ class MainWindow(QMainWindow):
         # Status bar
         self.status = QStatusBar(); self.setStatusBar(self.status)
         self.pbar = QProgressBar(); self.status.addPermanentWidget(self.pbar)
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.clicked.connect(self.cancel_parse)
+        self.cancel_btn.hide()
+        self.status.addPermanentWidget(self.cancel_btn)
 
         # Export actions
         exp = men.addMenu("Export")
@@ -167,59 +268,330 @@ class MainWindow(QMainWindow):
 
         # Data holders
         self.df_full = self.df = None
+        # FilterIndex of df_full, built per dataset in _on_parsed; rebuilt on the
+        # next Apply after rows are appended
+        self.filter_index = None
+        self.species_table = None
+        self.current_path = None
+        self.thread = None
+        self.watch_thread = None
+        self.sweep_thread = None
+        self.sweep_df = None
+        self.case_indexes = {}  # path -> lazily built CaseIndex
+        # Tab computations run off the GUI thread; only the drawing runs here
+        self.pipeline = TaskPipeline(parent=self)
+        self.pipeline.error.connect(
+            lambda name, msg: self.status.showMessage(f"Error ({name}): {msg}", 5000))
+
+        # Tabs render lazily: each remembers the dataset version it shows and
+        # is brought up to date when it becomes visible
+        self.tab_renderers = {
+            data_split:          (self.update_table,),
+            self.graphTabs:      (self.update_graphs,),
+            self.sum_text:       (self.update_summary,),
+            wsys:                (self.update_system,),
+            self.sizing_tbl:     (self.update_sizing,),
+            self.reco:           (self.update_recommendations,),
+            self.nozzle_widget:  (self.update_nozzle_design,),
+            moc_widget:          (self.update_moc,),
+            species_widget:      (self.update_species,),
+        }
+        self.tab_versions = {}     # tab widget -> dataset version it shows
+        self.tab_transitions = {}  # (from, to) tab index -> count, to guess the next tab
+        self._last_tab = self.tabs.currentIndex()
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+        self.pipeline.idle.connect(self._prerender_next_tab)
 
     def open_file(self, path=None):
         if path is None:
-            path, _ = QFileDialog.getOpenFileName(self, "Open CEA Output", "", "Text Files (*.txt *.out);;All Files (*)")
+            path, _ = QFileDialog.getOpenFileName(self, "Open CEA Output", "", "CEA Output (*.txt *.out *.gz *.xz *.bz2 *.zst);;All Files (*)")
         if not path:
             return
-        self.thread = ParserThread(path)
-        self.thread.progress.connect(self.pbar.setValue)
-        self.thread.finished.connect(self._on_parsed)
-        self.thread.error.connect(lambda e: self.status.showMessage(f"Error: {e}", 5000))
-        self.status.showMessage("Parsing...", 2000)
-        self.thread.start()
+        self.cancel_parse()
+        self._stop_watch()
+        self.current_path = path
+        self.case_indexes = {}
+        if self.act_watch.isChecked():
+            if not is_compressed(path):
+                self._start_watch(path)
+                return
+            # Offsets into a compressed file cannot be followed: load it once
+            self.act_watch.setChecked(False)
+            self.status.showMessage("Watch mode needs an uncompressed file; loading it once", 5000)
+        species = self.act_species.isChecked()
+        self.species_table = None
+        # Species fractions are not cached, so they always need a parse
+        df = None if species else load_cached(path, full=True)
+        if df is not None:
+            self._on_parsed(df)
+            self.status.showMessage("Loaded from cache", 2000)
+            return
+        thread = ParserThread(path, full=True, species=species)
+        thread.species.connect(self._if_current(thread, self._on_species))
+        self._start_parse(thread, "Parsing...")
+
+    def open_files(self, paths=None):
+        if paths is None:
+            paths, _ = QFileDialog.getOpenFileNames(self, "Open CEA Outputs", "", "CEA Output (*.txt *.out *.gz *.xz *.bz2 *.zst);;All Files (*)")
+        if not paths:
+            return
+        self.cancel_parse()
+        self._stop_watch()
+        self.current_path = None
+        self.case_indexes = {}
+        self.species_table = None
+        self._start_parse(MultiParserThread(paths, full=True),
+                          f"Parsing {len(paths)} files...")
+
+    def _if_current(self, thread, slot, attr="thread"):
+        """Wrap slot so that signals still queued from a superseded thread are ignored."""
+        return lambda *args: slot(*args) if thread is getattr(self, attr) else None
+
+    def _start_parse(self, thread, message):
+        self.thread = thread
+        thread.progress.connect(self._if_current(thread, self.pbar.setValue))
+        thread.finished.connect(self._if_current(thread, self._on_parse_finished))
+        thread.error.connect(self._if_current(thread, self._on_parse_error))
+        self.pbar.setValue(0)
+        self.cancel_btn.show()
+        self.status.showMessage(message, 2000)
+        thread.start()
+
+    def cancel_parse(self):
+        """Stop the running parse thread, if any, and drop its results."""
+        thread, self.thread = self.thread, None
+        self.cancel_btn.hide()
+        if thread is None or not thread.isRunning():
+            return
+        thread.cancel()
+        # The parsers check the token between cases, so this returns promptly
+        thread.wait()
+        self.pbar.reset()
+        self.status.showMessage("Parsing cancelled", 2000)
+
+    def _on_parse_finished(self, df):
+        self.thread = None
+        self.cancel_btn.hide()
+        self.pbar.setValue(100)
+        self._on_parsed(df)
+
+    def _on_parse_error(self, msg):
+        self.thread = None
+        self.cancel_btn.hide()
+        self.status.showMessage(f"Error: {msg}", 5000)
+
+    def toggle_watch(self, checked):
+        if checked and self.current_path and is_compressed(self.current_path):
+            self.act_watch.setChecked(False)
+            self.status.showMessage("Watch mode needs an uncompressed file", 5000)
+        elif checked and self.current_path:
+            self._start_watch(self.current_path)
+        elif not checked:
+            self._stop_watch()
+
+    def _start_watch(self, path):
+        """Follow path as it grows; the first poll loads the cases already written."""
+        self._stop_watch()
+        self.df_full = self.df = None
+        self.species_table = None
+        thread = self.watch_thread = WatchThread(path)
+        # Rows still queued from a watcher that has since been stopped are dropped
+        thread.rows.connect(self._if_current(thread, self._on_rows, "watch_thread"))
+        thread.restarted.connect(self._if_current(thread, self._on_watch_restarted, "watch_thread"))
+        thread.error.connect(self._if_current(
+            thread, lambda e: self.status.showMessage(f"Error: {e}", 5000), "watch_thread"))
+        thread.start()
+        self.status.showMessage(f"Watching {path}", 2000)
+
+    def _stop_watch(self):
+        if self.watch_thread is not None:
+            self.watch_thread.stop()
+            self.watch_thread = None
+
+    def _on_watch_restarted(self):
+        self.df_full = self.df = None
+
+    def _on_rows(self, df):
+        if self.df_full is None:
+            self._on_parsed(df)
+        else:
+            self._append_rows(df)
+
+    def _append_rows(self, new):
+        """Append newly parsed cases, updating the table and graphs in place."""
+        if self.pipeline.pending():
+            # The tabs are still being built from the previous rows
+            new.index = pd.RangeIndex(len(self.df_full), len(self.df_full) + len(new))
+            self.df_full = pd.concat([self.df_full, new])
+            self.filter_index = None
+            self.apply_filters()
+            return
+        start = len(self.df_full)
+        new.index = pd.RangeIndex(start, start + len(new))
+        self.df_full = pd.concat([self.df_full, new])
+        self.filter_index = None  # rebuilt for the longer frame on the next Apply
+        new = self._filter_frame(new)
+        if new.empty:
+            return
+        best_before = self.df["Isp (s)"].max() if not self.df.empty else -np.inf
+        self.df = pd.concat([self.df, new])
+
+        # The summary, recommendation and design tabs only depend on the best
+        # case, so they go stale only when it changes
+        version = self.pipeline.version
+        if new["Isp (s)"].max() > best_before:
+            self.pipeline.new_version()
+
+        # Tabs already showing the earlier rows take the new ones in place;
+        # the others are rebuilt from self.df when next shown
+        def append_graphs(new):
+            append_to_graphs(self.figures, new)
+            for canvas in self.canvases.values():
+                canvas.draw_idle()
+        in_place = {
+            self.data_tab:   lambda new: self.tbl.model().append(new),
+            self.sizing_tbl: lambda new: self.sizing_tbl.model().append(system_table(new)),
+            self.graphTabs:  append_graphs,
+        }
+        for widget, append in in_place.items():
+            if self.tab_versions.get(widget) == version:
+                append(new)
+                self.tab_versions[widget] = self.pipeline.version
+        self._render_visible_tab()
+        self.status.showMessage(f"{len(new)} new case(s)", 2000)
+
+    def closeEvent(self, event):
+        self.cancel_parse()
+        self.cancel_sweep()
+        self._stop_watch()
+        self.pipeline.shutdown()
+        super().closeEvent(event)
+
+    def _on_species(self, table):
+        self.species_table = table
 
     def _on_parsed(self, df):
-        self.df_full = df.copy(); self.df = df
+        self.df_full = self.df = df
+        # Sorted indexes of the filtered columns, built once per dataset
+        self.filter_index = FilterIndex(df, [c for c in self.filters if c in df])
+        self.filter_column_combo.clear()
+        self.filter_column_combo.addItems(
+            [c for c in df.columns
+             if c not in self.filters and pd.api.types.is_numeric_dtype(df[c])])
         self.update_all()
         self.status.showMessage("Done", 2000)
 
-    def apply_filters(self):
-        df = self.df_full.copy()
+    def add_filter(self):
+        """Add min/max bounds for the column chosen in the filter combo box."""
+        col = self.filter_column_combo.currentText()
+        if not col or col in self.filters:
+            return
+        mn, mx = QLineEdit(), QLineEdit()
+        # Above the combo box and button rows
+        row = self.filter_form.rowCount() - 2
+        self.filter_form.insertRow(row, f"{col} min:", mn)
+        self.filter_form.insertRow(row + 1, f"{col} max:", mx)
+        self.filters[col] = (mn, mx)
+        self.filter_column_combo.removeItem(self.filter_column_combo.currentIndex())
+
+    def _filter_bounds(self):
+        """{column: (lo, hi)} of the filter edits; empty bounds are None, invalid ones ignored."""
+        bounds = {}
         for col, (mn, mx) in self.filters.items():
             try:
                 lo = float(mn.text()) if mn.text() else None
                 hi = float(mx.text()) if mx.text() else None
-                if lo is not None: df = df[df[col] >= lo]
-                if hi is not None: df = df[df[col] <= hi]
             except ValueError:
-                pass
-        self.df = df; self.update_all()
+                continue
+            bounds[col] = (lo, hi)
+        return bounds
+
+    def _filter_frame(self, df):
+        """Apply the current filter bounds to df, a few appended rows, in one mask."""
+        mask = np.ones(len(df), dtype=bool)
+        for col, (lo, hi) in self._filter_bounds().items():
+            if col not in df:
+                continue
+            vals = df[col].to_numpy(dtype=float)
+            if lo is not None: mask &= vals >= lo
+            if hi is not None: mask &= vals <= hi
+        return df if mask.all() else df[mask]
+
+    def apply_filters(self):
+        if self.df_full is None:
+            return
+        if self.filter_index is None:
+            self.filter_index = FilterIndex(self.df_full)
+        bounds = {c: b for c, b in self._filter_bounds().items() if c in self.df_full}
+        rows = self.filter_index.rows(bounds)
+        # Only the passing rows are gathered; no filter leaves the full frame shared
+        self.df = self.df_full if rows is None else self.df_full.iloc[rows]
+        self.update_all()
 
     def reset_filters(self):
         for mn, mx in self.filters.values():
             mn.clear(); mx.clear()
-        self.df = self.df_full.copy(); self.update_all()
+        if self.df_full is None:
+            return
+        self.df = self.df_full; self.update_all()
 
     def update_all(self):
         if self.df is None or self.df.empty:
             return
-        self.update_table()
-        self.update_graphs()
-        self.update_summary()
-        # self.update_optimization()
-        self.update_system()
-        self.update_moc()
-        self.update_recommendations()
-        self.update_nozzle_design()
+        # A new dataset version: results still in flight for the old one are
+        # dropped and every tab is stale, but only the visible one is redrawn
+        self.pipeline.new_version()
+        self._render_visible_tab()
+
+    def _render_tab(self, widget):
+        """Bring the tab widget up to the current dataset version; False if it already is."""
+        if self.df is None or self.df.empty or widget not in self.tab_renderers:
+            return False
+        if self.tab_versions.get(widget) == self.pipeline.version:
+            return False
+        self.tab_versions[widget] = self.pipeline.version
+        for update in self.tab_renderers[widget]:
+            update()
+        return True
+
+    def _render_visible_tab(self):
+        self._render_tab(self.tabs.currentWidget())
+        if not self.pipeline.pending():
+            # Nothing went to the pool, so no idle signal will follow
+            self._prerender_next_tab()
+
+    def _on_tab_changed(self, index):
+        key = (self._last_tab, index)
+        self.tab_transitions[key] = self.tab_transitions.get(key, 0) + 1
+        self._last_tab = index
+        self._render_visible_tab()
+
+    def _prerender_next_tab(self):
+        """
+        Render the tab most likely to be opened next in the background: the
+        most frequent successor of the visible tab so far, else the nearest
+        data-driven tab to its right. Only that one tab, so idle time is not spent
+        on all of them.
+        """
+        current = self.tabs.currentIndex()
+        successors = [(n, to) for (frm, to), n in self.tab_transitions.items()
+                      if frm == current and to != current]
+        if successors:
+            nxt = max(successors)[1]
+        else:
+            nxt = next((i for i in range(current + 1, self.tabs.count())
+                        if self.tabs.widget(i) in self.tab_renderers), -1)
+        if 0 <= nxt < self.tabs.count():
+            self._render_tab(self.tabs.widget(nxt))
 
     def update_table(self):
         self.tbl.setModel(PandasModel(self.df))
 
     def update_graphs(self):
-        # build brand‐new figures
-        new_figs = create_graphs(self.df)
+        # build brand‐new figures off the GUI thread
+        self.pipeline.submit("graphs", create_graphs, self._draw_graphs, self.df)
+
+    def _draw_graphs(self, new_figs):
         for name, new_fig in new_figs.items():
             canvas = self.canvases[name]
             # swap out the old Figure for the new one
@@ -240,43 +612,103 @@ class MainWindow(QMainWindow):
         # Display a message that optimization feature has been removed
         self.opt_text.setHtml("<h2>Optimization</h2><p>Optimization heatmaps feature has been removed.</p>")
 
+    def _system(self):
+        """
+        compute_system of the current cases as a Future shared by the tabs of
+        this dataset version, prompting once if Expansion Ratio is missing.
+        None if the prompt is cancelled.
+        """
+        # 1) Find the best‐Isp row
+        best_idx = self.df["Isp (s)"].idxmax()
+
+        # 2) Get (or prompt for) the exit expansion ratio
+        if np.isnan(exit_area_ratio(self.df.loc[[best_idx]])[0]):
+            ar, ok = QInputDialog.getDouble(
+                self,
+                "Missing Expansion Ratio",
+                "Enter nozzle expansion ratio Aₑ/A*:",
+                10.0,   # default
+                1.0,    # min
+                1e4,    # max
+                2       # decimals
+            )
+            if not ok:
+                return None
+            # Write it back into the one row
+            self.df.at[best_idx, "Expansion Ratio"] = ar
+
+        # 3) Computed once per version, whichever tab asks first
+        return self.pipeline.shared("system", compute_system, self.df)
+
     def update_moc(self):
         """
         Compute and plot the MOC nozzle wall from the ‘best’ case in self.df.
         """
-        # 1) Find the best‐Isp row
-        best = self.df.loc[self.df["Isp (s)"].idxmax()]
+        system = self._system()
+        if system is not None:
+            self.pipeline.submit("moc", self._compute_moc, self._draw_moc, system)
 
-        # 2) Recompute system quantities (so we get At and Ae from compute_system)
-        from analysis import compute_system
-        res = compute_system(self.df)
+    @staticmethod
+    def _compute_moc(system):
+        """Worker side of update_moc: the characteristic net of the best case."""
+        # 1) System quantities (At and Ae from the shared compute_system)
+        res = system.result()
         At = res["At"]       # throat area [m²]
         Ae = res["Ae"]       # exit  area [m²]
+        best = res["best"]
 
-        # 3) Expansion ratio and throat radius
-        area_ratio = Ae / At
+        # 2) Gamma and exit expansion ratio of the parsed case; "Expansion
+        #    Ratio" is CEA's throat column, so the exit column comes first
+        gamma, _ = nozzle.design_inputs(best.to_dict())
+        area_ratio = best.get("AeAt_exit", np.nan)
+        if np.isnan(area_ratio):
+            area_ratio = Ae / At
         R_throat   = (At / np.pi) ** 0.5
+        if area_ratio <= 1.0:
+            # No supersonic expansion to design (e.g. a throat-only CEA run)
+            return best, area_ratio, R_throat, None
 
-        # 4) Generate the MOC contour (using your moc.py routine)
-        from moc import generate_moc_contour
-        gamma = 1.2    # or pull from config if you make it dynamic
-        N     = 30     # number of characteristic lines
-        x_wall, r_wall = generate_moc_contour(
+        # 3) Solve the characteristic net (kernel + turning region)
+        N     = 60     # number of characteristics in the corner fan
+        sol = solve_moc_mesh(
             area_ratio=area_ratio,
-            gamma=gamma,
+            gamma=float(gamma),
             N=N,
-            R_throat=R_throat
+            R_throat=R_throat,
+            use_table=True
         )
+        sol["N"] = N
+        return best, area_ratio, R_throat, sol
 
-        # 5) Clear & redraw the figure
+    def _draw_moc(self, result):
+        best, area_ratio, R_throat, sol = result
         fig = self.moc_canvas.figure
+        if sol is None:
+            fig.clear()
+            self.moc_canvas.draw()
+            self.moc_text.setHtml(
+                "<h2>Method of Characteristics</h2>"
+                f"<p>Expansion ratio (Aₑ/A*) = <b>{area_ratio:.2f}</b>: "
+                "no supersonic section to design.</p>"
+            )
+            return
+        x_wall, r_wall = sol["x_wall"], sol["r_wall"]
+
+        # 4) Clear & redraw the figure: Mach field over the nodes, the
+        #    characteristic net every few lines, and the wall
         fig.clear()
         ax = fig.add_subplot(111)
 
-        ax.plot(x_wall,  r_wall, lw=2, label="Upper contour")
-        ax.plot(x_wall, -r_wall, lw=2, label="Lower contour")
+        cf = ax.tricontourf(sol["x"], sol["r"], sol["M"], levels=30, cmap="viridis")
+        fig.colorbar(cf, ax=ax, label="Mach")
+        step = max(1, sol["N"] // 15)
+        for net in (sol["kernel"], sol["turning"]):
+            ax.plot(net["x"][::step].T, net["r"][::step].T, color="w", lw=0.3, alpha=0.6)
+            ax.plot(net["x"][:, ::step], net["r"][:, ::step], color="w", lw=0.3, alpha=0.6)
+        ax.plot(x_wall,  r_wall, "k", lw=2, label="Upper contour")
+        ax.plot(x_wall, -r_wall, "k", lw=2, label="Lower contour")
 
-        # 6) Autoscale + padding so lines never butt the edges
+        # 5) Autoscale + padding so lines never butt the edges
         ax.relim()
         ax.autoscale_view()
         ax.margins(x=0, y=0.05)
@@ -284,15 +716,14 @@ class MainWindow(QMainWindow):
         ax.set_title("MOC Nozzle Contour")
         ax.set_xlabel("Axial (m)")
         ax.set_ylabel("Radius (m)")
-        ax.legend(loc="best", frameon=False)
 
-        # 7) Kill widget padding so the plot fills horizontally
+        # 6) Kill widget padding so the plot fills horizontally
         fig.tight_layout(pad=0)
 
-        # 8) Render
+        # 7) Render
         self.moc_canvas.draw()
 
-        # 9) Update the explanatory text with the actual parameters
+        # 8) Update the explanatory text with the actual parameters
         self.moc_text.setHtml(
             "<h2>Method of Characteristics</h2>"
             "<p>Best case parameters:<br>"
@@ -300,6 +731,11 @@ class MainWindow(QMainWindow):
             f"Pc = <b>{best['Pc (bar)']} bar</b><br>"
             f"Throat radius = <b>{R_throat:.3f} m</b><br>"
             f"Expansion ratio (Aₑ/A*) = <b>{area_ratio:.2f}</b></p>"
+            "<p>Minimum-length nozzle:<br>"
+            f"Exit Mach = <b>{sol['M_exit']:.3f}</b>, "
+            f"corner angle θ<sub>max</sub> = <b>{np.degrees(sol['theta_max']):.2f}°</b><br>"
+            f"Length = <b>{x_wall[-1]:.3f} m</b>, "
+            f"{sol['M'].size} nodes, mass-flow error {sol['mass_error']:.1e}</p>"
         )
 
     def update_system(self):
@@ -307,36 +743,16 @@ class MainWindow(QMainWindow):
         Compute & display nozzle sketch, thrust vs. altitude,
         prompting once if Expansion Ratio is missing.
         """
-        # 1) Find the index of the best‐Isp row
-        best_idx = self.df["Isp (s)"].idxmax()
-
-        # 2) Pull that row
-        best = self.df.loc[best_idx]
-
-        # 3) Get (or prompt for) Expansion Ratio
-        ar = best["Expansion Ratio"]
-        if ar is None:
-            ar, ok = QInputDialog.getDouble(
-                self,
-                "Missing Expansion Ratio",
-                "Enter nozzle expansion ratio Aₑ/A*:",
-                10.0,   # default
-                1.0,    # min
-                1e4,    # max
-                2       # decimals
-            )
-            if not ok:
-                return
-            # Write it back into the one row
-            self.df.at[best_idx, "Expansion Ratio"] = ar
-            best = self.df.loc[best_idx]  # re‐fetch with updated ar
+        system = self._system()
+        if system is not None:
+            self.pipeline.submit("system", lambda fut: fut.result(), self._draw_system, system)
 
-        # 4) Now call compute_system (which will use that ar)
-        res = compute_system(self.df)
+    def _draw_system(self, res):
         At = res["At"]
         Ae = res["Ae"]
+        ar = res["area_ratio"]
 
-        # 5) Plot your nozzle sketch & thrust vs altitude (unchanged)
+        # Plot your nozzle sketch & thrust vs altitude (unchanged)
         fig = self.sys_canvas.figure
         fig.clear()
 
@@ -355,7 +771,7 @@ class MainWindow(QMainWindow):
 
         self.sys_canvas.draw()
 
-        # 6) Show key numbers
+        # Show key numbers
         html = (
             f"<h2>Nozzle & System</h2>"
             f"<p>At = {At:.6f} m²<br>"
@@ -365,6 +781,51 @@ class MainWindow(QMainWindow):
         self.sys_text.setHtml(html)
 
 
+    def update_sizing(self):
+        """System sizing of every filtered case, computed in one batch."""
+        self.pipeline.submit("sizing", system_table,
+                             lambda table: self.sizing_tbl.setModel(PandasModel(table)), self.df)
+
+    def show_case_details(self, index):
+        """Parse and show the full tables of the clicked case."""
+        # The view may be sorted: map back to the row of self.df
+        row = self.df.iloc[self.tbl.model().source_row(index.row())]
+        path = row.get("source_file", self.current_path)
+        if "Case" not in row or not path:
+            return
+        case = int(row["Case"])
+        try:
+            if path not in self.case_indexes:
+                self.case_indexes[path] = parse_cea_output(path, lazy=True)
+            det = self.case_indexes[path].details(case)
+        except (OSError, ValueError) as e:
+            self.status.showMessage(f"Error: {e}", 5000)
+            return
+        species = det["species"].sort_values("exit", ascending=False).head(10)
+        self.case_text.setHtml(
+            f"<h3>Case {case}: O/F = {row['O/F']:.2f}, Pc = {row['Pc (bar)']} bar</h3>"
+            + det["properties"].T.to_html(na_rep="", float_format=lambda v: f"{v:.5g}")
+            + "<h4>Main species (mass fraction)</h4>"
+            + species.to_html(float_format=lambda v: f"{v:.5f}")
+        )
+
+    def update_species(self):
+        """Show the species mass fractions of the current cases at the chosen station."""
+        if self.species_table is None or self.df is None or "Case" not in self.df:
+            self.species_tbl.setModel(PandasModel())
+            return
+        station = self.species_station_combo.currentText()
+        self.pipeline.submit("species", self._compute_species,
+                             lambda table: self.species_tbl.setModel(PandasModel(table)),
+                             self.species_table, station, self.df)
+
+    @staticmethod
+    def _compute_species(species_table, station, df):
+        frac = species_frame(species_table, station, df["Case"])
+        frac = frac.loc[:, (frac != 0).any(axis=0)]  # hide species absent everywhere
+        keys = df[["O/F", "Pc (bar)"]].reset_index(drop=True)
+        return pd.concat([keys, frac], axis=1)
+
     def update_recommendations(self):
         b = self.df.loc[self.df["Isp (s)"].idxmax()]
         rec = (
@@ -388,8 +849,10 @@ class MainWindow(QMainWindow):
     def export_pdf(self):
         fn, _ = QFileDialog.getSaveFileName(self, "Save PDF", "", "PDF Files (*.pdf)")
         if fn:
-            figs = {"Cover": self.figures["Isp"]}
-            figs.update(create_graphs(self.df))
+            # Built here, as the Graphs tab may not have been drawn for the current cases
+            graphs = create_graphs(self.df)
+            figs = {"Cover": graphs["Isp"]}
+            figs.update(graphs)
             export_pdf(figs, CONFIG["pdf_report_title"], fn)
             
     def update_nozzle_design(self):
@@ -398,7 +861,7 @@ class MainWindow(QMainWindow):
             return
             
         # Get the best case from the dataframe
-        best_case = self.df.iloc[self.df['Isp (s)'].idxmax()]
+        best_case = self.df.loc[self.df['Isp (s)'].idxmax()]
         
         # Get the throat radius from the input field
         try:
@@ -409,43 +872,63 @@ class MainWindow(QMainWindow):
         
         # Get the nozzle type
         nozzle_type = self.nozzle_type_combo.currentText()
+        if nozzle_type not in nozzle.NOZZLE_TYPES:
+            # Default to conical if something goes wrong
+            nozzle_type = "Conical"
         
+        self.pipeline.submit("nozzle", self._compute_nozzle_design, self._draw_nozzle_design,
+                             best_case, nozzle_type, R_throat,
+                             self.include_inlet_checkbox.isChecked())
+
+    @staticmethod
+    def _compute_nozzle_design(best_case, nozzle_type, R_throat, include_inlet):
+        """Worker side of update_nozzle_design: contour, performance and flow."""
         # Store the nozzle type in the CEA data for performance calculations
         cea_data = best_case.copy()
         cea_data['nozzle_type'] = nozzle_type
         
-        # Generate the nozzle contour based on the selected type
-        if nozzle_type == "Conical":
-            x, r = nozzle.conical_nozzle(cea_data, R_throat=R_throat)
-        elif nozzle_type == "Rao Optimum":
-            x, r = nozzle.rao_optimum_nozzle(cea_data, R_throat=R_throat)
-        elif nozzle_type == "80% Bell":
-            x, r = nozzle.bell_nozzle(cea_data, R_throat=R_throat, percent_bell=80)
-        elif nozzle_type == "Method of Characteristics (MOC)":
-            x, r = nozzle.moc_nozzle(cea_data, R_throat=R_throat)
-        elif nozzle_type == "Truncated Ideal Contour (TIC)":
-            x, r = nozzle.truncated_ideal_contour(cea_data, R_throat=R_throat, truncation_factor=0.8)
-        else:
-            # Default to conical if something goes wrong
-            x, r = nozzle.conical_nozzle(cea_data, R_throat=R_throat)
+        # Generate the nozzle contour based on the selected type; contours are
+        # cached normalised, so a new throat radius only rescales them
+        x, r = nozzle.nozzle_contour(nozzle_type, cea_data, R_throat=R_throat, use_table=True)
         
         # Add inlet section if requested
-        if self.include_inlet_checkbox.isChecked():
+        if include_inlet:
             x, r = nozzle.add_inlet_section(x, r, R_throat)
         
+        # Calculate performance metrics
+        performance = nozzle.calculate_performance(cea_data, (x, r), use_table=True)
+        
+        # Quasi-1D isentropic flow along the contour, inlet included
+        flow = contour_flow(cea_data, x, r, use_table=True)
+        heat = heat_transfer(cea_data, x, r, use_table=True)
+        return {
+            "best_case": best_case,
+            "cea_data": cea_data,
+            "nozzle_type": nozzle_type,
+            "include_inlet": include_inlet,
+            "x": x,
+            "r": r,
+            "performance": performance,
+            "flow": flow,
+            "heat": heat
+        }
+
+    def _draw_nozzle_design(self, design):
+        best_case, cea_data = design["best_case"], design["cea_data"]
+        nozzle_type = design["nozzle_type"]
+        x, r = design["x"], design["r"]
+        performance, flow, heat = design["performance"], design["flow"], design["heat"]
+        
         # Store the current coordinates for export
         self.current_nozzle_coords = (x, r)
         
-        # Calculate performance metrics
-        performance = nozzle.calculate_performance(cea_data, (x, r))
-        
         # Plot the nozzle with professional engineering styling
         fig = self.nozzle_canvas.figure
         fig.clear()
         ax = fig.add_subplot(111)
         
         # Find the actual throat position
-        if self.include_inlet_checkbox.isChecked():
+        if design["include_inlet"]:
             # If inlet is included, throat is at x=0
             throat_idx = np.argmin(np.abs(x))
         else:
@@ -541,6 +1024,28 @@ class MainWindow(QMainWindow):
                 fontsize=9, color='navy', fontweight='bold',
                 bbox=dict(facecolor='white', alpha=0.7, edgecolor='lightgray', pad=3))
         
+        # Overlay the axial flow properties on a second y-axis; an inset
+        # spanning the whole axes keeps the nozzle's aspect ratio intact
+        if self.show_flow_checkbox.isChecked():
+            fax = ax.inset_axes([0, 0, 1, 1])
+            fax.patch.set_alpha(0)
+            fax.set_xlim(ax.get_xlim())
+            fax.xaxis.set_visible(False)
+            fax.yaxis.tick_right()
+            fax.yaxis.set_label_position('right')
+            fax.plot(x, flow['M'], color='darkgreen', lw=1.5, label="Mach")
+            fax.plot(x, flow['p'] / flow['p'][0], color='darkorange', ls='--', lw=1.2,
+                     label="p/p$_c$")
+            fax.plot(x, flow['T'] / flow['T'][0], color='crimson', ls='-.', lw=1.2,
+                     label="T/T$_c$")
+            fax.plot(x, flow['rho'] / flow['rho'][0], color='purple', ls=':', lw=1.2,
+                     label="ρ/ρ$_c$")
+            fax.plot(x, flow['V'] / flow['V'].max(), color='teal', ls=(0, (5, 1)), lw=1.2,
+                     label="V/V$_e$")
+            fax.set_ylim(0, max(1.0, flow['M'].max()) * 1.1)
+            fax.set_ylabel("Mach / normalised")
+            fax.legend(loc='upper left', fontsize=8, framealpha=0.7)
+        
         # Plot formatting
         ax.set_title(f"{nozzle_type} Nozzle Design")
         ax.set_xlabel("Axial Distance (m)")
@@ -599,11 +1104,100 @@ class MainWindow(QMainWindow):
                 <td><b>Divergence Loss Factor:</b></td>
                 <td>{performance['divergence_loss_factor']:.4f}</td>
             </tr>
+            <tr>
+                <td><b>Exit Pressure:</b></td>
+                <td>{flow['p'][-1] / 1e5:.3f} bar</td>
+                <td><b>Exit Temperature:</b></td>
+                <td>{flow['T'][-1]:.0f} K</td>
+            </tr>
+            <tr>
+                <td><b>Exit Velocity:</b></td>
+                <td>{flow['V'][-1]:.0f} m/s</td>
+                <td><b>Exit Density:</b></td>
+                <td>{flow['rho'][-1]:.4f} kg/m³</td>
+            </tr>
+            <tr>
+                <td><b>Peak Heat Flux:</b></td>
+                <td>{heat['q'].max() / 1e6:.2f} MW/m²</td>
+                <td><b>Heat Load:</b></td>
+                <td>{heat['heat_load'] / 1e3:.1f} kW</td>
+            </tr>
         </table>
         <p><small>Based on best performing case: O/F = {best_case['O/F']:.2f}, Pc = {best_case['Pc (bar)']} bar</small></p>
         """
         self.nozzle_text.setHtml(html)
         
+    def run_sweep(self):
+        """Sweep every nozzle type over the requested grid for the best case."""
+        if self.df is None or self.df.empty:
+            self.status.showMessage("Load a CEA output before running a sweep", 3000)
+            return
+        try:
+            lo, hi, steps = (float(e.text()) for e in self.sweep_ar_edits)
+            N_values = [int(n) for n in self.sweep_n_edit.text().split(",") if n.strip()]
+            R_throat = float(self.throat_radius_edit.text())
+        except ValueError:
+            self.status.showMessage("Invalid sweep grid", 3000)
+            return
+        self.cancel_sweep()
+        best = self.df.loc[self.df["Isp (s)"].idxmax()].to_dict()
+        best["At"] = np.pi * R_throat**2
+        thread = SweepThread(best, np.linspace(lo, hi, max(1, int(steps))), N_values)
+        self.sweep_thread = thread
+        thread.progress.connect(self._if_current(thread, self.pbar.setValue, "sweep_thread"))
+        thread.finished.connect(self._if_current(thread, self._on_sweep_finished, "sweep_thread"))
+        thread.error.connect(self._if_current(thread, self._on_sweep_error, "sweep_thread"))
+        self.pbar.setValue(0)
+        self.sweep_run_button.setEnabled(False)
+        self.sweep_cancel_button.setEnabled(True)
+        self.sweep_status.setText("Sweeping…")
+        thread.start()
+
+    def cancel_sweep(self):
+        """Stop the running design sweep, if any, and drop its results."""
+        thread, self.sweep_thread = self.sweep_thread, None
+        self.sweep_run_button.setEnabled(True)
+        self.sweep_cancel_button.setEnabled(False)
+        if thread is None or not thread.isRunning():
+            return
+        thread.cancel()
+        thread.wait()
+        self.pbar.reset()
+        self.sweep_status.setText("Sweep cancelled")
+
+    def _on_sweep_finished(self, df):
+        self.sweep_thread = None
+        self.sweep_run_button.setEnabled(True)
+        self.sweep_cancel_button.setEnabled(False)
+        self.pbar.setValue(100)
+        self.sweep_df = df
+        self.update_sweep_table()
+
+    def _on_sweep_error(self, msg):
+        self.sweep_thread = None
+        self.sweep_run_button.setEnabled(True)
+        self.sweep_cancel_button.setEnabled(False)
+        self.sweep_status.setText(f"Error: {msg}")
+
+    def update_sweep_table(self):
+        """Show the ranked sweep results that pass the type and bound filters."""
+        if self.sweep_df is None:
+            return
+        df = self.sweep_df
+        mask = np.ones(len(df), dtype=bool)
+        if self.sweep_type_combo.currentText() != "All":
+            mask &= (df["Nozzle type"] == self.sweep_type_combo.currentText()).to_numpy()
+        for col, edit in self.sweep_filters.items():
+            try:
+                bound = float(edit.text()) if edit.text() else None
+            except ValueError:
+                continue
+            if bound is not None:
+                vals = df[col].to_numpy()
+                mask &= vals >= bound if col == "Cf" else vals <= bound
+        self.sweep_tbl.setModel(PandasModel(df[mask]))
+        self.sweep_status.setText(f"{mask.sum()} of {len(df)} designs")
+
     def export_nozzle_coordinates(self):
         """Export nozzle coordinates to a CSV file"""
         if self.df is None or not hasattr(self, 'current_nozzle_coords'):
@@ -0,0 +1,174 @@
+"""
+Convective wall heat transfer along a nozzle contour by the Bartz correlation.
+
+The gas-side film coefficient, adiabatic wall temperature and heat flux are
+evaluated at every contour point as array operations on the quasi-1D Mach
+distribution of `flowfield.mach_along_contours`, and the flux is integrated
+over the wall to the total heat load. The batch form evaluates a whole
+sweep's contours in one pass over the concatenated points.
+
+Bartz, D. R., "A Simple Equation for Rapid Estimation of Rocket Nozzle
+Convective Heat Transfer Coefficients", Jet Propulsion 27 (1957).
+"""
+import numpy as np
+import pandas as pd
+
+from analysis import R_univ, _column
+from flowfield import mach_along_contours
+from nozzle import _ragged_contours
+
+T_WALL = 800.0             # default gas-side wall temperature [K]
+THROAT_CURVATURE = 1.0     # throat radius of curvature / throat radius
+
+
+def gas_properties(cases):
+    """
+    Chamber properties entering the correlation, from a parsed case (dict or
+    Series, scalars) or every row of a DataFrame (arrays):
+      'gamma', 'p_c' [Pa], 'T_c' [K], 'c_star' [m/s], 'cp' [J/(kg·K)],
+      'MW' [g/mol], 'mu' [Pa·s], 'Pr'
+    Cp, MW and c* come from the full-property parse; without it cp falls
+    back to the ideal γR/(γ-1), c* to the ideal-gas value and MW to 22.
+    Viscosity and Prandtl number follow the usual Bartz estimates
+    μ = 1.184e-7 MW^0.5 T^0.6 and Pr = 4γ/(9γ-5).
+    """
+    if isinstance(cases, pd.DataFrame):
+        def get(key, default):
+            return _column(cases, key, default)
+    else:
+        if hasattr(cases, 'to_dict'):  # If it's a pandas Series
+            cases = cases.to_dict()
+
+        def get(key, default):
+            val = cases.get(key, np.nan)
+            return default if val is None or np.isnan(val) else float(val)
+
+    gamma = get('Gamma_chamber', get('gamma', get('Gamma_throat', 1.2)))
+    p_c = get('Pc (bar)', 50.0) * 1e5
+    T_c = get('T_chamber (K)', 3500.0)
+    MW = get('MW_chamber (g/mol)', get('MW_throat (g/mol)', 22.0))
+    R = R_univ / (MW / 1e3)                 # specific gas constant [J/(kg·K)]
+    cp = get('Cp_chamber (kJ/(kg·K))', np.nan) * 1e3
+    cp = np.where(np.isnan(cp), gamma * R / (gamma - 1.0), cp)
+    c_star_ideal = (np.sqrt(R * T_c / gamma)
+                    * ((gamma + 1.0) / 2.0)**((gamma + 1.0) / (2.0 * (gamma - 1.0))))
+    c_star = get('Cstar_throat (m/s)', c_star_ideal)
+    return {
+        "gamma": gamma,
+        "p_c": p_c,
+        "T_c": T_c,
+        "c_star": c_star,
+        "cp": cp,
+        "MW": MW,
+        "mu": 1.184e-7 * MW**0.5 * T_c**0.6,
+        "Pr": 4.0 * gamma / (9.0 * gamma - 5.0)
+    }
+
+
+def bartz_coefficient(area_ratio, M, D_t, gamma, p_c, T_c, c_star, cp, mu, Pr,
+                      T_wall=T_WALL, throat_curvature=THROAT_CURVATURE):
+    """
+    Gas-side film coefficient h [W/(m²·K)] from the Bartz correlation
+
+        h = 0.026 / D_t^0.2 · (μ^0.2 cp / Pr^0.6) · (p_c / c*)^0.8
+            · (D_t / R_c)^0.1 · (A*/A)^0.9 · σ
+
+    with the boundary-layer property correction
+
+        σ = [½ (T_w/T_c)(1 + (γ-1)/2 M²) + ½]^-0.68 · (1 + (γ-1)/2 M²)^-0.12
+
+    All arguments broadcast against each other (SI units, D_t in m).
+    """
+    stag = 1.0 + 0.5 * (gamma - 1.0) * M**2
+    sigma = (0.5 * (T_wall / T_c) * stag + 0.5)**-0.68 * stag**-0.12
+    return (0.026 / D_t**0.2 * (mu**0.2 * cp / Pr**0.6) * (p_c / c_star)**0.8
+            * (2.0 / throat_curvature)**0.1 * area_ratio**-0.9 * sigma)
+
+
+def adiabatic_wall_temperature(M, gamma, T_c, Pr):
+    """Adiabatic wall temperature [K] with the turbulent recovery factor Pr^(1/3)."""
+    half = 0.5 * (gamma - 1.0) * M**2
+    return T_c * (1.0 + Pr**(1.0 / 3.0) * half) / (1.0 + half)
+
+
+def heat_transfer_batch(cases, x, r, offsets=None, lengths=None, T_wall=T_WALL,
+                        throat_curvature=THROAT_CURVATURE, use_table=False):
+    """
+    Bartz heat transfer along a batch of contours in one set of array
+    passes.
+
+    Parameters
+    ----------
+    cases : dict, Series or DataFrame
+        Parsed case(s). A single case applies to every contour (a design
+        sweep); a DataFrame gives contour i the properties of row i, and with
+        a single contour evaluates that contour for every row.
+    x, r : array_like
+        Contours as accepted by `nozzle.calculate_performance_batch`: flat
+        with offsets, or 2-D padded per row with lengths or trailing NaN.
+    T_wall : float or array_like
+        Gas-side wall temperature [K], scalar or one value per point.
+    throat_curvature : float
+        Throat radius of curvature in throat radii.
+    use_table : bool
+        Invert the area ratios through the cached isentropic tables.
+
+    Returns
+    -------
+    dict
+        Flat per-point arrays 'x', 'r', 'M', 'h' [W/(m²·K)], 'T_aw' [K] and
+        'q' [W/m²], the 'offsets' of each contour in them, and per-contour
+        'heat_load' [W] integrated over the wall as truncated cones.
+    """
+    x, r, offsets = _ragged_contours(x, r, offsets, lengths)
+    props = gas_properties(cases)
+    K = len(offsets) - 1
+    n_cases = np.size(props['gamma'])
+    if K == 1 and n_cases > 1:
+        # One contour evaluated for every case
+        n = len(x)
+        x, r = np.tile(x, n_cases), np.tile(r, n_cases)
+        offsets = np.arange(n_cases + 1) * n
+        K = n_cases
+    props = {key: np.broadcast_to(np.asarray(val, dtype=float), (K,))
+             for key, val in props.items()}
+
+    M, area_ratio = mach_along_contours(r, offsets, props['gamma'], use_table)
+    seg = np.repeat(np.arange(K), np.diff(offsets))
+    D_t = 2.0 * np.minimum.reduceat(r, offsets[:-1])
+    p = {key: val[seg] for key, val in props.items()}
+
+    h = bartz_coefficient(area_ratio, M, D_t[seg], p['gamma'], p['p_c'], p['T_c'],
+                          p['c_star'], p['cp'], p['mu'], p['Pr'], T_wall, throat_curvature)
+    T_aw = adiabatic_wall_temperature(M, p['gamma'], p['T_c'], p['Pr'])
+    q = h * (T_aw - T_wall)
+
+    # Trapezoidal q·2πr over each wall segment, dropping the joins between contours
+    ds = np.hypot(np.diff(x), np.diff(r))
+    dQ = np.pi * (q[1:] * r[1:] + q[:-1] * r[:-1]) * ds
+    inner = seg[1:] == seg[:-1]
+    heat_load = np.bincount(seg[1:][inner], weights=dQ[inner], minlength=K)
+    return {
+        "x": x,
+        "r": r,
+        "M": M,
+        "h": h,
+        "T_aw": T_aw,
+        "q": q,
+        "offsets": offsets,
+        "heat_load": heat_load
+    }
+
+
+def heat_transfer(cea_data, x, r, T_wall=T_WALL, throat_curvature=THROAT_CURVATURE,
+                  use_table=False):
+    """
+    Bartz heat transfer along the single contour (x, r) for the parsed case
+    cea_data. Returns the per-point arrays of `heat_transfer_batch` and the
+    scalar 'heat_load' [W].
+    """
+    out = heat_transfer_batch(cea_data, x, r, T_wall=T_wall,
+                              throat_curvature=throat_curvature, use_table=use_table)
+    del out['offsets']
+    out['heat_load'] = float(out['heat_load'][0])
+    return out
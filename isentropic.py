@@ -0,0 +1,311 @@
+"""
+Vectorised isentropic-flow relations and their inverses.
+
+Every function accepts scalars or arrays (broadcast against gamma) and
+returns a float for scalar input. The inversions run a safeguarded Halley
+iteration on all elements together, starting from analytic approximations
+that are already close to the root, so a million inversions cost a handful
+of array passes instead of a million scalar root-finds.
+
+For interactive use, `isentropic_table(gamma)` returns a cached
+`IsentropicTable` that inverts the same relations by monotone cubic
+interpolation of a dense per-gamma table.
+"""
+import logging
+import os
+from functools import lru_cache
+
+import numpy as np
+from scipy.interpolate import PchipInterpolator
+
+_TOL = 1e-14     # relative step size at which an element is converged
+_MAX_ITER = 60
+
+
+def _result(x):
+    return x if x.ndim else float(x)
+
+
+def _newton(fn, x, lo, hi, *params):
+    """
+    Solve fn(x, *params) = 0 element-wise by Halley's method, fn returning
+    (f, df, d2f) with f increasing in x. The root is kept bracketed in
+    [lo, hi]; a step leaving the bracket is replaced by bisection, so every
+    element converges. An element drops out once its step falls below _TOL
+    or stops shrinking at the rounding floor of f, so later passes only
+    touch the stragglers.
+    """
+    arrs = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (x, lo, hi) + params))
+    shape = arrs[0].shape
+    # Working copies hold the still-active elements only; root is the result
+    x, lo, hi, *params = (a.ravel().copy() for a in arrs)
+    root = x.copy()
+    active = np.arange(x.size)
+    last_step = np.full(x.size, np.inf)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for _ in range(_MAX_ITER):
+            f, df, d2f = fn(x, *params)
+            neg = f < 0
+            np.copyto(lo, x, where=neg)
+            np.copyto(hi, x, where=~neg)
+            s = f / df
+            corr = 1.0 - 0.5 * s * d2f / df
+            np.divide(s, corr, out=s, where=corr > 0.5)
+            x_new = x - s
+            out = ~((x_new >= lo) & (x_new <= hi))
+            if out.any():
+                x_new[out] = 0.5 * (lo[out] + hi[out])
+
+            step = np.abs(x_new - x)
+            scale = np.maximum(np.abs(x), 1.0)
+            stalled = (step >= 0.5 * last_step) & (step < 1e-8 * scale)
+            todo = (step > _TOL * scale) & (f != 0) & ~stalled
+            x, last_step = x_new, step
+            if todo.all():
+                continue
+            root[active] = x
+            active = active[todo]
+            if not active.size:
+                break
+            x, lo, hi, last_step = x[todo], lo[todo], hi[todo], last_step[todo]
+            params = [p[todo] for p in params]
+        else:
+            root[active] = x
+    return root.reshape(shape)
+
+
+def area_ratio(M, gamma):
+    """A/A* = (1/M)·[(2/(γ+1))·(1 + (γ−1)/2·M²)]^((γ+1)/(2(γ−1)))."""
+    M = np.asarray(M, dtype=float)
+    k = (gamma + 1) / (2 * (gamma - 1))
+    return _result((1.0 / M) * ((2.0 / (gamma + 1)) * (1.0 + 0.5 * (gamma - 1) * M**2))**k)
+
+
+def pressure_ratio(M, gamma):
+    """Static-to-total pressure ratio p/p0."""
+    M = np.asarray(M, dtype=float)
+    return _result((1.0 + 0.5 * (gamma - 1) * M**2)**(-gamma / (gamma - 1)))
+
+
+def temperature_ratio(M, gamma):
+    """Static-to-total temperature ratio T/T0."""
+    M = np.asarray(M, dtype=float)
+    return _result(1.0 / (1.0 + 0.5 * (gamma - 1) * M**2))
+
+
+def prandtl_meyer(M, gamma):
+    """
+    Prandtl–Meyer function ν(M) [radians].
+    ν(M) = sqrt((γ+1)/(γ−1)) * arctan( sqrt((γ−1)/(γ+1)*(M^2−1)) )
+           − arctan( sqrt(M^2 −1) )
+    """
+    M = np.asarray(M, dtype=float)
+    term1 = np.sqrt((gamma + 1) / (gamma - 1))
+    nu = term1 * np.arctan(np.sqrt((gamma - 1) / (gamma + 1) * (M**2 - 1))) \
+        - np.arctan(np.sqrt(M**2 - 1))
+    return _result(nu)
+
+
+def mach_from_pressure_ratio(p_ratio, gamma):
+    """
+    Mach number from the static-to-total pressure ratio p/p0.
+    The isentropic relation inverts in closed form, so no iteration is needed.
+    """
+    p_ratio = np.asarray(p_ratio, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        M = np.sqrt(2.0 / (gamma - 1) * (p_ratio**(-(gamma - 1) / gamma) - 1.0))
+    return _result(M)
+
+
+def mach_from_area_ratio(AR, gamma, supersonic=True):
+    """
+    Solve A/A* = AR for the supersonic (default) or subsonic Mach number.
+
+    Halley runs on ln(A/A*) against u = ln M, whose derivative is
+    (M²−1)/(1 + (γ−1)/2·M²). Both branches are convex in u, and the starting
+    points come from the near-sonic expansion ln(A/A*) ≈ 2/(γ+1)·(M−1)² and
+    the small-M limit A/A* ≈ (2/(γ+1))^k / M. AR ≤ 1 gives M = 1.
+    """
+    AR = np.asarray(AR, dtype=float)
+    gamma = np.asarray(gamma, dtype=float)
+    k = (gamma + 1) / (2 * (gamma - 1))
+    log_ar = np.log(np.maximum(AR, 1.0))
+    c = k * np.log(2.0 / (gamma + 1))   # ln(A/A*) = -u + k·ln(X) + c
+    sign = 1.0 if supersonic else -1.0  # the subsonic branch decreases in u
+
+    def fn(u, gamma, k, c, log_ar):
+        M2 = np.exp(2 * u)
+        X = 1.0 + 0.5 * (gamma - 1) * M2
+        return (sign * (-u + k * np.log(X) + c - log_ar),
+                sign * (M2 - 1.0) / X,
+                sign * (gamma + 1) * M2 / X**2)
+
+    if supersonic:
+        # Upper bound from A/A* ≥ (2/(γ+1))^k ((γ−1)/2)^k M^(2k−1)
+        hi = (log_ar - c - k * np.log(0.5 * (gamma - 1))) / (2 * k - 1)
+        u0 = np.log1p(np.sqrt(0.5 * (gamma + 1) * log_ar))
+        u = _newton(fn, np.minimum(u0, hi), 0.0, hi, gamma, k, c, log_ar)
+    else:
+        lo = c - log_ar        # small-M limit, a lower bound on M
+        u = _newton(fn, lo, lo, 0.0, gamma, k, c, log_ar)
+    M = np.where(AR <= 1.0, 1.0, np.exp(u))
+    return _result(M)
+
+
+def inverse_prandtl_meyer(nu, gamma):
+    """
+    Invert ν(M) = nu → M for 0 ≤ nu < ν_max = (sqrt((γ+1)/(γ−1)) − 1)·π/2.
+
+    Halley runs on β = sqrt(M²−1), starting from the small-angle expansion
+    ν ≈ 2/(3(γ+1))·β³ or, closer to ν_max, from ν ≈ ν_max − (a−1)/β with
+    a = (γ+1)/(γ−1). nu ≤ 0 gives M = 1 and nu ≥ ν_max gives NaN.
+    """
+    nu = np.asarray(nu, dtype=float)
+    gamma = np.asarray(gamma, dtype=float)
+    a = (gamma + 1) / (gamma - 1)
+    sa = np.sqrt(a)
+    nu_max = (sa - 1.0) * np.pi / 2
+    nu_c = np.clip(nu, 0.0, nu_max)
+
+    def fn(b, a, sa, nu):
+        b2 = b * b
+        q = 1.0 - 1.0 / a
+        D = (1.0 + b2 / a) * (1.0 + b2)
+        f = sa * np.arctan(b / sa) - np.arctan(b) - nu
+        return f, q * b2 / D, 2.0 * q * b * (1.0 - b2 * b2 / a) / D**2
+
+    with np.errstate(divide='ignore'):
+        b_small = np.cbrt(1.5 * (gamma + 1) * nu_c)
+        b_large = (a - 1.0) / (nu_max - nu_c)
+    b0 = np.maximum(b_small, np.where(nu_c > 0.5 * nu_max, b_large, 0.0))
+    # arctan saturates long before β = 1e12, so the bracket holds every root
+    b = _newton(fn, np.minimum(b0, 1e12), 0.0, 1e12, a, sa, nu_c)
+    M = np.sqrt(1.0 + b * b)
+    M = np.where(nu <= 0.0, 1.0, M)
+    M = np.where(nu >= nu_max, np.nan, M)
+    return _result(M)
+
+
+# Dense tables over TABLE_MACH_RANGE, half the nodes on each side of M = 1
+TABLE_SIZE = 4096
+TABLE_MACH_RANGE = (0.01, 50.0)
+TABLE_CACHE_SIZE = 16     # tables kept in memory, least recently used dropped
+TABLE_VERSION = 1         # bump when the table layout changes
+
+
+class IsentropicTable:
+    """
+    Table of M → (ν, A/A*, p/p0, T/T0) for one gamma. A/A* and ν are
+    inverted by monotone cubic (PCHIP) interpolation of ln M against keys
+    that are smooth in M, sign(M−1)·sqrt(ln A/A*) and ν^(1/3), to about 1e-8
+    in M. Queries outside the table fall back to the exact solvers, and p/p0
+    inverts in closed form.
+    """
+
+    def __init__(self, gamma, size=TABLE_SIZE, mach_range=TABLE_MACH_RANGE, columns=None):
+        self.gamma = float(gamma)
+        if columns is None:
+            lo, hi = mach_range
+            # Supersonic nodes uniform in w with β = sinh(w): uniform in β near
+            # M = 1, where ν^(1/3) ∝ β, and uniform in ln M further out
+            w = np.linspace(0.0, np.arcsinh(np.sqrt(hi**2 - 1.0)), size - size // 2)
+            M = np.concatenate([np.geomspace(lo, 1.0, size // 2, endpoint=False),
+                                np.sqrt(1.0 + np.sinh(w)**2)])
+            columns = {
+                "M":    M,
+                "nu":   np.where(M >= 1.0, prandtl_meyer(np.maximum(M, 1.0), self.gamma), 0.0),
+                "area": area_ratio(M, self.gamma),
+                "p":    pressure_ratio(M, self.gamma),
+                "T":    temperature_ratio(M, self.gamma),
+            }
+        self.columns = columns
+
+        M = columns["M"]
+        log_m = np.log(M)
+        sup = M >= 1.0
+        # Rounding leaves A/A* just below 1 next to M = 1: clamp ln A/A* at 0,
+        # pin the sonic node to 0 and keep only strictly increasing keys, so
+        # the nodes collapsed onto 0 by the clamp are dropped
+        s = np.sign(M - 1.0) * np.sqrt(np.maximum(np.log(columns["area"]), 0.0))
+        s[M == 1.0] = 0.0
+        keep = (s != 0.0) | (M == 1.0)
+        keep[keep] = s[keep] > np.concatenate(([-np.inf], np.maximum.accumulate(s[keep])[:-1]))
+        self._area = PchipInterpolator(s[keep], log_m[keep], extrapolate=False)
+        self._nu = PchipInterpolator(np.cbrt(columns["nu"][sup]), log_m[sup], extrapolate=False)
+
+    @staticmethod
+    def _lookup(interp, key, fallback):
+        """exp(interp(key)), computing the entries outside the table with fallback."""
+        log_m = interp(key)
+        out = np.isnan(log_m)
+        M = np.exp(log_m)
+        if out.any():
+            M[out] = fallback(out)
+        return M
+
+    def mach_from_area_ratio(self, AR, supersonic=True):
+        """Table counterpart of the module-level `mach_from_area_ratio`."""
+        AR = np.asarray(AR, dtype=float)
+        flat = AR.ravel()
+        s = np.sqrt(np.log(np.maximum(flat, 1.0)))
+        M = self._lookup(self._area, s if supersonic else -s,
+                         lambda out: mach_from_area_ratio(flat[out], self.gamma, supersonic))
+        M[flat <= 1.0] = 1.0
+        return _result(M.reshape(AR.shape))
+
+    def inverse_prandtl_meyer(self, nu):
+        """Table counterpart of the module-level `inverse_prandtl_meyer`."""
+        nu = np.asarray(nu, dtype=float)
+        flat = nu.ravel()
+        M = self._lookup(self._nu, np.cbrt(np.maximum(flat, 0.0)),
+                         lambda out: inverse_prandtl_meyer(flat[out], self.gamma))
+        M[flat <= 0.0] = 1.0
+        return _result(M.reshape(nu.shape))
+
+    def mach_from_pressure_ratio(self, p_ratio):
+        return mach_from_pressure_ratio(p_ratio, self.gamma)
+
+    def save(self, path):
+        """Write the table columns to an .npz file."""
+        tmp = path + ".tmp.npz"
+        np.savez(tmp, gamma=self.gamma, **self.columns)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        """Rebuild a table from a file written by save()."""
+        with np.load(path) as data:
+            columns = {k: data[k] for k in ("M", "nu", "area", "p", "T")}
+            return cls(float(data["gamma"]), columns=columns)
+
+
+def _table_path(gamma):
+    # Imported here: the cache module reads the user config on import
+    from cache import CACHE_DIR
+    return os.path.join(CACHE_DIR, "isentropic",
+                        f"g{gamma!r}_n{TABLE_SIZE}_v{TABLE_VERSION}.npz")
+
+
+@lru_cache(maxsize=TABLE_CACHE_SIZE)
+def isentropic_table(gamma, persist=False):
+    """
+    Return the IsentropicTable for gamma, built once and kept in an LRU cache.
+    With persist=True the table is also read from / written to the on-disk
+    cache directory, so later sessions skip building it.
+    """
+    gamma = float(gamma)
+    if not persist:
+        return IsentropicTable(gamma)
+    path = _table_path(gamma)
+    try:
+        if os.path.exists(path):
+            return IsentropicTable.load(path)
+    except Exception:
+        logging.exception("Error reading isentropic table")
+    table = IsentropicTable(gamma)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        table.save(path)
+    except Exception:
+        logging.exception("Error writing isentropic table")
+    return table
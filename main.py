@@ -6,7 +6,9 @@ def main():
     app = QApplication(sys.argv)
     win = MainWindow()
     win.show()
-    if len(sys.argv) > 1:
+    if len(sys.argv) > 2:
+        win.open_files(sys.argv[1:])
+    elif len(sys.argv) > 1:
         win.open_file(sys.argv[1])
     sys.exit(app.exec_())
 
@@ -1,40 +1,11 @@
 import numpy as np
-from scipy.optimize import fsolve
+from scipy.optimize import brentq
+# The isentropic relations live in isentropic.py; they are re-exported here
+# for the nozzle module and existing callers.
+from isentropic import prandtl_meyer, inverse_prandtl_meyer, mach_from_area_ratio, \
+    pressure_ratio, isentropic_table
 
-def prandtl_meyer(M, gamma):
-    """
-    Compute the Prandtl–Meyer function ν(M) [radians].
-    ν(M) = sqrt((γ+1)/(γ−1)) * arctan( sqrt((γ−1)/(γ+1)*(M^2−1)) )
-           − arctan( sqrt(M^2 −1) )
-    """
-    term1 = np.sqrt((gamma+1)/(gamma-1))
-    nu = term1 * np.arctan(np.sqrt((gamma-1)/(gamma+1)*(M**2 - 1))) \
-         - np.arctan(np.sqrt(M**2 - 1))
-    return nu
-
-def inverse_prandtl_meyer(nu_target, gamma):
-    """
-    Invert ν(M) = nu_target → M via a root-finder.
-    """
-    fn = lambda M: prandtl_meyer(M, gamma) - nu_target
-    # initial guess: if nu small, M≈1. else M≈2
-    M0 = 1.0 + nu_target/np.pi  
-    M, = fsolve(fn, M0)
-    return float(M)
-
-def mach_from_area_ratio(AR, gamma):
-    """
-    Solve A/A* = AR for supersonic Mach M > 1:
-    A/A* = (1/M)*[ (2/(γ+1))*(1 + (γ−1)/2*M^2 ) ]^[(γ+1)/(2(γ−1)) ]
-    """
-    def area_eq(M):
-        left = (1.0/M) * ( (2.0/(gamma+1))*(1.0 + 0.5*(gamma-1)*M**2) )**((gamma+1)/(2*(gamma-1)))
-        return left - AR
-
-    M_exit, = fsolve(area_eq, 2.0)  # start guess M=2
-    return float(M_exit)
-
-def generate_moc_contour(area_ratio, gamma, N=25, R_throat=1.0):
+def generate_moc_contour(area_ratio, gamma, N=25, R_throat=1.0, use_table=False):
     """
     Compute a Method-of-Characteristics wall contour for an axisymmetric nozzle.
 
@@ -48,6 +19,9 @@ def generate_moc_contour(area_ratio, gamma, N=25, R_throat=1.0):
         Number of characteristic “fan” lines (including the throat and exit).
     R_throat : float
         Physical throat radius (meters or any length unit).
+    use_table : bool
+        Invert through the cached per-gamma `isentropic_table` instead of the
+        exact solvers, for interactive redraws.
 
     Returns
     -------
@@ -57,7 +31,9 @@ def generate_moc_contour(area_ratio, gamma, N=25, R_throat=1.0):
         and ending at the exit lip.
     """
     # 1) find exit Mach from area_ratio
-    M_exit = mach_from_area_ratio(area_ratio, gamma)
+    table = isentropic_table(gamma) if use_table else None
+    M_exit = (table.mach_from_area_ratio(area_ratio) if use_table
+              else mach_from_area_ratio(area_ratio, gamma))
 
     # 2) Prandtl-Meyer at exit
     nu_exit = prandtl_meyer(M_exit, gamma)
@@ -70,7 +46,8 @@ def generate_moc_contour(area_ratio, gamma, N=25, R_throat=1.0):
 
     # 5) for each turning angle, find the local Mach M_i
     nu_i = 2.0 * theta
-    M_i = np.array([inverse_prandtl_meyer(nu, gamma) for nu in nu_i])
+    M_i = (table.inverse_prandtl_meyer(nu_i) if use_table
+           else inverse_prandtl_meyer(nu_i, gamma))
 
     # 6) Mach‐angle μ_i = arcsin(1/M_i)
     mu_i = np.arcsin(1.0 / M_i)
@@ -80,19 +57,340 @@ def generate_moc_contour(area_ratio, gamma, N=25, R_throat=1.0):
     #    Δs_i = R_throat * (θ_i − θ_{i−1}) / tan(μ_i)
     #    then x_i = x_{i−1} + Δs_i * cos(θ_i)
     #         r_i = r_{i−1} + Δs_i * sin(θ_i)
-    x_wall = np.zeros(N)
-    r_wall = np.zeros(N)
-    x_wall[0] = 0.0
-    r_wall[0] = R_throat
-
-    for i in range(1, N):
-        dtheta = theta[i] - theta[i-1]
-        ds = R_throat * dtheta / np.tan(mu_i[i])
-        x_wall[i] = x_wall[i-1] + ds * np.cos(theta[i])
-        r_wall[i] = r_wall[i-1] + ds * np.sin(theta[i])
+    #    i.e. cumulative sums of the steps from the throat (0, R_throat)
+    ds = R_throat * np.diff(theta) / np.tan(mu_i[1:])
+    x_wall = np.concatenate(([0.0], np.cumsum(ds * np.cos(theta[1:]))))
+    r_wall = R_throat + np.concatenate(([0.0], np.cumsum(ds * np.sin(theta[1:]))))
 
     return x_wall, r_wall
 
+def _mach_angle(nu, invert):
+    """Mach number and Mach angle for an array of Prandtl-Meyer angles."""
+    M = invert(nu)
+    return M, np.arcsin(1.0 / M)
+
+def _source_minus(theta, mu, r):
+    """Axisymmetric term of the C- compatibility relation, d(θ+ν)/dx."""
+    return np.sin(mu) * np.sin(theta) / (r * np.cos(theta - mu))
+
+def _source_plus(theta, mu, r):
+    """Axisymmetric term of the C+ compatibility relation, -d(θ−ν)/dx."""
+    return np.sin(mu) * np.sin(theta) / (r * np.cos(theta + mu))
+
+def _interior_points(p1, p2, invert, n_corr):
+    """
+    Interior unit process: the node where the C- characteristic through p1
+    meets the C+ characteristic through p2. Each point is a tuple
+    (x, r, θ, ν, μ) of equal-length arrays. The predictor takes slopes and
+    source terms at the upstream points; each of the n_corr corrector passes
+    re-evaluates them at the mean state of every characteristic segment.
+    """
+    x1, r1, t1, n1, m1 = p1
+    x2, r2, t2, n2, m2 = p2
+    lm, lp = np.tan(t1 - m1), np.tan(t2 + m2)
+    # The source term is indeterminate on the axis; a C+ leaving it
+    # starts with none
+    on_axis = r2 == 0.0
+    qm = _source_minus(t1, m1, r1)
+    qp = np.where(on_axis, 0.0, _source_plus(t2, m2, np.where(on_axis, 1.0, r2)))
+    for it in range(n_corr + 1):
+        x3 = (r2 - r1 + lm * x1 - lp * x2) / (lm - lp)
+        r3 = r1 + lm * (x3 - x1)
+        km = t1 + n1 + qm * (x3 - x1)
+        kp = t2 - n2 - qp * (x3 - x2)
+        t3, n3 = 0.5 * (km + kp), 0.5 * (km - kp)
+        M3, m3 = _mach_angle(n3, invert)
+        if it < n_corr:
+            ta, ma, ra = 0.5 * (t1 + t3), 0.5 * (m1 + m3), 0.5 * (r1 + r3)
+            tb, mb, rb = 0.5 * (t2 + t3), 0.5 * (m2 + m3), 0.5 * (r2 + r3)
+            lm, lp = np.tan(ta - ma), np.tan(tb + mb)
+            qm, qp = _source_minus(ta, ma, ra), _source_plus(tb, mb, rb)
+    return x3, r3, t3, n3, m3, M3
+
+def _axis_point(p1, invert, n_corr):
+    """
+    Axis unit process: the C- characteristic through p1 meets the centreline,
+    where θ = 0 and r = 0. Corrector passes use the mean state of the
+    segment, as for interior points.
+    """
+    x1, r1, t1, n1, m1 = p1
+    lm = np.tan(t1 - m1)
+    qm = _source_minus(t1, m1, r1)
+    for it in range(n_corr + 1):
+        x3 = x1 - r1 / lm
+        n3 = t1 + n1 + qm * (x3 - x1)
+        M3, m3 = _mach_angle(n3, invert)
+        if it < n_corr:
+            ta, ma = 0.5 * t1, 0.5 * (m1 + m3)
+            lm = np.tan(ta - ma)
+            qm = _source_minus(ta, ma, 0.5 * r1)
+    return x3, 0.0, 0.0, n3, m3, M3
+
+def _characteristic_net(theta_max, N, invert, n_corr):
+    """
+    March the kernel of a sharp-corner minimum-length nozzle for a given
+    corner turning angle, R_throat = 1.
+
+    Node (k, j) is the crossing of the k-th C- characteristic of the corner
+    fan with the C+ characteristic reflected from the axis by the j-th one,
+    so the net fills the lower triangle j <= k and the axis nodes sit on the
+    diagonal. Both upstream neighbours of a node lie on the previous
+    anti-diagonal k + j - 1, so each anti-diagonal is solved as one array
+    operation.
+    """
+    # Corner fan: centred Prandtl-Meyer expansion from the sonic throat, ν = θ
+    t_c = theta_max * np.arange(1, N + 1) / N
+    _, m_c = _mach_angle(t_c, invert)
+    zero, one = np.zeros(N), np.ones(N)
+    corner = (zero, one, t_c, t_c, m_c)
+
+    net = {k: np.full((N, N), np.nan) for k in ("x", "r", "theta", "nu", "mu", "M")}
+    fields = ("x", "r", "theta", "nu", "mu")
+    for d in range(2 * N - 1):
+        j = np.arange(max(0, d - N + 1), d // 2 + 1)
+        k = d - j
+        axis = j == k
+        ki, ji = k[~axis], j[~axis]
+        if ki.size:
+            # Upstream along C-: the previous node, or the corner itself for j = 0
+            first = ji == 0
+            jm = np.maximum(ji - 1, 0)
+            p1 = tuple(np.where(first, c[ki], net[f][ki, jm]) for f, c in zip(fields, corner))
+            p2 = tuple(net[f][ki - 1, ji] for f in fields)
+            for f, v in zip(fields + ("M",), _interior_points(p1, p2, invert, n_corr)):
+                net[f][ki, ji] = v
+        if axis.any():
+            a = k[axis][0]
+            if a == 0:
+                p1 = tuple(c[0] for c in corner)
+            else:
+                p1 = tuple(net[f][a, a - 1] for f in fields)
+            for f, v in zip(fields + ("M",), _axis_point(p1, invert, n_corr)):
+                net[f][a, a] = v
+    return net
+
+def _turning_region(net, theta_max, M_exit, nu_exit, r_lip, invert, n_corr):
+    """
+    March the turning region between the last corner C- characteristic and
+    the exit C+ characteristic, on which the flow is uniform at M_exit and
+    parallel to the axis.
+
+    Row 0 holds the last C- of the kernel, led by the throat corner; column
+    -1 holds the exit characteristic, split into equal radial steps up to
+    r_lip. Node (i, j) is the crossing of the C+ characteristic through
+    row-0 node j with the C- characteristic through exit node i, so both of
+    its upstream neighbours lie on the previous diagonal i - j.
+    """
+    N = net["x"].shape[0]
+    n_exit = N
+    shape = (n_exit + 1, N + 1)
+    turn = {k: np.full(shape, np.nan) for k in ("x", "r", "theta", "nu", "mu", "M")}
+    # Row 0: throat corner, then the last kernel C- down to the axis
+    row = {k: net[k][-1] for k in turn}
+    for k, c in zip(("x", "r", "theta", "nu"), (0.0, 1.0, theta_max, theta_max)):
+        turn[k][0, 0] = c
+    turn["M"][0, 0], turn["mu"][0, 0] = _mach_angle(theta_max, invert)
+    for k in turn:
+        turn[k][0, 1:] = row[k]
+    # Exit characteristic: straight, uniform and axial
+    mu_e = np.arcsin(1.0 / M_exit)
+    r_e = r_lip * np.arange(n_exit + 1) / n_exit
+    turn["x"][:, -1] = net["x"][-1, -1] + r_e / np.tan(mu_e)
+    turn["r"][:, -1] = r_e
+    turn["theta"][:, -1] = 0.0
+    turn["nu"][:, -1] = nu_exit
+    turn["mu"][:, -1] = mu_e
+    turn["M"][:, -1] = M_exit
+
+    fields = ("x", "r", "theta", "nu", "mu")
+    for d in range(1, n_exit + N + 1):
+        i = np.arange(max(1, d - N + 1), min(d, n_exit) + 1)
+        j = N - d + i - 1
+        p1 = tuple(turn[f][i, j + 1] for f in fields)
+        p2 = tuple(turn[f][i - 1, j] for f in fields)
+        for f, v in zip(fields + ("M",), _interior_points(p1, p2, invert, n_corr)):
+            turn[f][i, j] = v
+    return turn
+
+def _wall_points(turn, gamma):
+    """
+    Wall unit process: the wall is the streamline through the throat corner,
+    placed on every C- characteristic of the turning region where the mass
+    flow from the axis equals the throat mass flow. The flux across a
+    characteristic is ρ·a·2πr per unit length, since the velocity meets it
+    at the Mach angle. Nodes beyond the wall are blanked in turn. Also
+    returns the relative mass-flow defect across row 0, axis to corner.
+    """
+    def flux(M):
+        # ρ/ρ0 · a/a0
+        t = 1.0 / (1.0 + 0.5 * (gamma - 1.0) * M**2)
+        return t ** (1.0 / (gamma - 1.0) + 0.5)
+
+    m_throat = flux(1.0)                                   # per π R*²
+    M_e = turn["M"][0, -1]
+    # From the axis out along the exit characteristic...
+    m0 = flux(M_e) * M_e * turn["r"][:, -1] ** 2
+    # ...then back up each C- characteristic toward the corner
+    x, r, q = turn["x"][:, ::-1], turn["r"][:, ::-1], flux(turn["M"][:, ::-1]) * turn["r"][:, ::-1]
+    ds = np.hypot(np.diff(x, axis=1), np.diff(r, axis=1))
+    m = np.concatenate((m0[:, None], m0[:, None] + np.cumsum((q[:, 1:] + q[:, :-1]) * ds, axis=1)),
+                       axis=1)
+    n_exit = m.shape[0] - 1
+    x_w, r_w, t_w = np.zeros(n_exit + 1), np.ones(n_exit + 1), np.zeros(n_exit + 1)
+    t_w[0] = turn["theta"][0, 0]
+    t = turn["theta"][:, ::-1]
+    for i in range(1, n_exit + 1):
+        k = min(np.searchsorted(m[i], m_throat), m.shape[1] - 1)
+        if k == 0:
+            x_w[i], r_w[i], t_w[i] = x[i, 0], r[i, 0], t[i, 0]
+        else:
+            w = (m_throat - m[i, k - 1]) / (m[i, k] - m[i, k - 1])
+            x_w[i], r_w[i], t_w[i] = (a[i, k - 1] + w * (a[i, k] - a[i, k - 1]) for a in (x, r, t))
+        outside = turn["x"].shape[1] - max(k, 1)
+        for f in turn:
+            turn[f][i, :outside] = np.nan
+    return x_w, r_w, t_w, m[0, -1] / m_throat - 1.0
+
+def solve_moc_mesh(area_ratio, gamma, N=50, R_throat=1.0, use_table=False,
+                   n_corr=1, tol=1e-10, max_iter=60):
+    """
+    Solve the full characteristic net of an axisymmetric minimum-length
+    (sharp-corner) nozzle: the kernel between the corner fan and the axis,
+    and the turning region that cancels every reflected wave at the wall.
+
+    The flow is uniform and sonic on a straight throat, expands through N
+    C- characteristics centred on the throat corner, and leaves on the final
+    C+ characteristic uniform and parallel at the exit Mach number of
+    area_ratio. The corner angle θ_max is bracketed below the angle at which
+    the axis Prandtl-Meyer angle overshoots ν_max, then solved by Brent's
+    method so that M_exit falls on the last axis node.
+
+    Parameters
+    ----------
+    area_ratio : float
+        Exit area A_e / throat area A*.
+    gamma : float
+        Specific-heat ratio of the gas.
+    N : int
+        Number of characteristics in the corner fan; the net has
+        N(N+1)/2 kernel nodes and N wall nodes.
+    R_throat : float
+        Physical throat radius; all lengths are scaled by it.
+    use_table : bool
+        Invert through the cached per-gamma `isentropic_table` instead of the
+        exact solvers, for interactive redraws.
+    n_corr : int
+        Corrector passes of each unit process.
+    tol : float
+        Tolerance on θ_max [rad].
+    max_iter : int
+        Maximum iterations of the bracketing and of the root solve.
+
+    Returns
+    -------
+    dict with keys
+        'x_wall', 'r_wall', 'theta_wall' : np.ndarray, shape (N+1,)
+            Wall contour and flow angle, from the throat corner to the lip;
+            the wall is the streamline carrying the throat mass flow.
+        'x', 'r', 'M', 'theta', 'p' : np.ndarray, 1-D
+            Flow field at every node inside the nozzle, kernel and turning
+            region together; 'p' is the static-to-stagnation ratio p/p0.
+        'kernel' : dict of np.ndarray, shape (N, N)
+            The same five fields on the kernel net; node [k, j] is the
+            crossing of the k-th corner C- characteristic with the j-th
+            C+ reflected from the axis, NaN for j > k.
+        'turning' : dict of np.ndarray, shape (N+1, N+1)
+            The same five fields on the turning-region net; row 0 is the
+            last kernel C- led by the corner, column -1 the exit
+            characteristic, NaN beyond the wall.
+        'theta_max' : float
+            Corner turning angle [rad].
+        'M_exit' : float
+            Design exit Mach number.
+        'area_ratio' : float
+            Exit area ratio of the computed contour.
+        'mass_error' : float
+            Relative mass-flow defect across the last kernel C-
+            characteristic, a measure of the net's discretisation error.
+
+    Raises
+    ------
+    ValueError
+        If area_ratio <= 1, θ_max cannot be bracketed or does not converge,
+        or the resulting net is not finite.
+    """
+    if area_ratio <= 1.0:
+        raise ValueError("area_ratio must be greater than 1")
+    table = isentropic_table(gamma) if use_table else None
+    if use_table:
+        M_exit = table.mach_from_area_ratio(area_ratio)
+        invert = table.inverse_prandtl_meyer
+    else:
+        M_exit = mach_from_area_ratio(area_ratio, gamma)
+        invert = lambda nu: inverse_prandtl_meyer(nu, gamma)
+    nu_exit = prandtl_meyer(M_exit, gamma)
+
+    def residual(theta_max):
+        net = _characteristic_net(theta_max, N, invert, n_corr)
+        return net["nu"][-1, -1] - nu_exit
+
+    # Bracket θ_max from the planar value ν_e/2: too large a corner turn
+    # drives ν on the axis past ν_max and the residual to NaN, so a NaN
+    # end bisects back towards the last angle that fell short
+    lo, nan_hi, t = 1e-6 * nu_exit, None, 0.5 * nu_exit
+    for _ in range(max_iter):
+        f = residual(t)
+        if np.isfinite(f) and f >= 0.0:
+            hi = t
+            break
+        if np.isfinite(f):
+            lo = t
+        else:
+            nan_hi = t
+        t = 0.5 * (lo + nan_hi) if nan_hi is not None else 2.0 * t
+    else:
+        raise ValueError(f"Could not bracket the corner angle for area_ratio={area_ratio}, "
+                         f"gamma={gamma}")
+    if not np.isfinite(residual(lo)):
+        raise ValueError(f"Characteristic net is not finite for area_ratio={area_ratio}, "
+                         f"gamma={gamma}")
+    try:
+        theta_max = brentq(residual, lo, hi, xtol=tol, maxiter=max_iter)
+    except RuntimeError as e:
+        raise ValueError(f"Corner angle did not converge: {e}") from None
+    net = _characteristic_net(theta_max, N, invert, n_corr)
+
+    r_lip = np.sqrt(area_ratio)
+    turn = _turning_region(net, theta_max, M_exit, nu_exit, r_lip, invert, n_corr)
+    x_w, r_w, t_w, mass_error = _wall_points(turn, gamma)
+
+    def region(g):
+        M = g["M"]
+        p = np.where(np.isnan(M), np.nan, pressure_ratio(np.nan_to_num(M, nan=1.0), gamma))
+        return {"x": g["x"] * R_throat, "r": g["r"] * R_throat, "M": M,
+                "theta": g["theta"], "p": p}
+
+    kernel, turning = region(net), region(turn)
+    # Flat field over every node inside the nozzle; the axis/exit nodes
+    # shared by both grids are taken from the kernel
+    inside = [~np.isnan(kernel["M"]), ~np.isnan(turning["M"])]
+    inside[1][0, 1:] = False
+    field = {k: np.concatenate([g[k][m] for g, m in zip((kernel, turning), inside)])
+             for k in kernel}
+    if not (np.isfinite(theta_max) and np.all(np.isfinite(x_w)) and np.all(np.isfinite(r_w))
+            and all(np.all(np.isfinite(v)) for v in field.values())):
+        raise ValueError(f"MOC solution is not finite for area_ratio={area_ratio}, gamma={gamma}")
+    return dict(field,
+                x_wall=x_w * R_throat,
+                r_wall=r_w * R_throat,
+                theta_wall=t_w,
+                kernel=kernel,
+                turning=turning,
+                theta_max=float(theta_max),
+                M_exit=float(M_exit),
+                area_ratio=float(r_w[-1] ** 2),
+                mass_error=float(mass_error))
+
 # Example usage:
 if __name__ == "__main__":
     # Design for A_e/A* = 8, gamma=1.2, 20 lines, throat radius 0.1 m
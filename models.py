@@ -1,27 +1,129 @@
-from PyQt5.QtCore import QAbstractTableModel, Qt
+from collections import OrderedDict
+
+import numpy as np
 import pandas as pd
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+FETCH_ROWS = 10_000      # rows made visible per fetchMore
+CACHE_BLOCK = 256        # rows formatted together
+CACHE_BLOCKS = 64        # formatted blocks kept, least recently used dropped
+DEFAULT_PRECISION = 6    # significant digits of float columns
 
 class PandasModel(QAbstractTableModel):
-    """A Qt model to display a pandas DataFrame."""
-    def __init__(self, df: pd.DataFrame = pd.DataFrame(), parent=None):
+    """
+    A Qt model to display a pandas DataFrame.
+
+    The model keeps the frame's column arrays as they are (no copy) and
+    formats cells only when the view asks for them, a block of rows at a
+    time, caching the strings of recently painted blocks. Rows are handed
+    to the view FETCH_ROWS at a time through canFetchMore/fetchMore, and
+    sorting permutes row indices with argsort instead of reordering data.
+    precision maps column names to significant digits for float columns.
+    """
+    def __init__(self, df: pd.DataFrame = pd.DataFrame(), parent=None, precision=None):
         super().__init__(parent)
-        self._df = df.copy()
+        self._headers = list(df.columns)
+        self._columns = [df[c].to_numpy() for c in self._headers]
+        self._precision = [(precision or {}).get(c, DEFAULT_PRECISION) for c in self._headers]
+        self._total = len(df)
+        self._loaded = min(self._total, FETCH_ROWS)
+        self._order = None      # view row -> source row, None while unsorted
+        self._sort_key = None   # (column, order) of the current sort
+        self._cache = OrderedDict()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
 
-    def rowCount(self, parent=None):
-        return len(self._df)
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < self._total
 
-    def columnCount(self, parent=None):
-        return len(self._df.columns)
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        extra = min(FETCH_ROWS, self._total - self._loaded)
+        if extra <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + extra - 1)
+        self._loaded += extra
+        self.endInsertRows()
+
+    def source_row(self, row):
+        """Position in the displayed frame of view row row."""
+        return int(self._order[row]) if self._order is not None else row
 
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         if role == Qt.DisplayRole:
             if orientation == Qt.Horizontal:
-                return self._df.columns[section]
+                return self._headers[section]
             else:
-                return section
+                return self.source_row(section)
         return None
 
     def data(self, index, role=Qt.DisplayRole):
         if index.isValid() and role == Qt.DisplayRole:
-            return str(self._df.iat[index.row(), index.column()])
+            row = index.row()
+            return self._block(row // CACHE_BLOCK)[index.column()][row % CACHE_BLOCK]
         return None
+
+    def _block(self, block):
+        """Formatted strings of every column for the rows of block."""
+        cells = self._cache.get(block)
+        if cells is not None:
+            self._cache.move_to_end(block)
+            return cells
+        start = block * CACHE_BLOCK
+        stop = min(start + CACHE_BLOCK, self._total)
+        rows = self._order[start:stop] if self._order is not None else slice(start, stop)
+        cells = [self._format(vals[rows], digits)
+                 for vals, digits in zip(self._columns, self._precision)]
+        self._cache[block] = cells
+        if len(self._cache) > CACHE_BLOCKS:
+            self._cache.popitem(last=False)
+        return cells
+
+    @staticmethod
+    def _format(vals, digits):
+        if vals.dtype.kind == 'f':
+            return [f"{v:.{digits}g}" for v in vals.tolist()]
+        return [str(v) for v in vals.tolist()]
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Order the view by column through an argsort permutation; column < 0 restores the frame order."""
+        self.layoutAboutToBeChanged.emit()
+        if column < 0 or column >= len(self._columns):
+            self._order = self._sort_key = None
+        else:
+            self._sort_key = (column, order)
+            vals = self._columns[column]
+            try:
+                perm = np.argsort(vals, kind="stable")
+            except TypeError:
+                # Mixed objects: order by their text
+                perm = np.argsort(vals.astype(str), kind="stable")
+            self._order = perm[::-1] if order == Qt.DescendingOrder else perm
+        self._cache.clear()
+        self.layoutChanged.emit()
+
+    def append(self, df: pd.DataFrame):
+        """Append rows in place so attached views update incrementally."""
+        if df.empty:
+            return
+        df = df.reindex(columns=self._headers)
+        first = self._total
+        self._columns = [np.concatenate((vals, df[c].to_numpy()))
+                         for vals, c in zip(self._columns, self._headers)]
+        self._total += len(df)
+        # Only the last, possibly partial block may hold stale rows
+        self._cache.pop(first // CACHE_BLOCK, None)
+        if self._sort_key is not None:
+            # Keep the view sorted: the new rows land where they belong
+            self.sort(*self._sort_key)
+        if self._loaded == first:
+            # Everything was on show, so the new rows are too
+            loaded = min(self._total, first + FETCH_ROWS)
+            self.beginInsertRows(QModelIndex(), first, loaded - 1)
+            self._loaded = loaded
+            self.endInsertRows()
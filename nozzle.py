@@ -14,13 +14,41 @@ based on CEA data. It implements multiple nozzle design approaches:
 Author: CEA Analyzer Team
 """
 
+from functools import lru_cache
+
 import numpy as np
 from scipy.optimize import fsolve, minimize
 from scipy.interpolate import interp1d
 import matplotlib.pyplot as plt
 from moc import prandtl_meyer, inverse_prandtl_meyer, mach_from_area_ratio
+from isentropic import isentropic_table
+
+# Normalised contours kept by nozzle_contour, least recently used dropped
+CONTOUR_CACHE_SIZE = 64
+
+def design_inputs(cea_data):
+    """Return (gamma, area_ratio) of a CEA data dict, with the usual fallbacks."""
+    gamma = cea_data.get('gamma', 1.2)  # Default to 1.2 if not available
+    if 'gamma' not in cea_data:
+        # CEA data typically provides gamma as specific heat ratio
+        if 'GAMMAs' in cea_data:
+            gamma = cea_data['GAMMAs']
+        elif not np.isnan(cea_data.get('Gamma_throat', np.nan)):
+            # Full-property parse
+            gamma = cea_data['Gamma_throat']
+    
+    # Get area ratio (exit area / throat area)
+    area_ratio = cea_data.get('Ae/At', 8.0)
+    if 'Ae/At' not in cea_data and not np.isnan(cea_data.get('AeAt_exit', np.nan)):
+        area_ratio = cea_data['AeAt_exit']
+    return gamma, area_ratio
 
-def get_throat_properties(cea_data):
+def _enforce_expansion(r):
+    """Clamp r to its running maximum, capped at the exit radius, so the
+    divergent contour never narrows."""
+    return np.minimum(np.maximum.accumulate(r), r[-1])
+
+def get_throat_properties(cea_data, use_table=False):
     """
     Extract relevant throat properties from CEA data.
     
@@ -28,6 +56,9 @@ def get_throat_properties(cea_data):
     ----------
     cea_data : dict or pandas.Series
         CEA data containing at minimum: gamma, Pc, area_ratio
+    use_table : bool, optional
+        Invert the area ratio with the cached per-gamma isentropic table
+        instead of the exact solver (faster for interactive use)
         
     Returns
     -------
@@ -38,23 +69,19 @@ def get_throat_properties(cea_data):
         cea_data = cea_data.to_dict()
     
     # Extract or calculate throat properties
-    gamma = cea_data.get('gamma', 1.2)  # Default to 1.2 if not available
-    if 'gamma' not in cea_data:
-        # CEA data typically provides gamma as specific heat ratio
-        if 'GAMMAs' in cea_data:
-            gamma = cea_data['GAMMAs']
+    gamma, area_ratio = design_inputs(cea_data)
     
     # Get chamber pressure in Pa
     p_c = cea_data.get('Pc (bar)', 50) * 1e5  # Convert bar to Pa
     
-    # Get area ratio (exit area / throat area)
-    area_ratio = cea_data.get('Ae/At', 8.0)
-    
     # Temperature at chamber
     t_c = cea_data.get('T_chamber (K)', 3500)
     
     # Calculate exit Mach number from area ratio
-    m_exit = mach_from_area_ratio(area_ratio, gamma)
+    if use_table:
+        m_exit = isentropic_table(gamma).mach_from_area_ratio(area_ratio)
+    else:
+        m_exit = mach_from_area_ratio(area_ratio, gamma)
     
     # Return dictionary of properties
     return {
@@ -65,7 +92,7 @@ def get_throat_properties(cea_data):
         'm_exit': m_exit
     }
 
-def conical_nozzle(cea_data, half_angle=15, R_throat=None, N=100):
+def conical_nozzle(cea_data, half_angle=15, R_throat=None, N=100, use_table=False):
     """
     Generate a conical nozzle contour following standard aerospace engineering practices.
     
@@ -84,6 +111,8 @@ def conical_nozzle(cea_data, half_angle=15, R_throat=None, N=100):
         Throat radius in meters, if None it will be calculated from CEA data
     N : int, optional
         Number of points to generate for the contour
+    use_table : bool, optional
+        Use the cached isentropic tables for the Mach inversions
         
     Returns
     -------
@@ -91,7 +120,7 @@ def conical_nozzle(cea_data, half_angle=15, R_throat=None, N=100):
         (x_coordinates, r_coordinates) for the nozzle contour
     """
     # Extract area ratio from CEA data
-    props = get_throat_properties(cea_data)
+    props = get_throat_properties(cea_data, use_table)
     area_ratio = props['area_ratio']
     
     # Calculate throat radius if not provided
@@ -111,21 +140,16 @@ def conical_nozzle(cea_data, half_angle=15, R_throat=None, N=100):
     # Simple straight-line conical nozzle
     # Generate a straight line from throat to exit with proper half-angle
     x = np.linspace(0, L_nozzle, N)
-    r = np.zeros(N)
-    
-    # Set throat radius at x=0
-    r[0] = R_throat
     
     # Create a pure conical expansion with the correct half-angle
-    for i in range(1, N):
-        r[i] = R_throat + x[i] * np.tan(half_angle_rad)
+    r = R_throat + x * np.tan(half_angle_rad)
     
     # Ensure exit radius exactly matches the required area ratio
     r[-1] = R_exit
     
     return x, r
 
-def rao_optimum_nozzle(cea_data, R_throat=None, N=100, theta_n=30, theta_e=7):
+def rao_optimum_nozzle(cea_data, R_throat=None, N=100, theta_n=30, theta_e=7, use_table=False):
     """
     Generate a Rao Thrust-Optimized Parabolic (TOP) nozzle contour.
     
@@ -150,6 +174,8 @@ def rao_optimum_nozzle(cea_data, R_throat=None, N=100, theta_n=30, theta_e=7):
     theta_e : float, optional
         Exit wall angle in degrees, default 7°
         Typical values range from 5° to 15°
+    use_table : bool, optional
+        Use the cached isentropic tables for the Mach inversions
         
     Returns
     -------
@@ -157,7 +183,7 @@ def rao_optimum_nozzle(cea_data, R_throat=None, N=100, theta_n=30, theta_e=7):
         (x_coordinates, r_coordinates) for the nozzle contour
     """
     # Extract area ratio and calculate throat radius
-    props = get_throat_properties(cea_data)
+    props = get_throat_properties(cea_data, use_table)
     area_ratio = props['area_ratio']
     
     if R_throat is None:
@@ -226,17 +252,11 @@ def rao_optimum_nozzle(cea_data, R_throat=None, N=100, theta_n=30, theta_e=7):
     
     # Verify that the radius is monotonically increasing (always expanding)
     # This ensures no converging sections in the divergent part
-    for i in range(1, len(r)):
-        if r[i] < r[i-1]:
-            # If radius decreases, adjust to ensure continuous expansion
-            # Linear interpolation from previous point to exit
-            remaining_points = len(r) - i
-            progress_factor = 1.0 / remaining_points if remaining_points > 0 else 0.1
-            r[i] = r[i-1] + progress_factor * (r[-1] - r[i-1])
+    r = _enforce_expansion(r)
     
     return x, r
 
-def bell_nozzle(cea_data, R_throat=None, N=100, percent_bell=80):
+def bell_nozzle(cea_data, R_throat=None, N=100, percent_bell=80, use_table=False):
     """
     Generate a Bell nozzle contour following the Rao method.
     
@@ -255,6 +275,8 @@ def bell_nozzle(cea_data, R_throat=None, N=100, percent_bell=80):
         Number of points to generate for the contour
     percent_bell : float, optional
         Percentage of the equivalent 15° conical nozzle length, default 80%
+    use_table : bool, optional
+        Use the cached isentropic tables for the Mach inversions
         
     Returns
     -------
@@ -262,7 +284,7 @@ def bell_nozzle(cea_data, R_throat=None, N=100, percent_bell=80):
         (x_coordinates, r_coordinates) for the nozzle contour
     """
     # Extract area ratio and calculate throat radius
-    props = get_throat_properties(cea_data)
+    props = get_throat_properties(cea_data, use_table)
     area_ratio = props['area_ratio']
     
     if R_throat is None:
@@ -329,14 +351,11 @@ def bell_nozzle(cea_data, R_throat=None, N=100, percent_bell=80):
     r[-1] = R_exit
     
     # Verify that the radius is monotonically increasing (always expanding)
-    for i in range(1, len(r)):
-        if r[i] <= r[i-1]:
-            # If not expanding, ensure a small expansion
-            r[i] = r[i-1] + 0.0001 * R_throat * (i / len(r))
+    r = _enforce_expansion(r)
     
     return x, r
 
-def moc_nozzle(cea_data, R_throat=None, N=30, nu_max=None):
+def moc_nozzle(cea_data, R_throat=None, N=30, nu_max=None, use_table=False):
     """
     Generate a Method of Characteristics (MOC) nozzle contour.
     
@@ -359,6 +378,8 @@ def moc_nozzle(cea_data, R_throat=None, N=30, nu_max=None):
         Number of characteristic lines (higher values give more accurate contours)
     nu_max : float, optional
         Maximum Prandtl-Meyer angle in degrees, if None it will be calculated from area_ratio
+    use_table : bool, optional
+        Use the cached isentropic tables for the Mach inversions
         
     Returns
     -------
@@ -368,7 +389,7 @@ def moc_nozzle(cea_data, R_throat=None, N=30, nu_max=None):
     from moc import generate_moc_contour
     
     # Extract properties from CEA data
-    props = get_throat_properties(cea_data)
+    props = get_throat_properties(cea_data, use_table)
     gamma = props['gamma']
     area_ratio = props['area_ratio']
     
@@ -395,7 +416,8 @@ def moc_nozzle(cea_data, R_throat=None, N=30, nu_max=None):
         area_ratio=area_ratio,
         gamma=gamma,
         N=N,
-        R_throat=R_throat
+        R_throat=R_throat,
+        use_table=use_table
     )
     
     # Ensure the contour starts at the throat (x=0, r=R_throat)
@@ -407,16 +429,11 @@ def moc_nozzle(cea_data, R_throat=None, N=30, nu_max=None):
     r_wall[-1] = r_exit
     
     # Verify and enforce monotonic expansion (always increasing radius)
-    for i in range(1, len(r_wall)):
-        if r_wall[i] < r_wall[i-1]:
-            # If radius decreases, adjust to ensure continuous expansion
-            # Use linear interpolation from previous point to exit
-            fraction = (i - 0) / float(len(r_wall) - 1 - 0)
-            r_wall[i] = r_wall[0] + fraction * (r_wall[-1] - r_wall[0])
+    r_wall = _enforce_expansion(r_wall)
     
     return x_wall, r_wall
 
-def truncated_ideal_contour(cea_data, R_throat=None, N=100, truncation_factor=0.8):
+def truncated_ideal_contour(cea_data, R_throat=None, N=100, truncation_factor=0.8, use_table=False):
     """
     Generate a Truncated Ideal Contour (TIC) nozzle.
     
@@ -435,6 +452,8 @@ def truncated_ideal_contour(cea_data, R_throat=None, N=100, truncation_factor=0.
     truncation_factor : float, optional
         Factor to truncate the ideal contour length (0-1), default 0.8
         Typical values range from 0.6 to 0.9
+    use_table : bool, optional
+        Use the cached isentropic tables for the Mach inversions
         
     Returns
     -------
@@ -442,7 +461,7 @@ def truncated_ideal_contour(cea_data, R_throat=None, N=100, truncation_factor=0.
         (x_coordinates, r_coordinates) for the nozzle contour
     """
     # Extract properties from CEA data
-    props = get_throat_properties(cea_data)
+    props = get_throat_properties(cea_data, use_table)
     gamma = props['gamma']
     area_ratio = props['area_ratio']
     
@@ -513,15 +532,82 @@ def truncated_ideal_contour(cea_data, R_throat=None, N=100, truncation_factor=0.
     r_truncated[-1] = R_exit
     
     # Verify and enforce monotonic expansion (always increasing radius)
-    for i in range(1, len(r_truncated)):
-        if r_truncated[i] < r_truncated[i-1]:
-            # If radius decreases, adjust to ensure continuous expansion
-            # Linear interpolation from previous point to exit
-            fraction = (i - 0) / float(len(r_truncated) - 1 - 0)
-            r_truncated[i] = r_truncated[0] + fraction * (r_truncated[-1] - r_truncated[0])
+    r_truncated = _enforce_expansion(r_truncated)
     
     return x_truncated, r_truncated
 
+# Contour generators by the names used in the GUI, with their shape parameters
+NOZZLE_TYPES = {
+    "Conical":                         (conical_nozzle, {}),
+    "Rao Optimum":                     (rao_optimum_nozzle, {}),
+    "80% Bell":                        (bell_nozzle, {"percent_bell": 80}),
+    "Method of Characteristics (MOC)": (moc_nozzle, {}),
+    "Truncated Ideal Contour (TIC)":   (truncated_ideal_contour, {"truncation_factor": 0.8}),
+}
+
+@lru_cache(maxsize=CONTOUR_CACHE_SIZE)
+def _normalised_contour(nozzle_type, area_ratio, gamma, N, shape, use_table):
+    """Contour of NOZZLE_TYPES[nozzle_type] for R_throat = 1, as read-only arrays."""
+    generator, _ = NOZZLE_TYPES[nozzle_type]
+    kwargs = dict(shape)
+    if N is not None:
+        kwargs['N'] = N
+    x, r = generator({'gamma': gamma, 'Ae/At': area_ratio}, R_throat=1.0,
+                     use_table=use_table, **kwargs)
+    x, r = np.asarray(x, dtype=float), np.asarray(r, dtype=float)
+    x.setflags(write=False)
+    r.setflags(write=False)
+    return x, r
+
+def nozzle_contour(nozzle_type, cea_data, R_throat=None, N=None, use_table=False, **shape):
+    """
+    Generate a nozzle contour through a cache of normalised contours.
+    
+    Every generator in NOZZLE_TYPES scales linearly with the throat radius, so
+    the contour is solved once for R_throat = 1 per (nozzle type, area ratio,
+    gamma, N, shape parameters) and only scaled afterwards. Changing the
+    throat radius or switching back to a previous nozzle type is then an O(N)
+    multiplication instead of a new solve.
+    
+    Parameters
+    ----------
+    nozzle_type : str
+        Key of NOZZLE_TYPES, e.g. "80% Bell"
+    cea_data : dict or pandas.Series
+        CEA data containing at minimum: area_ratio, gamma
+    R_throat : float, optional
+        Throat radius in meters, if None it will be calculated from CEA data
+    N : int, optional
+        Number of contour points, if None the generator's default is used
+    use_table : bool, optional
+        Use the cached isentropic tables for the Mach inversions
+    **shape
+        Shape parameters overriding the NOZZLE_TYPES defaults
+        (half_angle, theta_n, theta_e, percent_bell, truncation_factor)
+        
+    Returns
+    -------
+    tuple
+        (x_coordinates, r_coordinates) for the nozzle contour
+    """
+    if nozzle_type not in NOZZLE_TYPES:
+        raise ValueError(f"Unknown nozzle type: {nozzle_type!r}")
+    if hasattr(cea_data, 'to_dict'):  # If it's a pandas Series
+        cea_data = cea_data.to_dict()
+    gamma, area_ratio = design_inputs(cea_data)
+    
+    # Calculate throat radius if not provided
+    if R_throat is None:
+        if 'At' in cea_data:
+            R_throat = np.sqrt(cea_data['At'] / np.pi)
+        else:
+            R_throat = 0.05  # Default 5cm throat radius
+    
+    params = dict(NOZZLE_TYPES[nozzle_type][1], **shape)
+    x, r = _normalised_contour(nozzle_type, float(area_ratio), float(gamma), N,
+                               tuple(sorted(params.items())), use_table)
+    return x * R_throat, r * R_throat
+
 def add_inlet_section(x, r, R_throat, chamber_radius_ratio=2.5, chamber_length_ratio=3.0, N_inlet=40):
     """
     Add an inlet section (combustion chamber and converging section) to the nozzle contour.
@@ -558,10 +644,8 @@ def add_inlet_section(x, r, R_throat, chamber_radius_ratio=2.5, chamber_length_r
     
     # Verify that the throat is the minimum radius point in the divergent section
     r_throat = r[throat_idx]
-    for i in range(throat_idx + 1, len(r)):
-        if r[i] < r_throat:
-            # Adjust to ensure the throat is the minimum radius
-            r[i] = r_throat + (i - throat_idx) * 0.001 * r_throat
+    steps = np.arange(len(r)) - throat_idx
+    r = np.where((steps > 0) & (r < r_throat), r_throat + steps * 0.001 * r_throat, r)
     
     # Calculate chamber dimensions based on standard rocket engine design practices
     R_chamber = R_throat * chamber_radius_ratio  # Contraction ratio typically 4-9 in area
@@ -587,9 +671,7 @@ def add_inlet_section(x, r, R_throat, chamber_radius_ratio=2.5, chamber_length_r
     r_converging[-1] = R_throat
     
     # Verify the converging section is truly converging (radius always decreases)
-    for i in range(1, len(r_converging)):
-        if r_converging[i] > r_converging[i-1]:
-            r_converging[i] = r_converging[i-1] - 0.001 * R_throat
+    r_converging = np.minimum.accumulate(r_converging)
     
     # Combine the chamber and converging sections with the nozzle
     x_inlet = np.concatenate([x_chamber, x_converging[1:]])  # Avoid duplicate points
@@ -604,14 +686,10 @@ def add_inlet_section(x, r, R_throat, chamber_radius_ratio=2.5, chamber_length_r
     throat_idx = len(x_inlet) - 1
     
     # Verify converging section (should always decrease to throat)
-    for i in range(1, throat_idx + 1):
-        if r_full[i] > r_full[i-1]:
-            r_full[i] = r_full[i-1] * 0.99
+    r_full[:throat_idx + 1] = np.minimum.accumulate(r_full[:throat_idx + 1])
     
     # Verify diverging section (should always increase from throat)
-    for i in range(throat_idx + 1, len(r_full)):
-        if r_full[i] < r_full[i-1]:
-            r_full[i] = r_full[i-1] * 1.01
+    r_full[throat_idx:] = np.maximum.accumulate(r_full[throat_idx:])
     
     return x_full, r_full
 
@@ -733,7 +811,7 @@ def plot_nozzle_contour(x, r, title="Rocket Nozzle Contour", show_grid=True,
     
     return fig, ax
 
-def calculate_performance(cea_data, nozzle_coordinates):
+def calculate_performance(cea_data, nozzle_coordinates, use_table=False):
     """
     Calculate performance parameters for the designed nozzle following aerospace engineering standards.
     
@@ -748,6 +826,8 @@ def calculate_performance(cea_data, nozzle_coordinates):
         CEA thermochemical data containing at minimum: gamma, area_ratio, and chamber pressure
     nozzle_coordinates : tuple
         (x, r) coordinates of the nozzle contour
+    use_table : bool, optional
+        Use the cached isentropic tables for the Mach inversions
         
     Returns
     -------
@@ -756,7 +836,7 @@ def calculate_performance(cea_data, nozzle_coordinates):
         divergence loss factor, and other metrics
     """
     # Extract properties from CEA data
-    props = get_throat_properties(cea_data)
+    props = get_throat_properties(cea_data, use_table)
     gamma = props['gamma']        # Specific heat ratio
     p_c = props['p_c']            # Chamber pressure (Pa)
     m_exit = props['m_exit']      # Exit Mach number
@@ -822,13 +902,10 @@ def calculate_performance(cea_data, nozzle_coordinates):
     C_d = 0.98
     
     # Calculate nozzle surface area (for heat transfer and weight estimation)
-    surface_area = 0
-    for i in range(1, len(x)):
-        dx = x[i] - x[i-1]
-        dr = r[i] - r[i-1]
-        ds = np.sqrt(dx**2 + dr**2)  # Length of the segment
-        r_avg = (r[i] + r[i-1]) / 2   # Average radius of the segment
-        surface_area += 2 * np.pi * r_avg * ds  # Surface area of truncated cone
+    # as a sum of truncated cones, one per segment
+    ds = np.hypot(np.diff(x), np.diff(r))  # Length of each segment
+    r_avg = 0.5 * (r[1:] + r[:-1])         # Average radius of each segment
+    surface_area = np.sum(2 * np.pi * r_avg * ds)
     
     # Calculate length to throat radius ratio (important design parameter)
     length_to_throat_ratio = (x_exit - x_throat) / r_throat
@@ -874,6 +951,151 @@ def calculate_performance(cea_data, nozzle_coordinates):
         'exit_mach_number': m_exit
     }
 
+def _ragged_contours(x, r, offsets=None, lengths=None):
+    """
+    Flatten a batch of contours to (x, r, offsets): 1-D values with contour
+    i in [offsets[i], offsets[i+1]). Accepts flat values with offsets, or
+    2-D arrays padded per row, with lengths or trailing NaN padding.
+    """
+    x = np.asarray(x, dtype=float)
+    r = np.asarray(r, dtype=float)
+    if x.ndim == 1:
+        if offsets is None:
+            offsets = [0, len(x)]
+        return x, r, np.asarray(offsets, dtype=np.intp)
+    if lengths is None:
+        lengths = np.sum(~np.isnan(r), axis=1)
+    lengths = np.asarray(lengths, dtype=np.intp)
+    keep = np.arange(x.shape[1]) < lengths[:, None]
+    return x[keep], r[keep], np.concatenate(([0], np.cumsum(lengths)))
+
+def calculate_performance_batch(x, r, gamma, p_c, offsets=None, lengths=None,
+                                design_area_ratio=None, nozzle_type=None, use_table=False):
+    """
+    Vectorised `calculate_performance` for a batch of contours.
+    
+    Every contour is evaluated in the same array passes: throat search,
+    exit-slope least squares and surface integration are segment reductions
+    over the concatenated points, and the exit Mach numbers are solved in a
+    single inversion, so the cost is a few passes over all points instead
+    of one Python call (and Mach solve) per contour.
+    
+    Parameters
+    ----------
+    x, r : ndarray
+        Either 2-D arrays of shape (K, P), one contour per row, padded after
+        each contour's last point (give lengths or pad r with NaN), or 1-D
+        concatenated values with offsets
+    gamma : float or ndarray, shape (K,)
+        Specific heat ratio per contour
+    p_c : float or ndarray, shape (K,)
+        Chamber pressure per contour in Pa
+    offsets : ndarray, shape (K+1,), optional
+        Start of each contour in the 1-D layout, ending with the total length
+    lengths : ndarray, shape (K,), optional
+        Number of points of each row in the 2-D layout
+    design_area_ratio : float or ndarray, shape (K,), optional
+        Design area ratio giving the exit Mach number (the CEA 'Ae/At' of
+        `calculate_performance`); if None, the contour's own area ratio
+    nozzle_type : str or sequence of str, optional
+        Nozzle type per contour, for the efficiency estimate
+    use_table : bool, optional
+        Use the cached isentropic tables for the Mach inversions
+        
+    Returns
+    -------
+    dict
+        The keys of `calculate_performance`, each an ndarray of shape (K,),
+        plus 'exit_pressure' in Pa
+    """
+    x, r, offsets = _ragged_contours(x, r, offsets, lengths)
+    n = np.diff(offsets)
+    K = len(n)
+    first, last = offsets[:-1], offsets[1:] - 1
+    seg = np.repeat(np.arange(K), n)
+    gamma = np.broadcast_to(np.asarray(gamma, dtype=float), (K,))
+    p_c = np.broadcast_to(np.asarray(p_c, dtype=float), (K,))
+    
+    # Throat: first minimum-radius point of each contour
+    at_min = np.flatnonzero(r == np.minimum.reduceat(r, first)[seg])
+    throat = at_min[np.searchsorted(seg[at_min], np.arange(K))]
+    r_throat = np.maximum(r[throat], 1e-6)
+    r_exit, x_exit = r[last], x[last]
+    area_ratio = (r_exit / r_throat)**2
+    
+    # Exit Mach number from the design area ratio, one inversion for all
+    if design_area_ratio is None:
+        design_area_ratio = area_ratio
+    design_area_ratio = np.broadcast_to(np.asarray(design_area_ratio, dtype=float), (K,))
+    if use_table:
+        m_exit = np.empty(K)
+        for g in np.unique(gamma):
+            sel = gamma == g
+            m_exit[sel] = isentropic_table(float(g)).mach_from_area_ratio(design_area_ratio[sel])
+    else:
+        m_exit = np.asarray(mach_from_area_ratio(design_area_ratio, gamma), dtype=float)
+    
+    # Ideal thrust coefficient
+    p_ratio = (1 + (gamma-1)/2 * m_exit**2)**(-gamma/(gamma-1))
+    p_exit = p_c * p_ratio
+    C_f_ideal = np.sqrt(((2*gamma**2)/(gamma-1)) * (2/(gamma+1))**((gamma+1)/(gamma-1)) *
+                        (1-p_ratio**((gamma-1)/gamma)))
+    
+    # Exit slope: least-squares line through the last 10% of each contour,
+    # from running sums taken relative to the exit point for accuracy
+    start = np.floor(0.9 * n).astype(np.intp)
+    fit = start < n - 2
+    dx, dr = x - x_exit[seg], r - r_exit[seg]
+    def window_sum(v):
+        cs = np.concatenate(([0.0], np.cumsum(v)))
+        return cs[offsets[1:]] - cs[offsets[:-1] + np.minimum(start, n)]
+    S, Sx, Sr = (n - start).astype(float), window_sum(dx), window_sum(dr)
+    Sxx, Sxr = window_sum(dx * dx), window_sum(dx * dr)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        slope_fit = (S * Sxr - Sx * Sr) / (S * Sxx - Sx**2)
+        prev = np.maximum(last - 1, first)
+        slope_end = (r[last] - r[prev]) / (x[last] - x[prev])
+    divergence_angle = np.where(fit, np.arctan(slope_fit),
+                                np.where(n >= 2, np.arctan(slope_end), np.radians(15)))
+    
+    # Divergence loss factor and thrust coefficient
+    lambda_d = 0.5 * (1 + np.cos(divergence_angle))
+    C_f = C_f_ideal * lambda_d
+    
+    # Surface area: truncated cones between consecutive points of a contour
+    same = seg[1:] == seg[:-1]
+    cone = np.pi * (r[1:] + r[:-1]) * np.hypot(np.diff(x), np.diff(r))
+    surface_area = np.bincount(seg[1:][same], weights=cone[same], minlength=K)
+    
+    length_to_throat_ratio = (x_exit - x[throat]) / r_throat
+    
+    # Nozzle efficiency, as in calculate_performance
+    base_efficiency = np.select([area_ratio < 10, area_ratio < 50], [0.92, 0.94], 0.96)
+    types = np.broadcast_to(np.asarray("unknown" if nozzle_type is None else nozzle_type,
+                                       dtype=str), (K,))
+    types = np.char.lower(types)
+    efficiency_factor = np.select(
+        [np.char.find(types, "conical") >= 0,
+         (np.char.find(types, "bell") >= 0) | (np.char.find(types, "rao") >= 0),
+         np.char.find(types, "moc") >= 0],
+        [0.98, 1.01, 1.02], 1.0)
+    nozzle_efficiency = np.minimum(0.99, base_efficiency * efficiency_factor * lambda_d)
+    
+    return {
+        'area_ratio': area_ratio,
+        'pressure_ratio': 1.0 / p_ratio,
+        'exit_pressure': p_exit,
+        'thrust_coefficient': C_f,
+        'ideal_thrust_coefficient': C_f_ideal,
+        'discharge_coefficient': np.full(K, 0.98),
+        'surface_area': surface_area,
+        'nozzle_efficiency': nozzle_efficiency,
+        'divergence_loss_factor': lambda_d,
+        'divergence_angle_deg': np.degrees(divergence_angle),
+        'length_to_throat_ratio': length_to_throat_ratio,
+        'exit_mach_number': m_exit
+    }
+
 # Example usage demonstration function
 def demo_nozzle_designs(cea_data, R_throat=0.05):
     """
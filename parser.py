@@ -1,16 +1,764 @@
 #!/usr/bin/env python3
+import bz2
+import gzip
+import io
+import lzma
+import mmap
+import os
 import re
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import contextmanager
+import numpy as np
 import pandas as pd
+from scipy import sparse
 from config import G0
 
-def parse_cea_output(path, progress_cb=None):
+# Precompiled byte patterns shared by the streaming and mmap engines
+_CASE_RE  = re.compile(rb"^\s*CASE =")
+_FIELD_RE = re.compile(rb"^\s*(?:O/F=|P, BAR|T, K|H, KJ/KG|Ae/At|Isp,)")
+_FIELD_PATTERNS = (
+    ("ar",  re.compile(rb"Ae/At\s+([\d\.]+)", re.IGNORECASE)),
+    ("of",  re.compile(rb"O/F=\s*([\d\.]+)")),
+    ("p",   re.compile(rb"P,\s*BAR\s+([\d\.]+)\s+([\d\.]+)")),
+    ("t",   re.compile(rb"T,\s*K\s+([\d\.]+)\s+([\d\.]+)")),
+    ("h",   re.compile(rb"H,\s*KJ/KG\s+([-\d\.]+)\s+([-\d\.]+)")),
+    ("isp", re.compile(rb"Isp,.*?M/SEC\s+([\d\.]+)")),
+)
+_PERF_HEADER = b"PERFORMANCE PARAMETERS"
+_CASE_TOKEN  = b"CASE ="
+
+# Rows of the CHAMBER/THROAT/EXIT and PERFORMANCE PARAMETERS tables captured by
+# the full-property mode: (CEA label, column stem, unit)
+STATIONS = ("chamber", "throat", "exit")
+PROPERTIES = (
+    (b"Pinf/P",         "Pinf/P",  ""),
+    (b"P, BAR",         "P",       "bar"),
+    (b"T, K",           "T",       "K"),
+    (b"RHO, KG/CU M",   "Rho",     "kg/m³"),
+    (b"H, KJ/KG",       "H",       "kJ/kg"),
+    (b"U, KJ/KG",       "U",       "kJ/kg"),
+    (b"G, KJ/KG",       "G",       "kJ/kg"),
+    (b"S, KJ/(KG)(K)",  "S",       "kJ/(kg·K)"),
+    (b"M, (1/n)",       "M",       ""),
+    (b"MW, MOL WT",     "MW",      "g/mol"),
+    (b"(dLV/dLP)t",     "dLV/dLP", ""),
+    (b"(dLV/dLT)p",     "dLV/dLT", ""),
+    (b"Cp, KJ/(KG)(K)", "Cp",      "kJ/(kg·K)"),
+    (b"GAMMAs",         "Gamma",   ""),
+    (b"SON VEL,M/SEC",  "SonVel",  "m/s"),
+    (b"MACH NUMBER",    "Mach",    ""),
+    (b"Ae/At",          "AeAt",    ""),
+    (b"CSTAR, M/SEC",   "Cstar",   "m/s"),
+    (b"CF",             "CF",      ""),
+    (b"Ivac, M/SEC",    "Ivac",    "m/s"),
+    (b"Isp, M/SEC",     "Isp",     "m/s"),
+)
+_PROPERTY_INDEX = {label: i for i, (label, _, _) in enumerate(PROPERTIES)}
+# CEA numbers, including the compact exponent forms '1.2112-1' and '4.3595 0'
+_NUMBER_RE = re.compile(rb"(-?\d*\.\d+)(?:([-+]\d+)| (\d)(?=\s|$))?")
+_OF_RE = _FIELD_PATTERNS[1][1]
+_MASSF_HEADER = b"MASS FRACTIONS"
+
+# Phases of a CASE in parse_cea_table
+_IDLE, _TABLES, _PERF, _SPECIES_WAIT, _SPECIES = range(5)
+
+# Magic numbers of the compressed formats read transparently
+_GZIP_MAGIC = b"\x1f\x8b"
+_XZ_MAGIC   = b"\xfd7zXZ\x00"
+_BZ2_MAGIC  = b"BZh"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Files larger than this are split by case-offset ranges in parse_cea_outputs
+SHARD_BYTES = 64 * 2**20
+
+# Minimum time between two progress callbacks, in seconds
+PROGRESS_INTERVAL = 0.05
+
+
+class ParseCancelled(Exception):
+    """Raised by a parser whose CancelToken has been cancelled."""
+
+
+class CancelToken:
+    """Cooperative cancellation flag, checked by the parsers between cases."""
+
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class _Progress:
+    """
+    Per-case hook of the parsers. Raises ParseCancelled once the token is
+    cancelled and forwards the percentage to progress_cb at most every
+    PROGRESS_INTERVAL seconds, so a large file does not flood the caller.
+    """
+
+    def __init__(self, progress_cb=None, cancel=None):
+        self.progress_cb = progress_cb
+        self.cancel = cancel
+        self._last_pct = -1
+        self._next_time = 0.0
+
+    def __call__(self, pct):
+        if self.cancel is not None and self.cancel.cancelled:
+            raise ParseCancelled()
+        if self.progress_cb is None or pct == self._last_pct:
+            return
+        now = time.monotonic()
+        if now >= self._next_time or pct >= 100:
+            self.progress_cb(pct)
+            self._last_pct = pct
+            self._next_time = now + PROGRESS_INTERVAL
+
+
+def _progress(progress_cb, cancel=None):
+    """Wrap progress_cb and cancel into a _Progress, unless already wrapped."""
+    if isinstance(progress_cb, _Progress) and cancel is None:
+        return progress_cb
+    return _Progress(progress_cb, cancel)
+
+
+def is_compressed(path):
+    """True if path is a gzip, xz, bzip2 or zstd file."""
+    with open(path, 'rb') as f:
+        magic = f.read(6)
+    return magic.startswith((_GZIP_MAGIC, _XZ_MAGIC, _BZ2_MAGIC, _ZSTD_MAGIC))
+
+
+@contextmanager
+def _open_cea(path):
+    """
+    Open a CEA output for binary line iteration, stream-decompressing gzip,
+    xz, bzip2 and zstd files chunk by chunk. Yields (stream, raw) where raw is
+    the underlying file; raw.tell() is the number of on-disk bytes consumed,
+    which drives progress reporting for both plain and compressed files.
+    """
+    with open(path, 'rb') as raw:
+        magic = raw.read(6)
+        raw.seek(0)
+        if magic.startswith(_GZIP_MAGIC):
+            stream = gzip.GzipFile(fileobj=raw)
+        elif magic.startswith(_XZ_MAGIC):
+            stream = lzma.LZMAFile(raw)
+        elif magic.startswith(_BZ2_MAGIC):
+            stream = bz2.BZ2File(raw)
+        elif magic.startswith(_ZSTD_MAGIC):
+            try:
+                import zstandard
+            except ImportError:
+                raise ValueError("Reading .zst files requires the 'zstandard' package")
+            stream = io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(raw))
+        else:
+            yield raw, raw
+            return
+        with stream:
+            yield stream, raw
+
+
+def _make_record(of, pc, pt, ar, tch, tth, hch, hth, isp_m):
+    """Build one output row from the raw values of a CASE."""
+    return {
+        "O/F":               of,
+        "Pc (bar)":          pc,
+        "P_throat (bar)":    pt,
+        "Pressure Ratio":    pt/pc,
+        "Expansion Ratio":   ar,
+        "T_chamber (K)":     tch,
+        "T_throat (K)":      tth,
+        "H_chamber (kJ/kg)": hch,
+        "H_throat (kJ/kg)":  hth,
+        "Delta_H (kJ/kg)":   hch - hth,
+        "Isp (m/s)":         isp_m,
+        "Isp (s)":           isp_m / G0
+    }
+
+
+def _build_frame(records):
+    """Turn records (a list of dicts or a DataFrame) into the sorted parser output."""
+    df = pd.DataFrame(records)
+    if df.empty:
+        return df
+
+    df.sort_values(["Pc (bar)", "O/F"], inplace=True)
+    df.reset_index(drop=True, inplace=True)
+
+    return df
+
+
+def _record_from_fields(fields):
+    """Convert the matched fields of a streamed CASE into a record, or None."""
+    if not all(k in fields for k in ("of", "p", "t", "h", "isp")):
+        return None
+    ar = float(fields["ar"][0]) if "ar" in fields else 1.0
+    pc, pt   = fields["p"]
+    tch, tth = fields["t"]
+    hch, hth = fields["h"]
+    return _make_record(float(fields["of"][0]), float(pc), float(pt), ar,
+                        float(tch), float(tth), float(hch), float(hth),
+                        float(fields["isp"][0]))
+
+
+def iter_cea_cases(path, progress_cb=None, cancel=None):
+    """
+    Stream a NASA-CEA output file and yield one record per CASE.
+
+    The file is walked line by line as a small state machine. A record is
+    emitted as soon as the PERFORMANCE PARAMETERS block of its case closes, so
+    peak memory is bounded by a single case rather than by the file size.
+    Records have the same keys as the rows of `parse_cea_output`.
+    """
+    progress = _progress(progress_cb, cancel)
+    size = os.path.getsize(path) or 1
+
+    fields   = None   # matched fields of the current case, None outside a case
+    in_perf  = False  # inside the PERFORMANCE PARAMETERS block
+    perf_row = False  # at least one row of that block has been seen
+
+    with _open_cea(path) as (f, raw):
+        for line in f:
+            if _CASE_RE.match(line):
+                if fields is not None:
+                    rec = _record_from_fields(fields)
+                    if rec is not None:
+                        yield rec
+                fields, in_perf, perf_row = {}, False, False
+                progress(int(100 * raw.tell() / size))
+                continue
+
+            if fields is None:
+                continue
+
+            stripped = line.strip()
+            if in_perf:
+                if not stripped:
+                    if perf_row:
+                        # Block closed: this case is complete
+                        rec = _record_from_fields(fields)
+                        if rec is not None:
+                            yield rec
+                        fields = None
+                    continue
+                perf_row = True
+            elif stripped == _PERF_HEADER:
+                in_perf = True
+                continue
+
+            if _FIELD_RE.match(line):
+                for key, pat in _FIELD_PATTERNS:
+                    if key not in fields:
+                        m = pat.search(line)
+                        if m:
+                            fields[key] = m.groups()
+
+    # Last case of a file that ends before its block is closed
+    if fields is not None:
+        rec = _record_from_fields(fields)
+        if rec is not None:
+            yield rec
+
+
+def _cea_numbers(line, pos):
+    """Decode every CEA-formatted number in line from pos onwards."""
+    out = []
+    for m in _NUMBER_RE.finditer(line, pos):
+        mant, exp_signed, exp_space = m.groups()
+        exp = exp_signed or exp_space
+        out.append(float(mant) * 10.0 ** int(exp) if exp else float(mant))
+    return out
+
+
+def parse_cea_table(path, progress_cb=None, start=0, end=None, first_case=0,
+                    species=False, complete_only=False, cancel=None):
+    """
+    Extract every row of the CHAMBER/THROAT/EXIT and PERFORMANCE PARAMETERS
+    tables in one streaming pass.
+
+    Values are written straight into preallocated float64 arrays (grown by
+    doubling), so no per-case dict is built. start/end restrict the pass to
+    a byte range beginning at a 'CASE =' line; first_case numbers the cases.
+
+    Returns a dict with:
+        'case'       : int64 (n,) ordinal of the CASE in the file
+        'of'         : float64 (n,) O/F ratio
+        'values'     : float64 (n, len(STATIONS), len(PROPERTIES)), NaN where
+                       CEA prints no value (e.g. chamber performance rows)
+        'stations'   : STATIONS
+        'properties' : column stems of PROPERTIES
+        'end'        : byte offset just past the PERFORMANCE PARAMETERS block
+                       of the last complete case
+
+    With complete_only=True a trailing case whose PERFORMANCE PARAMETERS
+    block has not closed yet (a file still being written) is left out.
+
+    With species=True the MASS FRACTIONS blocks are read in the same pass and
+    the dict also holds 'species': {'names': tuple of species (shared
+    vocabulary, '*' markers stripped), 'fractions': {station: CSR matrix of
+    shape (n, len(names))}}. Zero fractions are not stored.
+    """
+    progress = _progress(progress_cb, cancel)
+    n_props = len(PROPERTIES)
+    cap = 1024
+    of = np.full(cap, np.nan)
+    values = np.full((cap, len(STATIONS), n_props), np.nan)
+
+    # COO buffers for the species fractions
+    vocab = {}
+    sp_row, sp_col, sp_station, sp_val = array('q'), array('q'), array('b'), array('d')
+
+    size = (end if end is not None else os.path.getsize(path)) - start or 1
+    done = 0
+    n = -1           # index of the current case, -1 before the first one
+    phase = _IDLE
+    block_row = False  # a row of the current PERF/SPECIES block has been seen
+    n_complete, end_complete = 0, start
+
+    with _open_cea(path) as (f, raw):
+        if start:
+            f.seek(start)
+        for line in f:
+            if end is not None and start + done >= end:
+                break
+            done += len(line)
+
+            if _CASE_RE.match(line):
+                n += 1
+                if n == cap:
+                    of = np.concatenate([of, np.full(cap, np.nan)])
+                    values = np.concatenate([values, np.full_like(values, np.nan)])
+                    cap *= 2
+                phase, block_row = _TABLES, False
+                progress(min(100, int(100 * (raw.tell() - start) / size)))
+                continue
+
+            if phase == _IDLE:
+                continue
+
+            stripped = line.strip()
+            if phase == _SPECIES_WAIT:
+                if stripped == _MASSF_HEADER:
+                    phase, block_row = _SPECIES, False
+                continue
+            if phase == _SPECIES:
+                if not stripped:
+                    if block_row:
+                        phase = _IDLE
+                    continue
+                block_row = True
+                name, _, rest = stripped.partition(b" ")
+                col = vocab.setdefault(name.lstrip(b"*").decode('ascii', 'ignore'), len(vocab))
+                for j, v in enumerate(_cea_numbers(rest, 0)[:len(STATIONS)]):
+                    if v:
+                        sp_row.append(n); sp_col.append(col)
+                        sp_station.append(j); sp_val.append(v)
+                continue
+            if phase == _PERF:
+                if not stripped:
+                    if block_row:
+                        phase = _SPECIES_WAIT if species else _IDLE
+                        n_complete, end_complete = n + 1, start + done
+                    continue
+                block_row = True
+            elif stripped == _PERF_HEADER:
+                phase, block_row = _PERF, False
+                continue
+
+            m = _NUMBER_RE.search(line)
+            if m is None:
+                continue
+            prop = _PROPERTY_INDEX.get(line[:m.start()].strip())
+            if prop is None:
+                if np.isnan(of[n]):
+                    m_of = _OF_RE.search(line)
+                    if m_of:
+                        of[n] = float(m_of.group(1))
+                continue
+            nums = _cea_numbers(line, m.start())
+            # Performance rows have no chamber column
+            first = 1 if phase == _PERF else 0
+            nums = nums[:len(STATIONS) - first]
+            values[n, first:first + len(nums), prop] = nums
+
+    n = n_complete if complete_only else n + 1
+    table = {
+        "case":       np.arange(first_case, first_case + n),
+        "of":         of[:n].copy(),
+        "values":     values[:n].copy(),
+        "stations":   STATIONS,
+        "properties": tuple(stem for _, stem, _ in PROPERTIES),
+        "end":        end_complete,
+    }
+    if species:
+        rows, cols = np.frombuffer(sp_row, np.int64), np.frombuffer(sp_col, np.int64)
+        stations, data = np.frombuffer(sp_station, np.int8), np.frombuffer(sp_val)
+        keep = rows < n
+        rows, cols, stations, data = rows[keep], cols[keep], stations[keep], data[keep]
+        shape = (n, len(vocab))
+        table["species"] = {
+            "names": tuple(vocab),
+            "fractions": {
+                station: sparse.csr_matrix((data[stations == j],
+                                            (rows[stations == j], cols[stations == j])),
+                                           shape=shape)
+                for j, station in enumerate(STATIONS)
+            },
+        }
+    return table
+
+
+def species_frame(table, station="exit", cases=None):
+    """
+    Dense DataFrame view of the species mass fractions of a `parse_cea_table`
+    result at one station, one row per case ordinal in cases (all cases when
+    None) and one column per species.
+    """
+    sp = table["species"]
+    mat = sp["fractions"][station]
+    if cases is not None:
+        mat = mat[np.searchsorted(table["case"], np.asarray(cases))]
+    return pd.DataFrame(mat.toarray(), columns=list(sp["names"]))
+
+
+def parse_cea_tail(path, offset=0, first_case=0):
+    """
+    Parse the cases appended to a CEA output that is still being written.
+
+    Reading starts at byte offset and only cases whose PERFORMANCE PARAMETERS
+    block has closed are returned, so a partially written case is picked up
+    on the next call. Returns (df, next_offset, next_case) where df has the
+    `parse_cea_output(full=True)` layout and next_offset/next_case are the
+    arguments for the following call. Compressed outputs are refused: the
+    offset is a position in the file, which a decompressed stream does not
+    share.
+    """
+    if is_compressed(path):
+        raise ValueError("Watch mode needs an uncompressed CEA output")
+    table = parse_cea_table(path, start=offset, first_case=first_case,
+                            complete_only=True)
+    return table_frame(table), table["end"], first_case + len(table["case"])
+
+
+def _column_name(stem, unit, station):
+    return f"{stem}_{station} ({unit})" if unit else f"{stem}_{station}"
+
+
+def table_frame(table):
+    """
+    Flatten a `parse_cea_table` result into the DataFrame layout of
+    `parse_cea_output`, followed by a 'Case' column and one column per
+    property and station, e.g. 'Gamma_throat' or 'Cstar_exit (m/s)'.
+    Cases missing any of the core fields are dropped.
+    """
+    vals = table["values"]
+    col = {stem: i for i, (_, stem, _) in enumerate(PROPERTIES)}
+    chamber, throat = STATIONS.index("chamber"), STATIONS.index("throat")
+
+    pc,  pt  = vals[:, chamber, col["P"]], vals[:, throat, col["P"]]
+    tch, tth = vals[:, chamber, col["T"]], vals[:, throat, col["T"]]
+    hch, hth = vals[:, chamber, col["H"]], vals[:, throat, col["H"]]
+    isp_m    = vals[:, throat, col["Isp"]]
+    ar       = vals[:, throat, col["AeAt"]]
+    ar       = np.where(np.isnan(ar), 1.0, ar)
+
+    data = {
+        "O/F":               table["of"],
+        "Pc (bar)":          pc,
+        "P_throat (bar)":    pt,
+        "Pressure Ratio":    pt/pc,
+        "Expansion Ratio":   ar,
+        "T_chamber (K)":     tch,
+        "T_throat (K)":      tth,
+        "H_chamber (kJ/kg)": hch,
+        "H_throat (kJ/kg)":  hth,
+        "Delta_H (kJ/kg)":   hch - hth,
+        "Isp (m/s)":         isp_m,
+        "Isp (s)":           isp_m / G0,
+        "Case":              table["case"],
+    }
+    for i, (_, stem, unit) in enumerate(PROPERTIES):
+        for j, station in enumerate(STATIONS):
+            name = _column_name(stem, unit, station)
+            if name not in data and not np.isnan(vals[:, j, i]).all():
+                data[name] = vals[:, j, i]
+
+    df = pd.DataFrame(data)
+    required = ["O/F", "Pc (bar)", "P_throat (bar)", "T_chamber (K)",
+                "T_throat (K)", "H_chamber (kJ/kg)", "H_throat (kJ/kg)", "Isp (m/s)"]
+    df = df.dropna(subset=required)
+    return _build_frame(df)
+
+
+def case_offsets(buf):
+    """
+    Return the byte offsets of the start of every 'CASE =' line in buf
+    (bytes or mmap of a CEA output file).
+    """
+    offsets = []
+    pos = buf.find(_CASE_TOKEN)
+    while pos != -1:
+        line_start = buf.rfind(b"\n", 0, pos) + 1
+        if not buf[line_start:pos].strip():
+            offsets.append(line_start)
+        pos = buf.find(_CASE_TOKEN, pos + len(_CASE_TOKEN))
+    return offsets
+
+
+def _search_block(block):
+    """Run the precompiled byte patterns over one CASE block."""
+    fields = {}
+    for key, pat in _FIELD_PATTERNS:
+        m = pat.search(block)
+        if m:
+            fields[key] = m.groups()
+    return _record_from_fields(fields)
+
+
+def _iter_mapped_cases(view, offsets, progress=None):
+    """Yield one record per CASE from memoryview slices delimited by offsets."""
+    total = len(offsets) - 1
+    for idx, (start, end) in enumerate(zip(offsets, offsets[1:])):
+        if progress:
+            progress(int(100 * idx / total))
+        rec = _search_block(view[start:end])
+        if rec is not None:
+            yield rec
+
+
+def _parse_mmap(path, progress_cb=None, cancel=None):
+    """mmap engine: index CASE offsets once, then search each block in place."""
+    if os.path.getsize(path) == 0:
+        return _build_frame([])
+    with open(path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        offsets = case_offsets(mm)
+        offsets.append(len(mm))
+        with memoryview(mm) as view:
+            records = list(_iter_mapped_cases(view, offsets,
+                                              _progress(progress_cb, cancel)))
+    return _build_frame(records)
+
+
+class CaseIndex:
+    """
+    Lightweight index of a CEA output built in one mmap scan: one row per CASE
+    with its byte offset and headline numbers. The full station, performance
+    and species tables of a case are parsed on first access and memoised.
+    """
+    _PATTERNS = tuple(p for p in _FIELD_PATTERNS if p[0] in ("of", "p", "isp"))
+
+    def __init__(self, path, progress_cb=None, cancel=None):
+        if is_compressed(path):
+            raise ValueError("Lazy mode needs an uncompressed CEA output")
+        self.path = path
+        self._details = {}
+        progress = _progress(progress_cb, cancel)
+
+        rows = []
+        if os.path.getsize(path) == 0:
+            self.offsets = [0]
+        else:
+            with open(path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                self.offsets = case_offsets(mm)
+                self.offsets.append(len(mm))
+                with memoryview(mm) as view:
+                    total = len(self.offsets) - 1
+                    for idx in range(total):
+                        progress(int(100 * idx / total))
+                        rows.append(self._scan(view[self.offsets[idx]:self.offsets[idx + 1]]))
+
+        of, pc, isp_m = np.array(rows, dtype=float).reshape(-1, 3).T
+        self.frame = pd.DataFrame({
+            "Case":     np.arange(len(rows)),
+            "Offset":   np.array(self.offsets[:-1], dtype=np.int64),
+            "O/F":      of,
+            "Pc (bar)": pc,
+            "Isp (s)":  isp_m / G0,
+        })
+
+    @classmethod
+    def _scan(cls, block):
+        """(O/F, Pc, Isp in m/s) of one CASE block, NaN for missing fields."""
+        vals = []
+        for _, pat in cls._PATTERNS:
+            m = pat.search(block)
+            vals.append(float(m.group(1)) if m else np.nan)
+        return vals
+
+    def __len__(self):
+        return len(self.frame)
+
+    def details(self, case):
+        """
+        Parse one case on first access. Returns a dict with 'properties'
+        (DataFrame, stations x property stems) and 'species' (DataFrame,
+        species x stations, mass fractions).
+        """
+        if case not in self._details:
+            table = parse_cea_table(self.path, start=self.offsets[case],
+                                    end=self.offsets[case + 1], first_case=case,
+                                    species=True)
+            sp = table["species"]
+            self._details[case] = {
+                "properties": pd.DataFrame(table["values"][0], index=list(STATIONS),
+                                           columns=list(table["properties"])),
+                "species": pd.DataFrame(
+                    np.column_stack([sp["fractions"][s].toarray()[0] for s in STATIONS])
+                    if sp["names"] else np.empty((0, len(STATIONS))),
+                    index=list(sp["names"]), columns=list(STATIONS)),
+            }
+        return self._details[case]
+
+
+def _parse_shard(path, offsets, first_case=0, full=False):
+    """
+    Process-pool worker: parse the CASE blocks of path delimited by offsets
+    (the last entry being the end of the range) into an unsorted DataFrame.
+    """
+    if full:
+        return table_frame(parse_cea_table(path, start=offsets[0], end=offsets[-1],
+                                           first_case=first_case))
+    with open(path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            records = list(_iter_mapped_cases(view, offsets))
+    return pd.DataFrame(records)
+
+
+def _parse_whole(path, engine, full=False):
+    """Process-pool worker: parse a complete file."""
+    return parse_cea_output(path, engine=engine, full=full)
+
+
+def _shard_tasks(path, shard_cases):
+    """
+    Split one file into ranges of at most shard_cases cases, returned as
+    (first case ordinal, offsets) pairs.
+    """
+    with open(path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        offsets = case_offsets(mm)
+        offsets.append(len(mm))
+    return [(i, offsets[i:i + shard_cases + 1])
+            for i in range(0, len(offsets) - 1, shard_cases)]
+
+
+def _empty_output(full=False):
+    """The frame of `parse_cea_outputs` when no file yielded a case."""
+    columns = list(_make_record(*[np.nan] * 9))
+    if full:
+        columns.append("Case")
+    return pd.DataFrame(columns=columns + ["source_file"])
+
+
+def parse_cea_outputs(paths, workers=None, progress_cb=None, engine="mmap",
+                      shard_cases=20000, full=False, cancel=None):
+    """
+    Parse several NASA-CEA output files across a process pool.
+
+    Small files are parsed whole by one worker each; files larger than
+    SHARD_BYTES are split into ranges of shard_cases cases using the case
+    offset index. Returns one DataFrame with the columns of
+    `parse_cea_output` plus 'source_file', ordered by input file and, within
+    a file, by Pc and O/F. progress_cb receives the overall percentage.
+    Cancelling the token drops the queued tasks and raises ParseCancelled
+    without waiting for the running ones.
+    """
+    progress = _progress(progress_cb, cancel)
+    paths = list(paths)
+    tasks = []  # (file index, callable, args)
+    for i, path in enumerate(paths):
+        # Compressed files cannot be indexed by byte offset and are parsed whole
+        if os.path.getsize(path) > SHARD_BYTES and not is_compressed(path):
+            # A file without CASE lines gives no shards and contributes no rows
+            tasks.extend((i, _parse_shard, (path, offs, first, full))
+                         for first, offs in _shard_tasks(path, shard_cases))
+        else:
+            tasks.append((i, _parse_whole, (path, engine, full)))
+
+    parts = [[] for _ in paths]
+    pool = ProcessPoolExecutor(max_workers=workers)
+    completed = False
+    try:
+        futures = {pool.submit(fn, *args): (i, n)
+                   for n, (i, fn, args) in enumerate(tasks)}
+        pending = set(futures)
+        while pending:
+            # Poll so a cancellation is seen while long tasks are running
+            done, pending = wait(pending, timeout=PROGRESS_INTERVAL,
+                                 return_when=FIRST_COMPLETED)
+            for fut in done:
+                i, n = futures[fut]
+                parts[i].append((n, fut.result()))
+            progress(int(100 * (len(tasks) - len(pending)) / len(tasks)))
+        completed = True
+    finally:
+        pool.shutdown(wait=completed, cancel_futures=not completed)
+
+    frames = []
+    for path, shards in zip(paths, parts):
+        if not shards:
+            continue
+        # Keep shards in file order before sorting the file's rows
+        df = _build_frame(pd.concat([d for _, d in sorted(shards, key=lambda s: s[0])],
+                                    ignore_index=True))
+        if not df.empty:
+            df["source_file"] = path
+            frames.append(df)
+    if not frames:
+        return _empty_output(full)
+    return pd.concat(frames, ignore_index=True)
+
+
+def parse_cea_output(path, progress_cb=None, engine="regex", full=False, lazy=False,
+                     cancel=None):
     """
     Parse a NASA-CEA output file and return a DataFrame with one row per CASE.
     Columns:
         'O/F', 'Pc (bar)', 'P_throat (bar)', 'Pressure Ratio', 'Expansion Ratio',
         'T_chamber (K)', 'T_throat (K)', 'H_chamber (kJ/kg)', 'H_throat (kJ/kg)',
         'Delta_H (kJ/kg)', 'Isp (m/s)', 'Isp (s)'
+
+    engine selects the parsing strategy:
+        'regex'  - read the whole file and search each CASE block
+        'stream' - single pass over the file, memory bounded by one case
+        'mmap'   - memory-map the file and run precompiled byte patterns on
+                   each CASE slice without decoding or copying it
+
+    With full=True every station and performance property is extracted via
+    `parse_cea_table` (engine is ignored) and the DataFrame additionally
+    carries a 'Case' column and the columns described in `table_frame`.
+
+    gzip, xz, bzip2 and zstd files are stream-decompressed; they are always
+    read with the streaming engine so the decompressed text is never held
+    in memory as a whole.
+
+    With lazy=True a `CaseIndex` is returned instead of a DataFrame: its
+    frame lists Case, Offset, O/F, Pc and Isp for every case, and details()
+    parses a single case on demand.
+
+    progress_cb is called at most every PROGRESS_INTERVAL seconds. Passing a
+    CancelToken lets another thread abort the parse: ParseCancelled is raised
+    at the next case once the token is cancelled.
     """
+    progress = _progress(progress_cb, cancel)
+    if lazy:
+        return CaseIndex(path, progress)
+    if full:
+        return table_frame(parse_cea_table(path, progress))
+    if engine in ("regex", "mmap") and is_compressed(path):
+        engine = "stream"
+    if engine == "stream":
+        return _build_frame(list(iter_cea_cases(path, progress)))
+    if engine == "mmap":
+        return _parse_mmap(path, progress)
+    if engine != "regex":
+        raise ValueError(f"Unknown parser engine: {engine!r}")
+
     # Read entire file
     text  = open(path, 'r', encoding='utf-8', errors='ignore').read()
     lines = text.splitlines()
@@ -23,8 +771,7 @@ def parse_cea_output(path, progress_cb=None):
     total = len(case_idxs) - 1
 
     for idx, (start, end) in enumerate(zip(case_idxs, case_idxs[1:])):
-        if progress_cb:
-            progress_cb(int(100 * idx / total))
+        progress(int(100 * idx / total))
         block = "\n".join(lines[start:end])
 
         # 1) Expansion ratio (Ae/At) from PERFORMANCE PARAMETERS
@@ -42,40 +789,15 @@ def parse_cea_output(path, progress_cb=None):
         if not all([m_of, m_p, m_t, m_h, m_isp]):
             continue
 
-        # 3) Extract numeric values
-        of    = float(m_of.group(1))
-        pc    = float(m_p.group(1))
-        pt    = float(m_p.group(2))
-        tch   = float(m_t.group(1))
-        tth   = float(m_t.group(2))
-        hch   = float(m_h.group(1))
-        hth   = float(m_h.group(2))
-        isp_m = float(m_isp.group(1))
-        isp_s = isp_m / G0
-
-        # 4) Append record
-        records.append({
-            "O/F":               of,
-            "Pc (bar)":          pc,
-            "P_throat (bar)":    pt,
-            "Pressure Ratio":    pt/pc,
-            "Expansion Ratio":   ar,
-            "T_chamber (K)":     tch,
-            "T_throat (K)":      tth,
-            "H_chamber (kJ/kg)": hch,
-            "H_throat (kJ/kg)":  hth,
-            "Delta_H (kJ/kg)":   hch - hth,
-            "Isp (m/s)":         isp_m,
-            "Isp (s)":           isp_s
-        })
-
-    # 5) Build DataFrame
-    df = pd.DataFrame(records)
-    if df.empty:
-        return df
+        # 3) Extract numeric values & append record
+        records.append(_make_record(
+            float(m_of.group(1)),
+            float(m_p.group(1)), float(m_p.group(2)),
+            ar,
+            float(m_t.group(1)), float(m_t.group(2)),
+            float(m_h.group(1)), float(m_h.group(2)),
+            float(m_isp.group(1))
+        ))
 
-    # 6) Sort & reset index
-    df.sort_values(["Pc (bar)", "O/F"], inplace=True)
-    df.reset_index(drop=True, inplace=True)
-
-    return df
+    # 4) Build, sort & reset index
+    return _build_frame(records)
@@ -3,48 +3,47 @@ import pandas as pd
 from matplotlib.figure import Figure
 from config import CONFIG
 
+# name: (y column, line style, title, y label)
+GRAPHS = {
+    "Isp":           ("Isp (s)",         'o-', "Isp vs O/F",            "Isp (s)"),
+    "Temp":          ("T_chamber (K)",   's-', "T_chamber vs O/F",      "T (K)"),
+    "PressureRatio": ("Pressure Ratio",  '^-', "Pressure Ratio vs O/F", "P_throat/Pc"),
+    "Enthalpy":      ("Delta_H (kJ/kg)", 'd-', "Enthalpy Drop vs O/F",  "ΔH (kJ/kg)"),
+}
+
 def create_graphs(df):
     figs = {}
     pcs = sorted(df["Pc (bar)"].unique())
 
-    # Isp vs O/F
-    fig = Figure(figsize=(5,3))
-    ax = fig.add_subplot(111)
-    for pc in pcs:
-        sub = df[df["Pc (bar)"] == pc]
-        ax.plot(sub["O/F"], sub["Isp (s)"], 'o-', label=f'{pc} bar')
-    ax.set(title="Isp vs O/F", xlabel="O/F", ylabel="Isp (s)")
-    ax.legend(); ax.grid(True)
-    figs["Isp"] = fig
-
-    # T_chamber vs O/F
-    fig = Figure(figsize=(5,3))
-    ax = fig.add_subplot(111)
-    for pc in pcs:
-        sub = df[df["Pc (bar)"] == pc]
-        ax.plot(sub["O/F"], sub["T_chamber (K)"], 's-', label=f'{pc} bar')
-    ax.set(title="T_chamber vs O/F", xlabel="O/F", ylabel="T (K)")
-    ax.legend(); ax.grid(True)
-    figs["Temp"] = fig
-
-    # Pressure Ratio vs O/F
-    fig = Figure(figsize=(5,3))
-    ax = fig.add_subplot(111)
-    for pc in pcs:
-        sub = df[df["Pc (bar)"] == pc]
-        ax.plot(sub["O/F"], sub["Pressure Ratio"], '^-', label=f'{pc} bar')
-    ax.set(title="Pressure Ratio vs O/F", xlabel="O/F", ylabel="P_throat/Pc")
-    ax.legend(); ax.grid(True)
-    figs["PressureRatio"] = fig
-
-    # Enthalpy Drop vs O/F
-    fig = Figure(figsize=(5,3))
-    ax = fig.add_subplot(111)
-    for pc in pcs:
-        sub = df[df["Pc (bar)"] == pc]
-        ax.plot(sub["O/F"], sub["Delta_H (kJ/kg)"], 'd-', label=f'{pc} bar')
-    ax.set(title="Enthalpy Drop vs O/F", xlabel="O/F", ylabel="ΔH (kJ/kg)")
-    ax.legend(); ax.grid(True)
-    figs["Enthalpy"] = fig
+    for name, (col, style, title, ylabel) in GRAPHS.items():
+        fig = Figure(figsize=(5,3))
+        ax = fig.add_subplot(111)
+        for pc in pcs:
+            sub = df[df["Pc (bar)"] == pc]
+            ax.plot(sub["O/F"], sub[col], style, label=f'{pc} bar')
+        ax.set(title=title, xlabel="O/F", ylabel=ylabel)
+        ax.legend(); ax.grid(True)
+        figs[name] = fig
 
     return figs
+
+def append_to_graphs(figs, df):
+    """
+    Add the rows of df to figures built by create_graphs in place, extending
+    the existing per-Pc lines instead of rebuilding the figures.
+    """
+    for name, (col, style, _, _) in GRAPHS.items():
+        ax = figs[name].axes[0]
+        lines = {line.get_label(): line for line in ax.get_lines()}
+        for pc in sorted(df["Pc (bar)"].unique()):
+            sub = df[df["Pc (bar)"] == pc]
+            line = lines.get(f'{pc} bar')
+            if line is None:
+                ax.plot(sub["O/F"], sub[col], style, label=f'{pc} bar')
+                ax.legend()
+                continue
+            x = np.concatenate([line.get_xdata(), sub["O/F"].to_numpy()])
+            y = np.concatenate([line.get_ydata(), sub[col].to_numpy()])
+            order = np.argsort(x, kind="stable")
+            line.set_data(x[order], y[order])
+        ax.relim(); ax.autoscale_view()
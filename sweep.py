@@ -0,0 +1,157 @@
+"""
+Nozzle design-space sweep: every nozzle type of `nozzle.NOZZLE_TYPES`
+across grids of area ratio, shape parameters and contour resolution,
+evaluated with `calculate_performance_batch` and `heat_transfer_batch` over
+a process pool and returned as one ranked DataFrame.
+"""
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import product
+
+import numpy as np
+import pandas as pd
+
+from nozzle import NOZZLE_TYPES, design_inputs, calculate_performance_batch
+from heattransfer import heat_transfer_batch
+from parser import PROGRESS_INTERVAL
+
+# Shape parameters swept for each nozzle type
+SHAPE_GRIDS = {
+    "Conical":                         {"half_angle": (12, 15, 18)},
+    "Rao Optimum":                     {"theta_n": (25, 30, 35), "theta_e": (5, 7, 10)},
+    "80% Bell":                        {"percent_bell": (60, 70, 80, 90, 100)},
+    "Method of Characteristics (MOC)": {},
+    "Truncated Ideal Contour (TIC)":   {"truncation_factor": (0.6, 0.7, 0.8, 0.9)},
+}
+SHAPE_PARAMS = ("half_angle", "theta_n", "theta_e", "percent_bell", "truncation_factor")
+CHUNK_SIZE = 500       # designs per pool task
+CF_DECIMALS = 4        # thrust coefficients equal to this many decimals tie on length
+
+class SweepCancelled(Exception):
+    """Raised by sweep_nozzle_designs when its cancel token is cancelled."""
+
+
+def design_grid(area_ratios, N_values=(100,), nozzle_types=None, shape_grids=None):
+    """
+    Every combination of nozzle type, area ratio, N and the type's shape
+    parameters, as a list of (nozzle type, area ratio, N, shape) tuples
+    where shape is a tuple of (name, value) pairs. shape_grids overrides
+    SHAPE_GRIDS per nozzle type.
+    """
+    grids = dict(SHAPE_GRIDS, **(shape_grids or {}))
+    designs = []
+    for name in nozzle_types or NOZZLE_TYPES:
+        if name not in NOZZLE_TYPES:
+            raise ValueError(f"Unknown nozzle type: {name!r}")
+        defaults = NOZZLE_TYPES[name][1]
+        keys = sorted(grids.get(name, {}))
+        for ar, n, values in product(area_ratios, N_values,
+                                     product(*(grids[name][k] for k in keys))):
+            shape = dict(defaults, **dict(zip(keys, values)))
+            designs.append((name, float(ar), int(n), tuple(sorted(shape.items()))))
+    return designs
+
+
+def _evaluate_designs(base, R_throat, designs, use_table):
+    """Pool task: contours of the designs, then their performance in one batch."""
+    xs, rs = [], []
+    for name, ar, n, shape in designs:
+        generator = NOZZLE_TYPES[name][0]
+        cea = dict(base, **{'Ae/At': ar})
+        x, r = generator(cea, R_throat=R_throat, N=n, use_table=use_table, **dict(shape))
+        xs.append(x)
+        rs.append(r)
+    names, ars, ns, shapes = zip(*designs)
+    offsets = np.concatenate(([0], np.cumsum([len(x) for x in xs])))
+    perf = calculate_performance_batch(np.concatenate(xs), np.concatenate(rs),
+                                       base['gamma'], base.get('Pc (bar)', 50) * 1e5,
+                                       offsets=offsets, design_area_ratio=ars,
+                                       nozzle_type=names, use_table=use_table)
+    heat = heat_transfer_batch(base, np.concatenate(xs), np.concatenate(rs),
+                               offsets=offsets, use_table=use_table)
+    rows = []
+    for i, shape in enumerate(shapes):
+        row = {
+            "Nozzle type": names[i],
+            "Area ratio": ars[i],
+            "N": ns[i],
+            "Cf": perf['thrust_coefficient'][i],
+            "Length (m)": xs[i][-1] - xs[i][0],
+            "Surface area (m²)": perf['surface_area'][i],
+            "Exit angle (deg)": perf['divergence_angle_deg'][i],
+            "Efficiency": perf['nozzle_efficiency'][i],
+            "Exit Mach": perf['exit_mach_number'][i],
+            "Heat load (kW)": heat['heat_load'][i] / 1e3,
+        }
+        row.update(shape)
+        rows.append(row)
+    return rows
+
+
+def rank_designs(df):
+    """
+    Sort designs best first: highest thrust coefficient, then shortest,
+    then smallest surface area, and number them in a leading 'Rank' column.
+    """
+    order = np.lexsort((df["Surface area (m²)"].to_numpy(),
+                        df["Length (m)"].to_numpy(),
+                        -df["Cf"].round(CF_DECIMALS).to_numpy()))
+    df = df.iloc[order].reset_index(drop=True)
+    df.insert(0, "Rank", np.arange(1, len(df) + 1))
+    return df
+
+
+def sweep_nozzle_designs(cea_data, area_ratios, N_values=(100,), nozzle_types=None,
+                         shape_grids=None, R_throat=None, workers=None,
+                         chunk_size=CHUNK_SIZE, use_table=True, progress_cb=None,
+                         cancel=None):
+    """
+    Evaluate every design of `design_grid` for the propellant of cea_data
+    across a process pool, one performance batch per chunk, and return them ranked by `rank_designs`.
+
+    Columns: 'Rank', 'Nozzle type', 'Area ratio', 'N', 'Cf', 'Length (m)',
+    'Surface area (m²)', 'Exit angle (deg)', 'Efficiency', 'Exit Mach',
+    'Heat load (kW)' (Bartz, see `heattransfer`) and the shape parameters
+    of SHAPE_PARAMS (NaN where a type has none).
+    progress_cb receives the percentage of designs done. Cancelling the
+    token drops the queued chunks and raises SweepCancelled.
+    """
+    if hasattr(cea_data, 'to_dict'):  # If it's a pandas Series
+        cea_data = cea_data.to_dict()
+    gamma, _ = design_inputs(cea_data)
+    base = {'gamma': float(gamma)}
+    for key in ('Pc (bar)', 'T_chamber (K)', 'Gamma_chamber', 'MW_chamber (g/mol)',
+                'MW_throat (g/mol)', 'Cp_chamber (kJ/(kg·K))', 'Cstar_throat (m/s)'):
+        if key in cea_data:
+            base[key] = float(cea_data[key])
+    if R_throat is None:
+        R_throat = np.sqrt(cea_data['At'] / np.pi) if 'At' in cea_data else 0.05
+
+    designs = design_grid(area_ratios, N_values, nozzle_types, shape_grids)
+    chunks = [designs[i:i + chunk_size] for i in range(0, len(designs), chunk_size)]
+    parts = [None] * len(chunks)
+    pool = ProcessPoolExecutor(max_workers=workers)
+    completed = False
+    try:
+        futures = {pool.submit(_evaluate_designs, base, R_throat, chunk, use_table): i
+                   for i, chunk in enumerate(chunks)}
+        pending, done_designs = set(futures), 0
+        while pending:
+            # Poll so a cancellation is seen while chunks are running
+            done, pending = wait(pending, timeout=PROGRESS_INTERVAL,
+                                 return_when=FIRST_COMPLETED)
+            if cancel is not None and cancel.cancelled:
+                raise SweepCancelled()
+            for fut in done:
+                parts[futures[fut]] = fut.result()
+                done_designs += len(chunks[futures[fut]])
+            if progress_cb is not None and done:
+                progress_cb(int(100 * done_designs / len(designs)))
+        completed = True
+    finally:
+        pool.shutdown(wait=completed, cancel_futures=not completed)
+
+    df = pd.DataFrame([row for part in parts for row in part])
+    if df.empty:
+        return df
+    df = df.reindex(columns=[c for c in df.columns if c not in SHAPE_PARAMS] + list(SHAPE_PARAMS))
+    return rank_designs(df)
@@ -1,22 +1,226 @@
 import logging
-from PyQt5.QtCore import QThread, pyqtSignal
+import os
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
 import pandas as pd
-from parser import parse_cea_output
+from parser import parse_cea_output, parse_cea_outputs, parse_cea_table, table_frame, \
+    parse_cea_tail, CancelToken, ParseCancelled
+from cache import store_cached
+from sweep import sweep_nozzle_designs, SweepCancelled
 
 class ParserThread(QThread):
     """Background thread"""
     progress = pyqtSignal(int)
     finished = pyqtSignal(pd.DataFrame)
+    species = pyqtSignal(object)
     error = pyqtSignal(str)
+    cancelled = pyqtSignal()
 
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, engine: str = "stream", full: bool = False,
+                 species: bool = False):
         super().__init__()
         self.filepath = filepath
+        self.engine = engine
+        self.full = full
+        self.with_species = species
+        self.cancel_token = CancelToken()
+
+    def cancel(self):
+        """Ask the parser to stop at the next case; cancelled is emitted."""
+        self.cancel_token.cancel()
 
     def run(self):
         try:
-            df = parse_cea_output(self.filepath, self.progress.emit)
+            if self.with_species:
+                # Full table and species fractions in a single pass
+                table = parse_cea_table(self.filepath, self.progress.emit, species=True,
+                                        cancel=self.cancel_token)
+                df = table_frame(table)
+                self.species.emit(table)
+            else:
+                df = parse_cea_output(self.filepath, self.progress.emit,
+                                      engine=self.engine, full=self.full,
+                                      cancel=self.cancel_token)
             self.finished.emit(df)
+            store_cached(self.filepath, df, full=self.full or self.with_species)
+        except ParseCancelled:
+            self.cancelled.emit()
         except Exception as e:
             logging.exception("Error parsing CEA output")
             self.error.emit(str(e))
+
+
+class MultiParserThread(QThread):
+    """Background thread parsing several files across a process pool"""
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(pd.DataFrame)
+    error = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, filepaths, workers=None, full=False):
+        super().__init__()
+        self.filepaths = list(filepaths)
+        self.workers = workers
+        self.full = full
+        self.cancel_token = CancelToken()
+
+    def cancel(self):
+        self.cancel_token.cancel()
+
+    def run(self):
+        try:
+            df = parse_cea_outputs(self.filepaths, workers=self.workers,
+                                   progress_cb=self.progress.emit, full=self.full,
+                                   cancel=self.cancel_token)
+            self.finished.emit(df)
+        except ParseCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            logging.exception("Error parsing CEA outputs")
+            self.error.emit(str(e))
+
+
+class SweepThread(QThread):
+    """Background thread running a nozzle design sweep across a process pool"""
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(pd.DataFrame)
+    error = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, cea_data, area_ratios, N_values=(100,), workers=None):
+        super().__init__()
+        self.cea_data = cea_data
+        self.area_ratios = list(area_ratios)
+        self.N_values = list(N_values)
+        self.workers = workers
+        self.cancel_token = CancelToken()
+
+    def cancel(self):
+        self.cancel_token.cancel()
+
+    def run(self):
+        try:
+            df = sweep_nozzle_designs(self.cea_data, self.area_ratios, self.N_values,
+                                      workers=self.workers, progress_cb=self.progress.emit,
+                                      cancel=self.cancel_token)
+            self.finished.emit(df)
+        except SweepCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            logging.exception("Error running nozzle design sweep")
+            self.error.emit(str(e))
+
+
+class WatchThread(QThread):
+    """Background thread following a CEA output that is still being written"""
+    rows = pyqtSignal(pd.DataFrame)
+    restarted = pyqtSignal()
+    error = pyqtSignal(str)
+
+    def __init__(self, filepath: str, interval: float = 1.0):
+        super().__init__()
+        self.filepath = filepath
+        self.interval = interval
+        self.offset = 0       # byte offset past the last complete case
+        self.next_case = 0    # ordinal of the next case to be parsed
+        self._stop = False
+
+    def stop(self):
+        self._stop = True
+        self.wait()
+
+    def run(self):
+        try:
+            while not self._stop:
+                size = os.path.getsize(self.filepath)
+                if size < self.offset:
+                    # File was truncated or rewritten: start over
+                    self.offset = self.next_case = 0
+                    self.restarted.emit()
+                if size > self.offset:
+                    df, self.offset, self.next_case = parse_cea_tail(
+                        self.filepath, self.offset, self.next_case)
+                    if not df.empty:
+                        self.rows.emit(df)
+                # Sleep in short steps so stop() returns promptly
+                for _ in range(max(1, int(self.interval * 10))):
+                    if self._stop:
+                        break
+                    self.msleep(100)
+        except Exception as e:
+            logging.exception("Error watching CEA output")
+            self.error.emit(str(e))
+
+
+class TaskPipeline(QObject):
+    """
+    Runs the per-tab computations of the main window on a thread pool and
+    hands each result to its draw callback on the GUI thread. Intermediates
+    shared between tabs are computed once per dataset version. A result is
+    dropped when the dataset version has moved on or the same task has been
+    submitted again since.
+    """
+    error = pyqtSignal(str, str)
+    idle = pyqtSignal()    # the last pending result has been delivered
+    _done = pyqtSignal(str, int, object, object, object)
+
+    def __init__(self, workers=4, parent=None):
+        super().__init__(parent)
+        self.version = 0
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pipeline")
+        self._shared = {}    # name -> Future of the current version
+        self._tickets = {}   # task name -> ticket of its latest submission
+        self._ticket = 0
+        # Emitted from the pool, so delivered queued on the GUI thread
+        self._done.connect(self._deliver)
+
+    def new_version(self):
+        """Start a new dataset version, dropping everything in flight."""
+        self.version += 1
+        self._shared = {}
+        self._tickets = {}
+        return self.version
+
+    def pending(self):
+        """True while a submitted task has not been delivered yet."""
+        return bool(self._tickets)
+
+    def shared(self, name, fn, *args):
+        """Future of fn(*args), computed once per version under name."""
+        fut = self._shared.get(name)
+        if fut is None:
+            fut = self._shared[name] = self._pool.submit(fn, *args)
+        return fut
+
+    def submit(self, name, compute, draw, *args):
+        """Run compute(*args) on the pool, then draw(result) on the GUI thread."""
+        self._ticket += 1
+        ticket = self._ticket
+        self._tickets[name] = ticket
+
+        def run():
+            if self._tickets.get(name) != ticket:
+                return  # superseded while queued
+            try:
+                result, err = compute(*args), None
+            except Exception as e:
+                logging.exception("Error computing %s", name)
+                result, err = None, str(e)
+            self._done.emit(name, ticket, draw, result, err)
+
+        self._pool.submit(run)
+
+    def _deliver(self, name, ticket, draw, result, err):
+        if self._tickets.get(name) != ticket:
+            return
+        del self._tickets[name]
+        if err is not None:
+            self.error.emit(name, err)
+        else:
+            draw(result)
+        if not self._tickets:
+            self.idle.emit()
+
+    def shutdown(self):
+        self.new_version()
+        self._pool.shutdown(wait=False, cancel_futures=True)
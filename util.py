@@ -1,21 +1,78 @@
+import numpy as np
+from isentropic import mach_from_pressure_ratio
+
+
+# U.S. Standard Atmosphere 1976 layers up to 86 km geometric altitude:
+# (base geopotential altitude [m], lapse rate [K/m])
+_US76_LAYERS = (
+    (0.0,      -0.0065),
+    (11000.0,   0.0),
+    (20000.0,   0.0010),
+    (32000.0,   0.0028),
+    (47000.0,   0.0),
+    (51000.0,  -0.0028),
+    (71000.0,  -0.0020),
+)
+_R_EARTH  = 6356766.0   # effective Earth radius [m]
+_US76_TOP = _R_EARTH * 86000.0 / (_R_EARTH + 86000.0)  # 86 km geometric, geopotential [m]
+_R_AIR    = 287.0531    # specific gas constant of air, R*/M0 [J/(kg·K)]
+_G0       = 9.80665     # m/s²
+
+
+def _us76(alt_m):
+    """Exact US-1976 pressure (Pa) and temperature (K) at geometric altitudes."""
+    h = _R_EARTH * alt_m / (_R_EARTH + alt_m)  # geopotential altitude
+    p = np.empty_like(h); T = np.empty_like(h)
+    Pb, Tb = 101325.0, 288.15
+    tops = [base for base, _ in _US76_LAYERS[1:]] + [_US76_TOP]
+    for (hb, L), ht in zip(_US76_LAYERS, tops):
+        m = (h >= hb) & (h <= ht)
+        dh = h[m] - hb
+        T[m] = Tb + L * dh
+        if L == 0.0:
+            p[m] = Pb * np.exp(-_G0 * dh / (_R_AIR * Tb))
+        else:
+            p[m] = Pb * (T[m] / Tb) ** (-_G0 / (_R_AIR * L))
+        # Carry the layer top to the next base
+        dh = ht - hb
+        Pb = (Pb * np.exp(-_G0 * dh / (_R_AIR * Tb)) if L == 0.0
+              else Pb * ((Tb + L * dh) / Tb) ** (-_G0 / (_R_AIR * L)))
+        Tb = Tb + L * dh
+    return p, T
+
+
+# Precomputed table every 100 m from 0 to 86 km. Pressure is interpolated in
+# log space, which is exact within isothermal layers. Temperatures are
+# molecular-scale; they exceed kinetic ones by under 0.1 K above 80 km.
+ISA_ALT = np.linspace(0.0, 86000.0, 861)
+ISA_P, ISA_T = _us76(ISA_ALT)
+ISA_RHO = ISA_P / (_R_AIR * ISA_T)
+_ISA_LOGP = np.log(ISA_P)
+
+
+def atmosphere(alt_m):
+    """
+    Return (pressure [Pa], temperature [K], density [kg/m³]) of the US-1976
+    standard atmosphere at geometric altitude alt_m [m], a scalar or an array.
+    Altitudes outside 0-86 km are clamped to the table ends.
+    """
+    alt = np.asarray(alt_m, dtype=float)
+    p = np.exp(np.interp(alt, ISA_ALT, _ISA_LOGP))
+    T = np.interp(alt, ISA_ALT, ISA_T)
+    rho = p / (_R_AIR * T)
+    if alt.ndim == 0:
+        return float(p), float(T), float(rho)
+    return p, T, rho
+
+
 def ambient_pressure(alt_m):
-    """Return ambient pressure (Pa) from altitude (m) using ISA up to 11 km."""
-    P0, T0, L, g, R = 101325, 288.15, 0.0065, 9.80665, 287.05
-    if alt_m <= 11000:
-        return P0 * (1 - L * alt_m / T0) ** (g / (R * L))
-    # Simplified stratosphere
-    return P0 * 0.223361 * (216.65 / T0) ** (g / (R * L))
+    """
+    Return ambient pressure (Pa) from altitude (m) using the US-1976 standard
+    atmosphere up to 86 km. alt_m may be a scalar or an array of altitudes.
+    """
+    return atmosphere(alt_m)[0]
 
 
 def solve_mach(p_ratio, gamma):
-    """Numerically solve for Mach from total-to-static pressure ratio."""
-    lo, hi = 1e-6, 50.0
-    def f(M):
-        return (1 + 0.5*(gamma-1)*M*M) ** (-gamma/(gamma-1))
-    for _ in range(50):
-        mid = 0.5*(lo + hi)
-        if f(mid) > p_ratio:
-            lo = mid
-        else:
-            hi = mid
-    return 0.5*(lo + hi)
+    """Solve for Mach from static-to-total pressure ratio (scalar or array)."""
+    return mach_from_pressure_ratio(p_ratio, gamma)